@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Scaling of the analysis pipeline (definition IR to implementation IR) with stencil size."""
+
+import copy
+
+from gt4py.analysis.transformer import IRTransformer
+from gt4py.stencil_builder import StencilBuilder
+
+from .utils import make_synthetic_statements
+
+
+class AnalysisSuite:
+    params = [100, 1000, 5000]
+    param_names = ["n_statements"]
+    timeout = 600
+
+    def setup(self, n_statements):
+        builder = StencilBuilder(make_synthetic_statements(n_statements))
+        self.definition_ir = builder.definition_ir
+        self.options = builder.options
+
+    def _run_analysis(self):
+        self.options.build_info = {}
+        IRTransformer()(copy.deepcopy(self.definition_ir), self.options)
+        return self.options.build_info["phases"]
+
+    def time_analysis(self, n_statements):
+        self._run_analysis()
+
+    def track_compute_extents(self, n_statements):
+        return self._run_analysis()["analysis.ComputeExtentsPass"]["time"]
+
+    track_compute_extents.unit = "seconds"
+
+    def track_merge_blocks(self, n_statements):
+        return self._run_analysis()["analysis.MergeBlocksPass"]["time"]
+
+    track_merge_blocks.unit = "seconds"
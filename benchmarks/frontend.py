@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Frontend time of modules with many stencils sharing ``gtscript.function`` definitions."""
+
+from gt4py.definitions import BuildOptions
+from gt4py.frontend import gtscript_frontend
+
+from .utils import make_synthetic_module
+
+
+class FrontendSuite:
+    params = [[20, 100], [10, 50]]
+    param_names = ["n_functions", "n_stencils"]
+    timeout = 300
+
+    def setup(self, n_functions, n_stencils):
+        module = make_synthetic_module(n_functions, n_stencils)
+        self.stencils = [
+            (definition, BuildOptions(name=definition.__name__, module=module.__name__))
+            for definition in module.STENCILS
+        ]
+        self._generate_all()
+
+    def _generate_all(self):
+        for definition, options in self.stencils:
+            gtscript_frontend.GTScriptFrontend.generate(definition, {}, options)
+
+    def time_module_frontend(self, n_functions, n_stencils):
+        """Frontend time for all the stencils of a freshly imported module."""
+        gtscript_frontend.GTScriptParser._prepared_function_asts.clear()
+        gtscript_frontend.CallInliner._inlined_function_asts.clear()
+        self._generate_all()
+
+    def time_module_frontend_warm(self, n_functions, n_stencils):
+        """Frontend time for all the stencils when their functions have been seen before."""
+        self._generate_all()
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Construction cost of large IR nodes with symbol tables (should scale linearly)."""
+
+from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gt4py.stencil_builder import StencilBuilder
+from gtc import gtir
+from gtc.passes.gtir_dtype_resolver import resolve_dtype
+from gtc.passes.gtir_upcaster import upcast
+
+from .utils import make_synthetic_definition
+
+
+class GTIRConstructionSuite:
+    params = [25, 100, 400]
+    param_names = ["n_stages"]
+    timeout = 300
+
+    def setup(self, n_stages):
+        definition_ir = StencilBuilder(make_synthetic_definition(n_stages)).definition_ir
+        self.stencil = resolve_dtype(DefIRToGTIR.apply(definition_ir))
+        self.stencil.symtable_
+        self.children = {name: getattr(self.stencil, name) for name in self.stencil.__fields__}
+
+    def time_construction(self, n_stages):
+        gtir.Stencil(**self.children)
+
+    def time_construction_and_symtable(self, n_stages):
+        gtir.Stencil(**self.children).symtable_
+
+    def time_copy_update_and_symtable(self, n_stages):
+        self.stencil.copy(update={"params": list(self.stencil.params)}).symtable_
+
+    def time_upcast(self, n_stages):
+        upcast(self.stencil)
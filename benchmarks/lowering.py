@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Lowering time (from definition IR to generated sources) of large stencils."""
+
+from gt4py.backend.gtc_backend.common import lower_to_oir
+from gt4py.stencil_builder import StencilBuilder
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
+from gtc.numpy.numpy_codegen import NumpyCodegen
+
+from .utils import make_synthetic_definition
+
+
+class LoweringSuite:
+    params = [20, 100]
+    param_names = ["n_stages"]
+    timeout = 300
+
+    def setup(self, n_stages):
+        self.definition_ir = StencilBuilder(make_synthetic_definition(n_stages)).definition_ir
+        self.oir = lower_to_oir(self.definition_ir)
+
+    def time_defir_to_oir(self, n_stages):
+        lower_to_oir(self.definition_ir)
+
+    def time_defir_to_gtcpp_source(self, n_stages):
+        gtcpp_codegen.GTCppCodegen.apply(
+            oir_to_gtcpp.OIRToGTCpp().visit(lower_to_oir(self.definition_ir))
+        )
+
+    def time_oir_to_numpy_source(self, n_stages):
+        NumpyCodegen.apply(self.oir)
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Comparison of the legacy `numpy` backend with the OIR-based `gtc:numpy` backend."""
+
+from . import stencil_definitions
+from .utils import build_stencil, make_field_args
+
+
+class NumPyBackendsSuite:
+    params = (["numpy", "gtc:numpy"], [(32, 32, 32), (128, 128, 64)])
+    param_names = ["backend", "domain"]
+
+    def setup(self, backend, domain):
+        self.horizontal_diffusion = build_stencil(backend, stencil_definitions.horizontal_diffusion)
+        self.horizontal_diffusion_args = make_field_args(self.horizontal_diffusion, domain)
+        self.tridiagonal_solver = build_stencil(backend, stencil_definitions.tridiagonal_solver)
+        self.tridiagonal_solver_args = make_field_args(self.tridiagonal_solver, domain)
+        self.domain = domain
+
+    def time_horizontal_diffusion(self, backend, domain):
+        self.horizontal_diffusion(**self.horizontal_diffusion_args, domain=self.domain)
+
+    def time_tridiagonal_solver(self, backend, domain):
+        self.tridiagonal_solver(**self.tridiagonal_solver_args, domain=self.domain)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Call overhead and throughput of representative stencils on all CPU backends."""
+
+from . import stencil_definitions
+from .utils import CPU_BACKENDS, build_stencil, make_field_args, make_parameter_args
+
+
+class CallOverheadSuite:
+    """Calls on a single grid point, i.e. dominated by the Python overhead of the call."""
+
+    params = (CPU_BACKENDS, [True, False])
+    param_names = ["backend", "validate_args"]
+    timeout = 1200
+
+    def setup(self, backend, validate_args):
+        self.stencil = build_stencil(backend, stencil_definitions.horizontal_diffusion)
+        self.args = make_field_args(self.stencil, (1, 1, 1))
+
+    def time_call(self, backend, validate_args):
+        self.stencil(**self.args, domain=(1, 1, 1), validate_args=validate_args)
+
+
+class StencilThroughputSuite:
+    params = (CPU_BACKENDS, [(32, 32, 32), (128, 128, 64)])
+    param_names = ["backend", "domain"]
+    timeout = 1200
+
+    def setup(self, backend, domain):
+        if backend == "debug" and domain != (32, 32, 32):
+            raise NotImplementedError("The debug backend is only benchmarked on small domains")
+        self.domain = domain
+        self.stencils = {
+            "horizontal_diffusion": build_stencil(
+                backend, stencil_definitions.horizontal_diffusion
+            ),
+            "vertical_advection": build_stencil(
+                backend,
+                stencil_definitions.vertical_advection,
+                externals=stencil_definitions.VERTICAL_ADVECTION_EXTERNALS,
+            ),
+            "tridiagonal_solver": build_stencil(backend, stencil_definitions.tridiagonal_solver),
+        }
+        self.args = {
+            name: {**make_field_args(stencil, domain), **make_parameter_args(stencil)}
+            for name, stencil in self.stencils.items()
+        }
+
+    def _call(self, name, exec_info=None):
+        self.stencils[name](**self.args[name], domain=self.domain, exec_info=exec_info)
+
+    def _bandwidth(self, name, repeat=5):
+        """Effective bandwidth (GB/s) of the fastest of `repeat` runs."""
+        run_time = float("inf")
+        for _ in range(repeat):
+            exec_info = {}
+            self._call(name, exec_info)
+            run_time = min(run_time, exec_info["run_end_time"] - exec_info["run_start_time"])
+        metrics = self.stencils[name].metrics(self.domain)
+        return (metrics["bytes_read"] + metrics["bytes_written"]) / run_time / 1e9
+
+    def time_horizontal_diffusion(self, backend, domain):
+        self._call("horizontal_diffusion")
+
+    def time_vertical_advection(self, backend, domain):
+        self._call("vertical_advection")
+
+    def time_tridiagonal_solver(self, backend, domain):
+        self._call("tridiagonal_solver")
+
+    def track_horizontal_diffusion_bandwidth(self, backend, domain):
+        return self._bandwidth("horizontal_diffusion")
+
+    track_horizontal_diffusion_bandwidth.unit = "GB/s"
+
+    def track_vertical_advection_bandwidth(self, backend, domain):
+        return self._bandwidth("vertical_advection")
+
+    track_vertical_advection_bandwidth.unit = "GB/s"
+
+    def track_tridiagonal_solver_bandwidth(self, backend, domain):
+        return self._bandwidth("tridiagonal_solver")
+
+    track_tridiagonal_solver_bandwidth.unit = "GB/s"
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Time to obtain a stencil object, with and without a previously cached build."""
+
+from . import stencil_definitions
+from .utils import CPU_BACKENDS, build_stencil
+
+
+class StencilLoadSuite:
+    params = CPU_BACKENDS
+    param_names = ["backend"]
+    timeout = 1200
+    number = 1
+    repeat = (1, 5, 60.0)
+    warmup_time = 0.0
+
+    def setup(self, backend):
+        build_stencil(backend, stencil_definitions.horizontal_diffusion)
+
+    def time_cold_load(self, backend):
+        """Generate, compile and load the stencil, ignoring the cached build."""
+        build_stencil(backend, stencil_definitions.horizontal_diffusion, rebuild=True)
+
+    def time_warm_load(self, backend):
+        """Load the stencil from the cache (frontend, fingerprinting and module import)."""
+        build_stencil(backend, stencil_definitions.horizontal_diffusion)
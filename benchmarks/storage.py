@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+"""Allocation and copy costs of storages."""
+
+import numpy as np
+
+from gt4py import storage as gt_storage
+
+
+class StorageSuite:
+    params = (["numpy", "gtx86", "gtmc"], [(32, 32, 32), (128, 128, 64)])
+    param_names = ["backend", "shape"]
+
+    def setup(self, backend, shape):
+        self.array = np.random.default_rng(0).uniform(size=shape)
+        self.storage = gt_storage.from_array(
+            self.array, backend=backend, default_origin=(0, 0, 0), dtype=np.float64
+        )
+
+    def time_empty(self, backend, shape):
+        gt_storage.empty(backend, default_origin=(0, 0, 0), shape=shape, dtype=np.float64)
+
+    def time_zeros(self, backend, shape):
+        gt_storage.zeros(backend, default_origin=(0, 0, 0), shape=shape, dtype=np.float64)
+
+    def time_from_array(self, backend, shape):
+        gt_storage.from_array(
+            self.array, backend=backend, default_origin=(0, 0, 0), dtype=np.float64
+        )
+
+    def time_copy(self, backend, shape):
+        self.storage.copy()
+
+    def time_assign_array(self, backend, shape):
+        self.storage[...] = self.array
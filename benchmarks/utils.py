@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Helpers to set up stencil benchmarks."""
+
+import importlib.util
+import os
+import tempfile
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+
+
+#: Backends of the stencil call benchmarks (C++ backends require a working toolchain)
+CPU_BACKENDS = ["debug", "numpy", "gtx86", "gtmc", "gtc:gt:cpu_ifirst"]
+
+
+def build_stencil(backend: str, definition: Any, **kwargs: Any) -> Any:
+    return gtscript.stencil(backend=backend, definition=definition, **kwargs)
+
+
+def make_field_args(stencil: Any, domain: Sequence[int], *, seed: int = 0) -> Dict[str, Any]:
+    """Allocate randomly initialized storages with the halos required by `stencil`."""
+    rng = np.random.default_rng(seed)
+    field_args = {}
+    for name, info in stencil.field_info.items():
+        if info is None:
+            continue
+        origin = info.boundary.lower_indices
+        shape = tuple(d + f for d, f in zip(domain, info.boundary.frame_size))
+        field_args[name] = gt_storage.from_array(
+            rng.uniform(1.0, 2.0, size=shape).astype(info.dtype),
+            backend=stencil.backend,
+            default_origin=origin,
+            dtype=info.dtype,
+        )
+    return field_args
+
+
+def make_parameter_args(stencil: Any) -> Dict[str, Any]:
+    """Create the scalar arguments of `stencil` (all set to one)."""
+    return {
+        name: info.dtype.type(1.0)
+        for name, info in stencil.parameter_info.items()
+        if info is not None
+    }
+
+
+def make_synthetic_definition(n_stages: int) -> Any:
+    """Generate a stencil definition chaining `n_stages` stages of 2D smoothing and masking.
+
+    The source is written to a temporary module, since the GTScript frontend requires
+    the definition source code to be available through :mod:`inspect`.
+    """
+    lines = [
+        "from gt4py.gtscript import PARALLEL, Field, computation, interval",
+        "",
+        "",
+        "def synthetic(in_field: Field[float], out_field: Field[float]):",
+        "    with computation(PARALLEL), interval(...):",
+        "        tmp_0 = in_field[0, 0, 0]",
+    ]
+    for stage in range(1, n_stages + 1):
+        shift = 1 if stage % 2 else -1
+        prev = f"tmp_{stage - 1}"
+        lines += [
+            f"        tmp_{stage} = 0.5 * ({prev}[{shift}, 0, 0] + {prev}[0, {shift}, 0]) - {prev}",
+            f"        if tmp_{stage} < 0.0:",
+            f"            tmp_{stage} = -tmp_{stage}",
+        ]
+    lines.append(f"        out_field = tmp_{n_stages}")
+
+    return _import_source_module(f"synthetic_{n_stages}", lines).synthetic
+
+
+def make_synthetic_statements(n_statements: int, *, offset_period: int = 10) -> Any:
+    """Generate a stencil definition with a chain of `n_statements` assignments.
+
+    Every `offset_period`-th statement reads the previous temporary with a horizontal
+    offset, which forces a new stage and produces long, mostly mergeable, stage lists
+    similar to those of stencils with many inlined functions.
+    """
+    lines = [
+        "from gt4py.gtscript import PARALLEL, Field, computation, interval",
+        "",
+        "",
+        "def synthetic(in_field: Field[float], out_field: Field[float]):",
+        "    with computation(PARALLEL), interval(...):",
+        "        tmp_0 = in_field[0, 0, 0]",
+    ]
+    for index in range(1, n_statements + 1):
+        offset = "[1, 0, 0]" if index % offset_period == 0 else ""
+        lines.append(f"        tmp_{index} = 0.5 * tmp_{index - 1}{offset} + in_field")
+    lines.append(f"        out_field = tmp_{n_statements}")
+
+    return _import_source_module(
+        f"synthetic_statements_{n_statements}_{offset_period}", lines
+    ).synthetic
+
+
+def make_synthetic_module(n_functions: int, n_stencils: int, *, calls_per_stencil: int = 8) -> Any:
+    """Generate a module with `n_stencils` stencil definitions sharing `n_functions` functions.
+
+    Functions are chained in groups of four (every function calls the previous one in
+    its group) and every stencil calls `calls_per_stencil` different functions.
+    The stencil definitions are listed in the ``STENCILS`` module attribute.
+    """
+    lines = ["from gt4py.gtscript import PARALLEL, Field, computation, function, interval", ""]
+    for index in range(n_functions):
+        lines += ["", "@function", f"def func_{index}(a):"]
+        if index % 4:
+            lines.append(f"    tmp = func_{index - 1}(a)")
+        else:
+            lines.append("    tmp = a[0, 0, 0]")
+        lines.append("    return 0.5 * (tmp[1, 0, 0] + tmp[-1, 0, 0]) + 0.1 * a")
+    for index in range(n_stencils):
+        lines += [
+            "",
+            "",
+            f"def stencil_{index}(in_field: Field[float], out_field: Field[float]):",
+            "    with computation(PARALLEL), interval(...):",
+            "        tmp_0 = in_field",
+        ]
+        for call in range(calls_per_stencil):
+            func_index = (index * calls_per_stencil + call) % n_functions
+            lines.append(f"        tmp_{call + 1} = func_{func_index}(tmp_{call})")
+        lines.append(f"        out_field = tmp_{calls_per_stencil}")
+    lines += ["", "", f"STENCILS = [{', '.join(f'stencil_{i}' for i in range(n_stencils))}]"]
+
+    return _import_source_module(f"synthetic_module_{n_functions}_{n_stencils}", lines)
+
+
+def _import_source_module(name: str, lines: Sequence[str]) -> Any:
+    module_dir = tempfile.mkdtemp(prefix="gt4py_benchmarks_")
+    module_path = os.path.join(module_dir, f"{name}.py")
+    with open(module_path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+    spec = importlib.util.spec_from_file_location(name, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+
+    return module
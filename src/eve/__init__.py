@@ -39,8 +39,11 @@ from .concepts import (
     Node,
     VType,
     field,
+    full_validation,
     in_field,
     out_field,
+    subtree_validator,
+    trusted_construction,
 )
 from .iterators import iter_tree
 from .traits import SymbolTableTrait
@@ -27,6 +27,7 @@ import re
 import string
 import sys
 import textwrap
+import threading
 import types
 import typing
 from subprocess import PIPE, Popen
@@ -72,6 +73,12 @@ SourceFormatter = Callable[[str], str]
 #: Global dict storing registered formatters.
 SOURCE_FORMATTERS: Dict[str, SourceFormatter] = {}
 
+#: Maximum number of formatted sources kept in the :func:`format_source` cache.
+FORMATTED_SOURCES_CACHE_SIZE = 256
+
+_formatted_sources_cache: collections.OrderedDict[str, str] = collections.OrderedDict()
+_formatted_sources_lock = threading.Lock()
+
 
 class FormatterNameError(exceptions.EveRuntimeError):
     """Run-time error registering a new source code formatter."""
@@ -164,11 +171,21 @@ if _CLANG_FORMAT_AVAILABLE:
 
 
 def format_source(language: str, source: str, *, skip_errors: bool = True, **kwargs: Any) -> str:
-    """Format source code if a formatter exists for the specific language."""
+    """Format source code if a formatter exists for the specific language.
+
+    Formatted sources are cached by content hash (together with the language
+    and the formatter options), so formatting identical code again is free.
+    """
+    key = utils.shash(language, sorted(kwargs.items()), source)
+    with _formatted_sources_lock:
+        if key in _formatted_sources_cache:
+            _formatted_sources_cache.move_to_end(key)
+            return _formatted_sources_cache[key]
+
     formatter = SOURCE_FORMATTERS.get(language, None)
     try:
         if formatter:
-            return formatter(source, **kwargs)  # type: ignore # Callable does not support **kwargs
+            formatted_source = formatter(source, **kwargs)  # type: ignore # Callable does not support **kwargs
         else:
             raise FormattingError(f"Missing formatter for '{language}' language")
     except Exception as e:
@@ -179,6 +196,13 @@ def format_source(language: str, source: str, *, skip_errors: bool = True, **kwa
                 f"Something went wrong when trying to format '{language}' source code"
             ) from e
 
+    with _formatted_sources_lock:
+        _formatted_sources_cache[key] = formatted_source
+        while len(_formatted_sources_cache) > FORMATTED_SOURCES_CACHE_SIZE:
+            _formatted_sources_cache.popitem(last=False)
+
+    return formatted_source
+
 
 class Name:
     """Text formatter with different case styles for symbol names in source code."""
@@ -19,7 +19,10 @@
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import functools
+import os
 
 import pydantic
 import pydantic.generics
@@ -29,9 +32,11 @@ from .type_definitions import NOTHING, IntEnum, Str, StrEnum
 from .typingx import (
     Any,
     AnyNoArgCallable,
+    Callable,
     ClassVar,
     Dict,
     Generator,
+    Iterator,
     List,
     Optional,
     Set,
@@ -102,6 +107,64 @@ in_field = functools.partial(field, kind=FieldKind.INPUT)
 out_field = functools.partial(field, kind=FieldKind.OUTPUT)
 
 
+# -- Validation --
+_EVE_SUBTREE_VALIDATOR_KEY = "__eve_subtree_validator__"
+
+#: Full validation of trusted node constructions can be forced with this environment variable
+FULL_VALIDATION_ENV_VAR_NAME = "EVE_FULL_VALIDATION"
+
+_full_validation: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_full_validation",
+    default=os.environ.get(FULL_VALIDATION_ENV_VAR_NAME, "0").lower() in ("1", "true", "yes"),
+)
+_trusted_construction: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "_trusted_construction", default=False
+)
+
+AnyCallableT = TypeVar("AnyCallableT", bound=Callable)
+
+
+def subtree_validator(func: AnyCallableT) -> AnyCallableT:
+    """Mark a root validator function as a check of the whole node subtree.
+
+    Subtree validators are skipped in trusted node constructions (see
+    :func:`trusted_construction`). The decorator should be applied to the
+    plain function, before :func:`pydantic.root_validator`.
+    """
+    setattr(func, _EVE_SUBTREE_VALIDATOR_KEY, True)
+    return func
+
+
+@contextlib.contextmanager
+def trusted_construction() -> Iterator[None]:
+    """Construct nodes from trusted (already validated) values inside the context.
+
+    Nodes created inside the context skip the pydantic field validation
+    (type checks, coercion and field validators) and subtree validators.
+    Root validators are still executed since they are used to derive field values.
+
+    Trusted construction is ignored inside a :func:`full_validation` context or
+    if the ``EVE_FULL_VALIDATION`` environment variable is set.
+    """
+    token = _trusted_construction.set(not _full_validation.get())
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(token)
+
+
+@contextlib.contextmanager
+def full_validation(enabled: bool = True) -> Iterator[None]:
+    """Enable (or disable) full validation of nodes created in trusted constructions."""
+    full_token = _full_validation.set(enabled)
+    trusted_token = _trusted_construction.set(_trusted_construction.get() and not enabled)
+    try:
+        yield
+    finally:
+        _trusted_construction.reset(trusted_token)
+        _full_validation.reset(full_token)
+
+
 # -- Models --
 class Model(pydantic.BaseModel):
     class Config:
@@ -198,6 +261,38 @@ class BaseNode(pydantic.BaseModel, metaclass=NodeMetaclass):
             raise TypeError(f"id_ is not an 'str' instance ({type(v)})")
         return v
 
+    def __init__(__pydantic_self__, **data: Any) -> None:
+        if _trusted_construction.get():
+            __pydantic_self__._init_trusted(data)
+        else:
+            super().__init__(**data)
+
+    def _init_trusted(self, data: Dict[str, Any]) -> None:
+        cls = self.__class__
+        values = dict(data)
+        for validator in cls.__pre_root_validators__:
+            values = validator(cls, values)
+
+        for name, model_field in cls.__fields__.items():
+            if name not in values and not model_field.required:
+                values[name] = model_field.get_default()
+        if values.get("id_", None) is None:
+            values["id_"] = utils.UIDGenerator.sequential_id(prefix=cls.__qualname__)
+
+        for _, validator in cls.__post_root_validators__:
+            if not getattr(validator, _EVE_SUBTREE_VALIDATOR_KEY, False):
+                values = validator(cls, values)
+
+        object.__setattr__(self, "__dict__", values)
+        object.__setattr__(self, "__fields_set__", set(data.keys()))
+        self._init_private_attributes()
+
+    @classmethod
+    def construct_trusted(cls: Type[AnyNode], **kwargs: Any) -> AnyNode:
+        """Create a node from trusted values (see :func:`trusted_construction`)."""
+        with trusted_construction():
+            return cls(**kwargs)
+
     def iter_impl_fields(self) -> Generator[Tuple[str, Any], None, None]:
         for name, _ in self.__fields__.items():
             if name.endswith(_EVE_NODE_IMPL_SUFFIX) and not name.endswith(
@@ -23,7 +23,7 @@ import pydantic
 
 from . import concepts, visitors
 from .type_definitions import SymbolName
-from .typingx import Any, Dict, Type
+from .typingx import Any, Dict, Optional, TypeVar
 
 
 class _CollectSymbols(visitors.NodeVisitor):
@@ -48,18 +48,67 @@ class _CollectSymbols(visitors.NodeVisitor):
 
 
 class SymbolTableTrait(concepts.Model):
-    symtable_: Dict[str, Any] = pydantic.Field(default_factory=dict)
+    """Trait for nodes opening a new scope with a table of the symbols defined in it.
+
+    The symbol table (:attr:`symtable_`) is collected lazily on first access and
+    cached per field, so replacing some children, either by assignment or with
+    ``copy(update=...)``, only re-collects the symbols of the replaced fields.
+    """
+
+    _symtable_parts_: Dict[str, Dict[str, Any]] = pydantic.PrivateAttr(default_factory=dict)
+    _symtable_cache_: Optional[Dict[str, Any]] = pydantic.PrivateAttr(default=None)
 
     @staticmethod
     def _collect_symbols(root_node: concepts.TreeNode) -> Dict[str, Any]:
         return _CollectSymbols.apply(root_node)
 
-    @pydantic.root_validator(skip_on_failure=True)
-    def _collect_symbols_validator(  # type: ignore  # validators are classmethods
-        cls: Type[SymbolTableTrait], values: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        values["symtable_"] = cls._collect_symbols(values)
-        return values
+    @property
+    def symtable_(self) -> Dict[str, Any]:
+        if self._symtable_cache_ is None:
+            # Cached dicts are never modified in place since they might be shared with copies
+            parts = dict(self._symtable_parts_)
+            symtable: Dict[str, Any] = {}
+            for name in self.__fields__:
+                if name not in parts:
+                    parts[name] = self._collect_symbols([getattr(self, name)])
+                symtable.update(parts[name])
+            self._symtable_parts_ = parts
+            self._symtable_cache_ = symtable
+
+        return self._symtable_cache_
 
     def collect_symbols(self) -> None:
-        self.symtable_ = self._collect_symbols(self)
+        self._symtable_parts_ = {}
+        self._symtable_cache_ = None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            self._symtable_parts_ = {
+                key: part for key, part in self._symtable_parts_.items() if key != name
+            }
+            self._symtable_cache_ = None
+
+    def copy(  # type: ignore  # the signature is compatible but mypy does not know it
+        self: SymbolTableTraitT,
+        *,
+        include: Any = None,
+        exclude: Any = None,
+        update: Optional[Dict[str, Any]] = None,
+        deep: bool = False,
+    ) -> SymbolTableTraitT:
+        result = super().copy(include=include, exclude=exclude, update=update, deep=deep)
+        if deep or include is not None or exclude is not None:
+            result._symtable_parts_ = {}
+        else:
+            result._symtable_parts_ = {
+                key: part
+                for key, part in self._symtable_parts_.items()
+                if key not in (update or {})
+            }
+        result._symtable_cache_ = None
+
+        return result
+
+
+SymbolTableTraitT = TypeVar("SymbolTableTraitT", bound=SymbolTableTrait)
@@ -21,19 +21,23 @@ from __future__ import annotations
 
 import collections.abc
 import copy
+import inspect
 import operator
+import types
 
 from . import concepts, iterators, utils
 from .concepts import NOTHING
 from .typingx import (
     Any,
     Callable,
+    ClassVar,
     Collection,
     Dict,
     Iterable,
     MutableSequence,
     MutableSet,
     Tuple,
+    Type,
     Union,
 )
 
@@ -64,7 +68,10 @@ class NodeVisitor:
         3. ``self.generic_visit()``.
 
     This dispatching mechanism is implemented in the main :meth:`visit`
-    method and can be overriden in subclasses.
+    method and can be overriden in subclasses. The visitor function found
+    for each node class is cached at class level on first use, so visitor
+    methods should not be added to a visitor class (or to its instances)
+    after it has been used.
 
     Note that return values are not forwarded to the caller in the default
     :meth:`generic_visit` implementation. If you want to return a value from
@@ -102,23 +109,41 @@ class NodeVisitor:
 
     """
 
-    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
-        visitor = self.generic_visit
-
-        method_name = "visit_" + node.__class__.__name__
-        if hasattr(self, method_name):
-            visitor = getattr(self, method_name)
-        elif isinstance(node, concepts.Node):
-            for node_class in node.__class__.__mro__[1:]:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
+    #: Cache of resolved visitor functions indexed by node class (one per visitor class).
+    _dispatch_cache_: ClassVar[Dict[Type, Callable[..., Any]]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)  # type: ignore  # mypy issues 4335, 4660
+        cls._dispatch_cache_ = {}
+
+    @classmethod
+    def _resolve_visitor(cls, node_class: Type) -> Callable[..., Any]:
+        method_name = "generic_visit"
+        if hasattr(cls, "visit_" + node_class.__name__):
+            method_name = "visit_" + node_class.__name__
+        elif issubclass(node_class, concepts.Node):
+            for base in node_class.__mro__[1:]:
+                if hasattr(cls, "visit_" + base.__name__):
+                    method_name = "visit_" + base.__name__
                     break
 
-                if node_class is concepts.Node:
+                if base is concepts.Node:
                     break
 
-        return visitor(node, **kwargs)
+        visitor = inspect.getattr_static(cls, method_name)
+        if isinstance(visitor, types.FunctionType):
+            return visitor
+
+        # Static methods, class methods or other descriptors are resolved at call time
+        return lambda self, node, **kwargs: getattr(self, method_name)(node, **kwargs)
+
+    def visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
+        try:
+            visitor = self._dispatch_cache_[node.__class__]
+        except KeyError:
+            visitor = self._dispatch_cache_[node.__class__] = self._resolve_visitor(node.__class__)
+
+        return visitor(self, node, **kwargs)
 
     def generic_visit(self, node: concepts.TreeNode, **kwargs: Any) -> Any:
         for child in iterators.generic_iter_children(node):
@@ -53,8 +53,10 @@ from . import stencil_object
 from . import loader
 from . import storage
 from . import caching
+from . import autotune
 
 from .definitions import AccessKind, Boundary, DomainInfo, FieldInfo, ParameterInfo, CartesianSpace
+from .lazy_stencil import wait_all
 from .stencil_object import StencilObject
 
 # isort: on
@@ -20,5 +20,5 @@ from .infos import *
 
 # isort: on
 
-from . import passes, transformer
+from . import metrics, passes, transformer
 from .transformer import transform
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Memory traffic and floating point operation counts of stencil implementations.
+
+The metrics depend on the compute domain, so they are expressed as sums of terms
+``coefficient * (ni + i_offset) * (nj + j_offset) * (k_scale * nk + k_offset)``, which
+can be stored in the generated stencil modules and evaluated for every call.
+
+- ``bytes_read`` / ``bytes_written``: minimum memory traffic of the API fields, i.e. every
+  element of the accessed regions is moved once (temporaries are assumed to be kept in
+  caches or registers).
+- ``flops``: arithmetic operations (``+ - * / **``, negations and native function calls
+  count as one operation each). Both branches of conditionals are analyzed, but only the
+  most expensive one is counted.
+"""
+
+from typing import Dict, List, Mapping, Sequence, Set, Tuple
+
+from gt4py import ir as gt_ir
+
+
+#: (coefficient, i_offset, j_offset, k_scale, k_offset)
+CostTerm = Tuple[int, int, int, int, int]
+
+#: (i_offset, j_offset, k_scale, k_offset)
+_TermShape = Tuple[int, int, int, int]
+
+
+def evaluate_cost(terms: Sequence[CostTerm], domain: Sequence[int]) -> int:
+    """Evaluate a cost expression for the compute `domain` (``ni, nj, nk``)."""
+    ni, nj, nk = domain
+    result = 0
+    for coefficient, i_offset, j_offset, k_scale, k_offset in terms:
+        result += (
+            coefficient
+            * max(ni + i_offset, 0)
+            * max(nj + j_offset, 0)
+            * max(k_scale * nk + k_offset, 0)
+        )
+    return result
+
+
+def evaluate_metrics(
+    metrics: Mapping[str, Sequence[CostTerm]], domain: Sequence[int]
+) -> Dict[str, int]:
+    return {name: evaluate_cost(terms, domain) for name, terms in metrics.items()}
+
+
+def _add_term(
+    terms: Dict[_TermShape, int],
+    coefficient: int,
+    i_offset: int,
+    j_offset: int,
+    k_scale: int,
+    k_offset: int,
+) -> None:
+    if coefficient:
+        shape = (i_offset, j_offset, k_scale, k_offset)
+        terms[shape] = terms.get(shape, 0) + coefficient
+
+
+def _as_terms(terms: Dict[_TermShape, int]) -> List[CostTerm]:
+    return [(coefficient, *shape) for shape, coefficient in sorted(terms.items())]
+
+
+class _FlopsCounter(gt_ir.IRNodeVisitor):
+    ARITHMETIC_OPERATORS = {
+        gt_ir.BinaryOperator.ADD,
+        gt_ir.BinaryOperator.SUB,
+        gt_ir.BinaryOperator.MUL,
+        gt_ir.BinaryOperator.DIV,
+        gt_ir.BinaryOperator.POW,
+    }
+
+    def generic_visit(self, node: gt_ir.Node, **kwargs) -> int:
+        return 0
+
+    def visit_BlockStmt(self, node: gt_ir.BlockStmt) -> int:
+        return sum(self.visit(stmt) for stmt in node.stmts)
+
+    def visit_Assign(self, node: gt_ir.Assign) -> int:
+        return self.visit(node.value)
+
+    def visit_If(self, node: gt_ir.If) -> int:
+        else_flops = self.visit(node.else_body) if node.else_body is not None else 0
+        return self.visit(node.condition) + max(self.visit(node.main_body), else_flops)
+
+    def visit_Cast(self, node: gt_ir.Cast) -> int:
+        return self.visit(node.expr)
+
+    def visit_UnaryOpExpr(self, node: gt_ir.UnaryOpExpr) -> int:
+        return int(node.op == gt_ir.UnaryOperator.NEG) + self.visit(node.arg)
+
+    def visit_BinOpExpr(self, node: gt_ir.BinOpExpr) -> int:
+        return (
+            int(node.op in self.ARITHMETIC_OPERATORS) + self.visit(node.lhs) + self.visit(node.rhs)
+        )
+
+    def visit_TernaryOpExpr(self, node: gt_ir.TernaryOpExpr) -> int:
+        return self.visit(node.condition) + max(
+            self.visit(node.then_expr), self.visit(node.else_expr)
+        )
+
+    def visit_NativeFuncCall(self, node: gt_ir.NativeFuncCall) -> int:
+        return 1 + sum(self.visit(arg) for arg in node.args)
+
+
+class _FieldAccessCollector(gt_ir.IRNodeVisitor):
+    def __init__(self) -> None:
+        self.read: Set[str] = set()
+        self.written: Set[str] = set()
+
+    def visit_Assign(self, node: gt_ir.Assign) -> None:
+        if isinstance(node.target, gt_ir.FieldRef):
+            self.written.add(node.target.name)
+        self.visit(node.value)
+
+    def visit_FieldRef(self, node: gt_ir.FieldRef) -> None:
+        self.read.add(node.name)
+
+
+def _interval_size(interval: gt_ir.AxisInterval) -> Tuple[int, int]:
+    """Return the (k_scale, k_offset) of the size of a vertical interval."""
+    bounds = []
+    for bound, default_scale in ((interval.start, 0), (interval.end, 1)):
+        if isinstance(bound.level, gt_ir.VarRef):
+            # Variable splitters are not supported yet: assume the whole axis
+            scale = default_scale
+        else:
+            scale = 0 if bound.level == gt_ir.LevelMarker.START else 1
+        bounds.append((scale, bound.offset))
+    (start_scale, start_offset), (end_scale, end_offset) = bounds
+    return end_scale - start_scale, end_offset - start_offset
+
+
+def compute_metrics(node: gt_ir.StencilImplementation) -> Dict[str, List[CostTerm]]:
+    """Compute the memory traffic and FLOP count of a stencil as cost expressions."""
+    flops: Dict[_TermShape, int] = {}
+    accesses = _FieldAccessCollector()
+    flops_counter = _FlopsCounter()
+    for multi_stage in node.multi_stages:
+        for group in multi_stage.groups:
+            for stage in group.stages:
+                i_extent, j_extent = stage.compute_extent[0], stage.compute_extent[1]
+                for apply_block in stage.apply_blocks:
+                    accesses.visit(apply_block.body)
+                    _add_term(
+                        flops,
+                        flops_counter.visit(apply_block.body),
+                        i_extent[1] - i_extent[0],
+                        j_extent[1] - j_extent[0],
+                        *_interval_size(apply_block.interval),
+                    )
+
+    bytes_read: Dict[_TermShape, int] = {}
+    bytes_written: Dict[_TermShape, int] = {}
+    for name, decl in node.fields.items():
+        if not decl.is_api or name in node.unreferenced:
+            continue
+        itemsize = decl.data_type.dtype.itemsize
+        if name in accesses.read:
+            (i_lower, i_upper), (j_lower, j_upper), (k_lower, k_upper) = node.fields_extents[
+                name
+            ].to_boundary()
+            _add_term(
+                bytes_read, itemsize, i_lower + i_upper, j_lower + j_upper, 1, k_lower + k_upper
+            )
+        if name in accesses.written:
+            _add_term(bytes_written, itemsize, 0, 0, 1, 0)
+
+    return {
+        "bytes_read": _as_terms(bytes_read),
+        "bytes_written": _as_terms(bytes_written),
+        "flops": _as_terms(flops),
+    }
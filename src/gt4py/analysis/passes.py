@@ -501,6 +501,8 @@ class MultiStageMergingWrapper:
     def __init__(self, multi_stage: DomainBlockInfo, parent: TransformData):
         self._multi_stage = multi_stage
         self._parent = parent
+        # Summary of the stage extents, updated on merge instead of recomputed on every check
+        self._full_extent: Optional[Extent] = None
 
     @classmethod
     def wrap_items(
@@ -509,7 +511,7 @@ class MultiStageMergingWrapper:
         return [cls(block, parent) for block in items]
 
     def can_merge_with(self, candidate: "MultiStageMergingWrapper") -> bool:
-        if self.parent != candidate.parent:
+        if self.parent is not candidate.parent:
             return False
         if candidate.iteration_order != self.iteration_order:
             return False
@@ -520,6 +522,8 @@ class MultiStageMergingWrapper:
         return True
 
     def merge_with(self, candidate: "MultiStageMergingWrapper") -> None:
+        if self._full_extent is not None:
+            self._full_extent |= candidate.full_extent
         self._multi_stage.id = self._parent.id_generator.new
         self._multi_stage.ij_blocks.extend(candidate.ij_blocks)
         self._multi_stage.intervals |= candidate.intervals
@@ -546,20 +550,23 @@ class MultiStageMergingWrapper:
 
     def has_reads_with_offset(self, *, restrict_to: Optional[Set[str]]) -> bool:
         checked_axes = slice(None) if self.k_offset_extends_domain else slice(None, -1)
-        fields = restrict_to.intersection(self.inputs) if restrict_to else set(self.inputs)
+        if restrict_to:
+            fields = {name for name in restrict_to if name in self.inputs}
+        else:
+            fields = set(self.inputs)
         return any(
             self.inputs[name][checked_axes] != Extent.zeros()[checked_axes] for name in fields
         )
 
+    # The target is usually the (growing) result of previous merges, so the intersections
+    # only iterate over the symbols of this block to avoid a quadratic merging cost.
     def read_after_write_fields_in(self, target: "MultiStageMergingWrapper") -> Set[str]:
-        previous_writes = set(target.outputs)
-        current_reads = set(self.inputs)
-        return previous_writes.intersection(current_reads)
+        previous_writes = target.outputs
+        return {name for name in self.inputs if name in previous_writes}
 
     def write_after_read_fields_in(self, target: "MultiStageMergingWrapper") -> Set[str]:
-        previous_reads = set(target.inputs)
-        current_writes = set(self.outputs)
-        return previous_reads.intersection(current_writes)
+        previous_reads = target.inputs
+        return {name for name in self.outputs if name in previous_reads}
 
     def read_after_write_extents_in(self, target: "MultiStageMergingWrapper") -> Set[Extent]:
         return {self.inputs[name] for name in self.read_after_write_fields_in(target)}
@@ -577,7 +584,9 @@ class MultiStageMergingWrapper:
 
     @property
     def full_extent(self) -> Extent:
-        return self.accumulate_extents(self.extents)
+        if self._full_extent is None:
+            self._full_extent = self.accumulate_extents(self.extents)
+        return self._full_extent
 
     @property
     def has_extended_domain(self) -> bool:
@@ -634,7 +643,7 @@ class StageMergingWrapper:
         return [cls(ij_block, parent, parent_block) for ij_block in items]
 
     def can_merge_with(self, candidate: "StageMergingWrapper") -> bool:
-        if not self.parent_block == candidate.parent_block:
+        if self.parent_block is not candidate.parent_block:
             return False
 
         # Check that the two stages have the same compute extent
@@ -650,8 +659,6 @@ class StageMergingWrapper:
         if self.has_data_dependencies_with(candidate):
             return False
 
-        self.has_incompatible_intervals_with(candidate)
-
         return True
 
     def merge_with(self, candidate: IJBlockInfo):
@@ -713,7 +720,8 @@ class StageMergingWrapper:
         return False
 
     def has_data_dependencies_with(self, candidate: "StageMergingWrapper") -> bool:
-        extents = (extent for name, extent in candidate.inputs.items() if name in self.outputs)
+        outputs = self.outputs
+        extents = (extent for name, extent in candidate.inputs.items() if name in outputs)
         for extent in extents:
             read_interval = (
                 next(iter(self.intervals)).as_tuple(self.min_k_interval_sizes) + extent[-1]
@@ -853,19 +861,41 @@ class ComputeExtentsPass(TransformPass):
         for name in transform_data.symbols:
             access_extents[name] = Extent.zeros()
 
+        # Large stencils combine the same few extents over and over, so the (expensive)
+        # extent operations are memoized on their values
+        horizontal_extents: Dict[Extent, Extent] = {}
+        unions: Dict[Tuple[Extent, Extent], Extent] = {}
+        additions: Dict[Tuple[Extent, Extent], Extent] = {}
+
+        def horizontal(extent: Extent) -> Extent:
+            if extent not in horizontal_extents:
+                # exclude sequential axis
+                horizontal_extents[extent] = Extent(list(extent[:seq_axis]) + [(0, 0)])
+            return horizontal_extents[extent]
+
+        def union(a: Extent, b: Extent) -> Extent:
+            key = (a, b)
+            if key not in unions:
+                unions[key] = a | b
+            return unions[key]
+
+        def add(a: Extent, b: Extent) -> Extent:
+            key = (a, b)
+            if key not in additions:
+                additions[key] = a + b
+            return additions[key]
+
         blocks = transform_data.blocks
         for dom_block in reversed(blocks):
             for ij_block in reversed(dom_block.ij_blocks):
-                ij_block.compute_extent = Extent.zeros()
+                compute_extent = Extent.zeros()
                 for name in ij_block.outputs:
-                    ij_block.compute_extent |= access_extents[name]
+                    compute_extent = union(compute_extent, access_extents[name])
+                ij_block.compute_extent = compute_extent
                 for int_block in ij_block.interval_blocks:
                     for name, extent in int_block.inputs.items():
-                        extent = Extent(
-                            list(extent[:seq_axis]) + [(0, 0)]
-                        )  # exclude sequential axis
-                        accumulated_extent = ij_block.compute_extent + extent
-                        access_extents[name] |= accumulated_extent
+                        accumulated_extent = add(compute_extent, horizontal(extent))
+                        access_extents[name] = union(access_extents[name], accumulated_extent)
 
         transform_data.implementation_ir.fields_extents = {
             name: Extent(extent) for name, extent in access_extents.items()
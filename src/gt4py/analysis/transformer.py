@@ -20,6 +20,7 @@
 import pprint
 
 from gt4py import ir as gt_ir
+from gt4py import utils as gt_utils
 from gt4py.analysis import TransformData
 
 from .passes import (
@@ -87,32 +88,32 @@ class IRTransformer:
         )
 
         # Initialize auxiliary data
-        InitInfoPass.apply(self.transform_data)
+        self._apply_pass(InitInfoPass)
 
         # Turn compute units into atomic execution units
-        NormalizeBlocksPass.apply(self.transform_data)
+        self._apply_pass(NormalizeBlocksPass)
 
         # Compute stage extents
-        ComputeExtentsPass.apply(self.transform_data)
+        self._apply_pass(ComputeExtentsPass)
 
         # Merge compatible blocks
-        MergeBlocksPass.apply(self.transform_data)
+        self._apply_pass(MergeBlocksPass)
 
         # Compute used symbols
-        ComputeUsedSymbolsPass.apply(self.transform_data)
+        self._apply_pass(ComputeUsedSymbolsPass)
 
         # Build IIR
-        BuildIIRPass.apply(self.transform_data)
+        self._apply_pass(BuildIIRPass)
 
         # Fill in missing dtypes
-        DataTypePass.apply(self.transform_data)
+        self._apply_pass(DataTypePass)
 
         # turn temporary fields that are only written and read within the same function
         # into local scalars
-        DemoteLocalTemporariesToVariablesPass.apply(self.transform_data)
+        self._apply_pass(DemoteLocalTemporariesToVariablesPass)
 
         # prune some stages that don't have effect
-        HousekeepingPass.apply(self.transform_data)
+        self._apply_pass(HousekeepingPass)
 
         if options.build_info is not None:
             options.build_info["def_ir"] = self.transform_data.definition_ir
@@ -121,5 +122,12 @@ class IRTransformer:
 
         return self.transform_data.implementation_ir
 
+    def _apply_pass(self, pass_class):
+        """Apply a transformation pass, recording its wall time as a build phase."""
+        with gt_utils.timing.build_phase(
+            f"analysis.{pass_class.__name__}", self.transform_data.options.build_info
+        ):
+            pass_class.apply(self.transform_data)
+
 
 transform = IRTransformer.apply
@@ -0,0 +1,354 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Selection of the fastest backend (and backend options) per stencil and domain size.
+
+:func:`autotune` builds a stencil definition with a set of candidate backends and options,
+times every variant on representative arguments, and stores the ranking of the variants in
+the stencil cache, keyed by stencil, size class of the compute domain (see
+:func:`domain_class`) and host. Stencils created with ``gtscript.stencil(backend="auto")``
+(see :class:`AutoStencil`) dispatch every call to the fastest recorded variant which is
+compatible with the passed storages.
+
+Example
+-------
+.. code-block: python
+
+    stencil = gtscript.stencil(backend="auto", definition=definition)
+    stencil.autotune(in_field, out_field, domain=(128, 128, 80))
+    stencil(in_field, out_field)  # calls the fastest variant
+"""
+
+import inspect
+import json
+import pathlib
+import platform
+import types
+import warnings
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from gt4py import backend as gt_backend
+from gt4py import caching as gt_caching
+from gt4py import config as gt_config
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.definitions import normalize_domain, normalize_origin_mapping
+from gt4py.stencil_builder import StencilBuilder
+from gt4py.stencil_object import StencilObject
+from gt4py.utils import filelock as gt_filelock
+from gt4py.utils import perf as gt_perf
+
+
+AUTO_BACKEND_NAME = "auto"
+
+#: Candidates tried by :func:`autotune` if none are given
+DEFAULT_CANDIDATES = ["numpy", "gtx86", "gtmc", "gtc:gt:cpu_ifirst"]
+
+#: Backend name, or backend name and backend options
+Candidate = Union[str, Tuple[str, Dict[str, Any]]]
+
+RECORDS_FILE_NAME = "autotune.json"
+
+
+def _normalize_candidate(candidate: Candidate) -> Tuple[str, Dict[str, Any]]:
+    if isinstance(candidate, str):
+        return candidate, {}
+    backend_name, options = candidate
+    return backend_name, dict(options)
+
+
+def domain_class(domain: Sequence[int]) -> Tuple[int, ...]:
+    """Size class of a compute domain: the rounded up base 2 logarithm of each axis length."""
+    return tuple(max(length - 1, 0).bit_length() for length in domain)
+
+
+def host_id() -> str:
+    return f"{platform.node()}-{platform.machine()}"
+
+
+def stencil_key(
+    definition: types.FunctionType,
+    *,
+    name: str,
+    externals: Optional[Dict[str, Any]] = None,
+    dtypes: Optional[Dict[Any, Any]] = None,
+) -> str:
+    """Identify a stencil independently of the backend and build options."""
+    _, original_annotations = gtscript._set_arg_dtypes(definition, dtypes or {})
+    try:
+        builder = StencilBuilder(definition).with_externals(externals or {})
+        # the fingerprint does not depend on the caching strategy used to build the variants
+        fingerprint = gt_caching.JITCachingStrategy(builder).definition_fingerprint
+    finally:
+        setattr(definition, "__annotations__", original_annotations)
+    return f"{name}:{fingerprint}"
+
+
+def _records_path() -> pathlib.Path:
+    settings = gt_config.cache_settings
+    return pathlib.Path(settings["root_path"]) / settings["dir_name"] / RECORDS_FILE_NAME
+
+
+def _read_records(path: pathlib.Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def lookup(key: str, domain: Sequence[int]) -> Optional[List[Dict[str, Any]]]:
+    """Return the recorded ranking of the variants of a stencil for this host and domain."""
+    records = _read_records(_records_path())
+    domain_key = ",".join(str(item) for item in domain_class(domain))
+    return records.get(host_id(), {}).get(key, {}).get(domain_key, None)
+
+
+def record(key: str, domain: Sequence[int], ranking: List[Dict[str, Any]]) -> None:
+    """Store the ranking of the variants of a stencil for this host and domain."""
+    path = _records_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    domain_key = ",".join(str(item) for item in domain_class(domain))
+    with gt_filelock.FileLock(
+        path.with_suffix(".lock"), timeout=gt_config.cache_settings["lock_timeout"]
+    ):
+        records = _read_records(path)
+        records.setdefault(host_id(), {}).setdefault(key, {})[domain_key] = ranking
+        gt_filelock.write_atomic(path, json.dumps(records, indent=2, sort_keys=True))
+
+
+def _convert_args(
+    stencil: StencilObject, args: Mapping[str, Any], backend_name: str
+) -> Dict[str, Any]:
+    """Copy the field arguments to storages of another backend."""
+    result = dict(args)
+    for name, info in stencil.field_info.items():
+        if info is not None and name in args:
+            field = args[name]
+            result[name] = gt_storage.from_array(
+                np.asarray(field),
+                backend=backend_name,
+                default_origin=getattr(field, "default_origin", (0,) * np.ndim(field)),
+                dtype=field.dtype,
+            )
+    return result
+
+
+def _infer_domain(
+    stencil: StencilObject, args: Mapping[str, Any], origin: Optional[Dict[str, Any]]
+) -> Tuple[int, ...]:
+    field_args = {name: args[name] for name, info in stencil.field_info.items() if info is not None}
+    origin = normalize_origin_mapping(origin) if origin is not None else {}
+    for name, field in field_args.items():
+        origin.setdefault(name, origin["_all_"] if "_all_" in origin else field.default_origin)
+    return tuple(stencil._get_max_domain(field_args, origin))
+
+
+class AutoStencil:
+    """
+    Stencil dispatching each call to the fastest variant recorded by :func:`autotune`.
+
+    Usually obtained with ``gtscript.stencil(backend="auto")``, not directly instantiated.
+    Variants are built on first use. If no ranking has been recorded for the stencil, the host
+    and the size class of the compute domain, or none of the recorded variants can use the
+    passed storages, the backend of the storages (or `fallback_backend` for other arrays)
+    is used.
+
+    Parameters
+    ----------
+    definition :
+        Stencil definition function.
+
+    fallback_backend :
+        Backend used for arguments which are not storages and no variant was recorded.
+
+    **stencil_kwargs :
+        Arguments for :func:`gt4py.gtscript.stencil` shared by all variants (the backend
+        options of the variants take precedence). The qualified ``name`` of the stencil
+        defaults to the one of `definition`.
+    """
+
+    def __init__(
+        self,
+        definition: types.FunctionType,
+        *,
+        fallback_backend: str = "numpy",
+        **stencil_kwargs: Any,
+    ):
+        self.definition = definition
+        self.fallback_backend = fallback_backend
+        self.stencil_kwargs = stencil_kwargs
+        self.stencil_kwargs.setdefault("name", f"{definition.__module__}.{definition.__name__}")
+        self._signature = inspect.signature(definition)
+        self._key: Optional[str] = None
+        self._variants: Dict[str, StencilObject] = {}
+        self._rankings: Dict[Tuple[int, ...], Optional[List[Dict[str, Any]]]] = {}
+
+    @property
+    def key(self) -> str:
+        if self._key is None:
+            self._key = stencil_key(
+                self.definition,
+                name=self.stencil_kwargs["name"],
+                externals=self.stencil_kwargs.get("externals", None),
+                dtypes=self.stencil_kwargs.get("dtypes", None),
+            )
+        return self._key
+
+    def variant(self, backend_name: str, options: Optional[Dict[str, Any]] = None) -> StencilObject:
+        """Build (or return the already built) variant for a backend and backend options."""
+        options = options or {}
+        variant_key = json.dumps([backend_name, options], sort_keys=True)
+        if variant_key not in self._variants:
+            self._variants[variant_key] = gtscript.stencil(
+                backend_name, self.definition, **{**self.stencil_kwargs, **options}
+            )
+        return self._variants[variant_key]
+
+    def _bind(self, args: Sequence[Any], kwargs: Mapping[str, Any]) -> Dict[str, Any]:
+        return dict(self._signature.bind(*args, **kwargs).arguments)
+
+    def select(
+        self,
+        arguments: Mapping[str, Any],
+        domain: Optional[Sequence[int]] = None,
+        origin: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[StencilObject, Tuple[int, ...]]:
+        """Choose the variant for a call with the given arguments.
+
+        Returns
+        -------
+            The variant and the compute domain of the call.
+        """
+        fields = [value for value in arguments.values() if isinstance(value, gt_storage.Storage)]
+        fallback_backend = fields[0].backend if fields else self.fallback_backend
+        if domain is None:
+            domain = _infer_domain(self.variant(fallback_backend), arguments, origin)
+        domain = tuple(normalize_domain(domain))
+
+        domain_key = domain_class(domain)
+        if domain_key not in self._rankings:
+            self._rankings[domain_key] = lookup(self.key, domain)
+        for item in self._rankings[domain_key] or []:
+            storage_info = gt_backend.from_name(item["backend"]).storage_info
+            if all(
+                storage_info["is_compatible_layout"](field)
+                and storage_info["is_compatible_type"](field)
+                for field in fields
+            ):
+                return self.variant(item["backend"], item["options"]), domain
+        return self.variant(fallback_backend), domain
+
+    def __call__(
+        self,
+        *args: Any,
+        domain: Optional[Sequence[int]] = None,
+        origin: Optional[Dict[str, Any]] = None,
+        validate_args: bool = True,
+        exec_info: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> None:
+        arguments = self._bind(args, kwargs)
+        stencil, domain = self.select(arguments, domain, origin)
+        stencil(
+            **arguments,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+    def autotune(
+        self,
+        *args: Any,
+        domain: Optional[Sequence[int]] = None,
+        candidates: Optional[Sequence[Candidate]] = None,
+        repeat: int = 10,
+        warmup: int = 2,
+        **kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """Time the candidate variants on representative arguments and record the ranking.
+
+        Parameters
+        ----------
+        *args, **kwargs :
+            Representative arguments of the stencil (copied for every candidate backend).
+
+        domain :
+            Compute domain (by default, the largest domain compatible with the fields).
+
+        candidates :
+            Backend names, or backend names and backend options, to try
+            (by default :data:`DEFAULT_CANDIDATES`).
+
+        repeat, warmup :
+            Timed and untimed calls of each variant.
+
+        Returns
+        -------
+            The recorded ranking: backend name, options and median call time of every variant
+            which could be built, fastest first.
+        """
+        arguments = self._bind(args, kwargs)
+        ranking: List[Dict[str, Any]] = []
+        for candidate in candidates if candidates is not None else DEFAULT_CANDIDATES:
+            backend_name, options = _normalize_candidate(candidate)
+            try:
+                stencil = self.variant(backend_name, options)
+            except Exception as error:
+                warnings.warn(f"Skipping autotuning candidate '{backend_name}': {error}")
+                continue
+            if domain is None:
+                domain = _infer_domain(stencil, arguments, None)
+            times = gt_perf.time_stencil(
+                stencil,
+                _convert_args(stencil, arguments, backend_name),
+                domain=domain,
+                repeat=repeat,
+                warmup=warmup,
+            )
+            ranking.append(
+                {"backend": backend_name, "options": options, "time": times["median_time"]}
+            )
+        if not ranking:
+            raise RuntimeError(f"No autotuning candidate could be built for '{self.key}'")
+
+        ranking.sort(key=lambda item: item["time"])
+        assert domain is not None
+        record(self.key, domain, ranking)
+        self._rankings.clear()
+        return ranking
+
+
+def autotune(
+    definition: types.FunctionType,
+    *args: Any,
+    domain: Optional[Sequence[int]] = None,
+    candidates: Optional[Sequence[Candidate]] = None,
+    repeat: int = 10,
+    warmup: int = 2,
+    stencil_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs: Any,
+) -> List[Dict[str, Any]]:
+    """Autotune a stencil definition (see :meth:`AutoStencil.autotune`).
+
+    `stencil_kwargs` are passed to :func:`gt4py.gtscript.stencil` for every variant and
+    must match those of the ``backend="auto"`` stencils using the results.
+    """
+    return AutoStencil(definition, **(stencil_kwargs or {})).autotune(
+        *args, domain=domain, candidates=candidates, repeat=repeat, warmup=warmup, **kwargs
+    )
@@ -27,6 +27,7 @@ import jinja2
 from gt4py import definitions as gt_definitions
 from gt4py import ir as gt_ir
 from gt4py import utils as gt_utils
+from gt4py.analysis import metrics as gt_metrics
 
 from . import pyext_builder
 
@@ -241,10 +242,15 @@ class BaseBackend(Backend):
             validate_hash = not self.builder.options._impl_opts.get(
                 "disable-cache-validation", False
             )
-            if self.builder.caching.is_cache_info_available_and_consistent(
-                validate_hash=validate_hash
-            ):
-                stencil_class = self._load()
+            # Prevent the removal of the cache entry while loading it
+            with self.builder.caching.load_lock():
+                with self.builder.build_phase("cache_check"):
+                    is_cache_valid = self.builder.caching.is_cache_info_available_and_consistent(
+                        validate_hash=validate_hash
+                    )
+                if is_cache_valid:
+                    stencil_class = self._load()
+                    self.builder.caching.record_access()
 
         return stencil_class
 
@@ -255,7 +261,8 @@ class BaseBackend(Backend):
     def _load(self) -> Type["StencilObject"]:
         stencil_class_name = self.builder.class_name
         file_name = str(self.builder.module_path)
-        stencil_module = gt_utils.make_module_from_file(stencil_class_name, file_name)
+        with self.builder.build_phase("module_load"):
+            stencil_module = gt_utils.make_module_from_file(stencil_class_name, file_name)
         stencil_class = getattr(stencil_module, stencil_class_name)
         stencil_class.__module__ = self.builder.module_qualname
         stencil_class._gt_id_ = self.builder.stencil_id.version
@@ -275,11 +282,14 @@ class BaseBackend(Backend):
         **kwargs: Any,
     ) -> Type["StencilObject"]:
         file_path = self.builder.module_path
-        module_source = self.make_module_source(**kwargs)
+        with self.builder.build_phase("codegen") as record:
+            module_source = self.make_module_source(**kwargs)
+            record["size"] = len(module_source)
 
         if not self.builder.options._impl_opts.get("disable-code-generation", False):
             file_path.parent.mkdir(parents=True, exist_ok=True)
-            file_path.write_text(module_source)
+            # Publish atomically, the cache info is written last to validate the module
+            gt_utils.filelock.write_atomic(file_path, module_source)
             self.builder.caching.update_cache_info()
 
         return self._load()
@@ -429,11 +439,17 @@ class BasePyExtBackend(BaseBackend):
             target_path=str(pyext_target_file_path),
             **pyext_build_opts,
         )
+        # Build intermediates are not needed to load the stencil from the cache
+        pyext_build_args["clean"] = (
+            pyext_build_args.get("clean", False) or self.builder.caching.clean_build_intermediates
+        )
 
-        if uses_cuda:
-            module_name, file_path = pyext_builder.build_pybind_cuda_ext(**pyext_build_args)
-        else:
-            module_name, file_path = pyext_builder.build_pybind_ext(**pyext_build_args)
+        with self.builder.build_phase("compile") as record:
+            if uses_cuda:
+                module_name, file_path = pyext_builder.build_pybind_cuda_ext(**pyext_build_args)
+            else:
+                module_name, file_path = pyext_builder.build_pybind_ext(**pyext_build_args)
+            record["size"] = os.path.getsize(file_path)
 
         assert module_name == qualified_pyext_name
 
@@ -477,13 +493,20 @@ class BaseModuleGenerator(abc.ABC):
 
         definition_ir = self.builder.definition_ir
 
-        if definition_ir.sources is not None:
-            sources = {
-                key: gt_utils.text.format_source(value, line_length=self.SOURCE_LINE_LENGTH)
-                for key, value in definition_ir.sources
-            }
+        options = {
+            key: value
+            for key, value in self.builder.options.as_dict().items()
+            if key not in ["build_info"]
+        }
+
+        if definition_ir.sources is not None and options["format_source"]:
+            with self.builder.build_phase("format_source"):
+                sources = {
+                    key: gt_utils.text.format_source(value, line_length=self.SOURCE_LINE_LENGTH)
+                    for key, value in definition_ir.sources
+                }
         else:
-            sources = {}
+            sources = dict(definition_ir.sources or {})
 
         if definition_ir.externals:
             constants = {
@@ -494,12 +517,6 @@ class BaseModuleGenerator(abc.ABC):
         else:
             constants = {}
 
-        options = {
-            key: value
-            for key, value in self.builder.options.as_dict().items()
-            if key not in ["build_info"]
-        }
-
         parallel_axes = definition_ir.domain.parallel_axes or []
         sequential_axis = definition_ir.domain.sequential_axis.name
         domain_info = repr(
@@ -523,6 +540,7 @@ class BaseModuleGenerator(abc.ABC):
             gt_parameter_info=repr(self.args_data["parameter_info"]),
             gt_constants=constants,
             gt_options=options,
+            gt_metrics=self.generate_metrics(),
             stencil_signature=self.generate_signature(),
             field_names=self.args_data["field_info"].keys(),
             param_names=self.args_data["parameter_info"].keys(),
@@ -531,9 +549,11 @@ class BaseModuleGenerator(abc.ABC):
             implementation=self.generate_implementation(),
         )
         if options["format_source"]:
-            module_source = gt_utils.text.format_source(
-                module_source, line_length=self.SOURCE_LINE_LENGTH
-            )
+            with self.builder.build_phase("format_source") as record:
+                module_source = gt_utils.text.format_source(
+                    module_source, line_length=self.SOURCE_LINE_LENGTH
+                )
+                record["size"] = len(module_source)
 
         return module_source
 
@@ -570,6 +590,10 @@ class BaseModuleGenerator(abc.ABC):
         source = ""
         return source
 
+    def generate_metrics(self) -> str:
+        with self.builder.build_phase("analysis.metrics"):
+            return repr(gt_metrics.compute_metrics(self.builder.implementation_ir))
+
     def generate_signature(self) -> str:
         args = []
         keyword_args = ["*"]
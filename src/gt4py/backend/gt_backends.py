@@ -18,7 +18,7 @@ import abc
 import functools
 import numbers
 import os
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Type, Union
 
 import jinja2
 import numpy as np
@@ -38,6 +38,10 @@ if TYPE_CHECKING:
     from gt4py.storage.storage import Storage
 
 
+#: Default number of computation objects (one per domain shape) kept alive by a stencil
+DEFAULT_MAX_CACHED_COMPUTATIONS = 8
+
+
 def make_x86_layout_map(mask: Tuple[int, ...]) -> Tuple[Optional[int], ...]:
     ctr = iter(range(sum(mask)))
     if len(mask) < 3:
@@ -140,6 +144,93 @@ class _MaxKOffsetExtractor(gt_ir.IRNodeVisitor):
 _extract_max_k_offset = _MaxKOffsetExtractor.apply
 
 
+class _SourceLinesCollector(gt_ir.IRNodeVisitor):
+    @classmethod
+    def apply(cls, root_node: gt_ir.Node) -> List[int]:
+        return cls()(root_node)
+
+    def __init__(self) -> None:
+        self.lines: Set[int] = set()
+
+    def __call__(self, node: gt_ir.Node) -> List[int]:
+        self.visit(node)
+        return sorted(self.lines)
+
+    def visit_Statement(self, node: gt_ir.Statement) -> None:
+        loc: Optional[gt_ir.Location] = getattr(node, "loc", None)
+        if loc is not None:
+            self.lines.add(loc.line)
+        self.generic_visit(node)
+
+
+_collect_source_lines = _SourceLinesCollector.apply
+
+
+def _make_timed_stage_groups(node: gt_ir.StencilImplementation) -> List[Dict[str, Any]]:
+    """Split the multi-stages into groups which can run as independent GridTools computations.
+
+    GridTools allocates the temporaries and computes the extents of the stages within a
+    computation, so a multi-stage can only start a new group if no temporary is shared
+    with the previous ones and no field written before is read outside of the compute
+    domain, i.e. with horizontal offsets or by a stage with an extended compute extent.
+    """
+    accesses = []
+    for multi_stage in node.multi_stages:
+        written, halo_reads, temporaries = set(), set(), set()
+        for group in multi_stage.groups:
+            for stage in group.stages:
+                is_extended = any(
+                    bound != 0 for bounds in stage.compute_extent[:2] for bound in bounds
+                )
+                for accessor in stage.accessors:
+                    if isinstance(accessor, gt_ir.FieldAccessor):
+                        if not node.fields[accessor.symbol].is_api:
+                            temporaries.add(accessor.symbol)
+                        if accessor.intent == gt_ir.AccessIntent.READ_WRITE:
+                            written.add(accessor.symbol)
+                        if is_extended or any(
+                            bound != 0 for bounds in accessor.extent[:2] for bound in bounds
+                        ):
+                            halo_reads.add(accessor.symbol)
+        accesses.append((written, halo_reads, temporaries))
+
+    groups: List[List[int]] = [[0]] if accesses else []
+    for i in range(1, len(accesses)):
+        written_before = set().union(*(written for written, _, _ in accesses[:i]))
+        temporaries_before = set().union(*(temporaries for _, _, temporaries in accesses[:i]))
+        halo_reads_after = set().union(*(halo_reads for _, halo_reads, _ in accesses[i:]))
+        temporaries_after = set().union(*(temporaries for _, _, temporaries in accesses[i:]))
+        if written_before & halo_reads_after or temporaries_before & temporaries_after:
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+
+    api_fields = [name for name, decl in node.fields.items() if decl.is_api]
+    parameters = list(node.parameters.keys())
+    result = []
+    for group in groups:
+        stages = [
+            stage
+            for i in group
+            for stage_group in node.multi_stages[i].groups
+            for stage in stage_group.stages
+        ]
+        symbols = {accessor.symbol for stage in stages for accessor in stage.accessors}
+        result.append(
+            {
+                "multi_stages": group,
+                "stages": [
+                    {"name": stage.name, "source_lines": _collect_source_lines(stage)}
+                    for stage in stages
+                ],
+                "fields": [name for name in api_fields if name in symbols],
+                "parameters": [name for name in parameters if name in symbols],
+            }
+        )
+
+    return result
+
+
 class GTPyExtGenerator(gt_ir.IRNodeVisitor):
 
     TEMPLATE_DIR = os.path.join(os.path.dirname(__file__), "templates")
@@ -500,11 +591,16 @@ class GTPyExtGenerator(gt_ir.IRNodeVisitor):
             gt_backend=self.gt_backend_t,
             halo_sizes=halo_sizes,
             k_axis=k_axis,
+            max_cached_computations=self.options.backend_opts.get(
+                "max_cached_computations", DEFAULT_MAX_CACHED_COMPUTATIONS
+            ),
             module_name=self.module_name,
             multi_stages=multi_stages,
             parameters=parameters,
             stage_functors=stage_functors,
             stencil_unique_name=self.class_name,
+            time_stages=self.options.backend_opts.get("time_stages", False),
+            timed_groups=_make_timed_stage_groups(node),
             tmp_fields=tmp_fields,
         )
 
@@ -518,18 +614,61 @@ class GTPyExtGenerator(gt_ir.IRNodeVisitor):
         return sources
 
 
+class GTPyModuleGenerator(gt_backend.PyExtModuleGenerator):
+    def generate_class_members(self) -> str:
+        source = super().generate_class_members()
+        # Backends without the option (e.g. gtc:gt) do not generate a computation cache
+        max_cached_computations = (
+            self.builder.options.backend_opts.get(
+                "max_cached_computations", DEFAULT_MAX_CACHED_COMPUTATIONS
+            )
+            if "max_cached_computations" in self.builder.backend.options
+            else 0
+        )
+        if self.builder.implementation_ir.has_effect and max_cached_computations:
+            source += """
+
+def clear_computation_cache(self):
+    pyext_module.clear_computation_cache()
+"""
+        return source
+
+
 class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
 
+    #: Options of the native compilation, e.g. ``march="native"`` or ``fast_math=True``
+    NATIVE_BUILD_OPTS = {
+        "fast_math": {"versioning": True, "type": bool},
+        "lto": {"versioning": True, "type": bool},
+        "march": {"versioning": True, "type": str},
+        "mtune": {"versioning": True, "type": str},
+        "openmp": {"versioning": True, "type": bool},
+    }
+
     GT_BACKEND_OPTS = {
         "add_profile_info": {"versioning": True, "type": bool},
         "clean": {"versioning": False, "type": bool},
         "debug_mode": {"versioning": True, "type": bool},
+        "max_cached_computations": {"versioning": True, "type": int},
+        "time_stages": {"versioning": True, "type": bool},
         "verbose": {"versioning": False, "type": bool},
+        **NATIVE_BUILD_OPTS,
     }
 
+    @classmethod
+    def filter_options_for_id(
+        cls, options: gt_definitions.BuildOptions
+    ) -> gt_definitions.BuildOptions:
+        filtered_options = super().filter_options_for_id(options)
+        # Binaries built for the "native" CPU of different hosts must not be mixed up
+        for name in ("march", "mtune"):
+            if filtered_options.backend_opts.get(name, None) == "native":
+                filtered_options.backend_opts[name] = pyext_builder.native_cpu_id(name)
+        return filtered_options
+
     GT_BACKEND_T: str
 
-    MODULE_GENERATOR_CLASS = gt_backend.PyExtModuleGenerator
+    MODULE_GENERATOR_CLASS = GTPyModuleGenerator
 
     PYEXT_GENERATOR_CLASS = GTPyExtGenerator
 
@@ -606,8 +745,13 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
             **pyext_builder.get_gt_pyext_build_opts(
                 debug_mode=self.builder.options.backend_opts.get("debug_mode", False),
                 add_profile_info=self.builder.options.backend_opts.get("add_profile_info", False),
+                uses_openmp=self.builder.options.backend_opts.get("openmp", True),
                 uses_cuda=uses_cuda,
                 gt_version=gt_version,
+                march=self.builder.options.backend_opts.get("march", None),
+                mtune=self.builder.options.backend_opts.get("mtune", None),
+                fast_math=self.builder.options.backend_opts.get("fast_math", False),
+                lto=self.builder.options.backend_opts.get("lto", False),
             ),
         )
 
@@ -627,7 +771,11 @@ class BaseGTBackend(gt_backend.BasePyExtBackend, gt_backend.CLIBackendMixin):
         gt_pyext_generator = self.PYEXT_GENERATOR_CLASS(
             class_name, module_name, self.GT_BACKEND_T, self.builder.options
         )
-        gt_pyext_sources = gt_pyext_generator(ir)
+        with self.builder.build_phase("codegen.extension") as record:
+            gt_pyext_sources = gt_pyext_generator(ir)
+            record["size"] = sum(
+                len(source) for sources in gt_pyext_sources.values() for source in sources.values()
+            )
         final_ext = ".cu" if self.languages and self.languages["computation"] == "cuda" else ".cpp"
         comp_src = gt_pyext_sources["computation"]
         for key in [k for k in comp_src.keys() if k.endswith(".src")]:
@@ -678,7 +826,7 @@ class GTMCBackend(BaseGTBackend):
         return self.make_extension(uses_cuda=False)
 
 
-class GTCUDAPyModuleGenerator(gt_backend.CUDAPyExtModuleGenerator):
+class GTCUDAPyModuleGenerator(GTPyModuleGenerator, gt_backend.CUDAPyExtModuleGenerator):
     def generate_pre_run(self) -> str:
         field_names = [
             key
@@ -15,6 +15,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from .gtcpp.backend import GTCGTBackend
+from .numpy.backend import GTCNumpyBackend
 
 
-__all__ = ["GTCGTBackend"]
+__all__ = ["GTCGTBackend", "GTCNumpyBackend"]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from gt4py import ir as gt_ir
+from gt4py import utils as gt_utils
+from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
+from gtc import gtir_to_oir, oir
+from gtc.passes.gtir_dtype_resolver import resolve_dtype
+from gtc.passes.gtir_prune_unused_parameters import prune_unused_parameters
+from gtc.passes.gtir_upcaster import upcast
+from gtc.passes.oir_dead_code_elimination import dead_code_elimination
+
+
+#: Steps lowering the definition IR to OIR, each one taking the IR produced by the previous one
+OIR_LOWERING_STEPS: Tuple[Tuple[str, Callable[[Any], Any]], ...] = (
+    ("defir_to_gtir", DefIRToGTIR.apply),
+    ("prune_unused_parameters", prune_unused_parameters),
+    ("resolve_dtype", resolve_dtype),
+    ("upcast", upcast),
+    ("gtir_to_oir", lambda gtir: gtir_to_oir.GTIRToOIR().visit(gtir)),
+    ("dead_code_elimination", dead_code_elimination),
+)
+
+
+def lower_to_oir(
+    definition_ir: gt_ir.StencilDefinition, build_info: Optional[Dict[str, Any]] = None
+) -> oir.Stencil:
+    """Lower the definition IR to OIR, recording every step as a build phase."""
+    node: Any = definition_ir
+    for name, step in OIR_LOWERING_STEPS:
+        with gt_utils.timing.build_phase(f"lowering.{name}", build_info):
+            node = step(node)
+    assert isinstance(node, oir.Stencil)
+    return node
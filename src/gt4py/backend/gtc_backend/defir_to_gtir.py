@@ -14,8 +14,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Dict, List, Union, cast
+from typing import Dict, List, Optional, Union, cast
 
+from eve.type_definitions import SourceLocation
 from gt4py.ir import IRNodeVisitor
 from gt4py.ir.nodes import (
     ArgumentInfo,
@@ -34,6 +35,7 @@ from gt4py.ir.nodes import (
     If,
     IterationOrder,
     LevelMarker,
+    Location,
     NativeFuncCall,
     NativeFunction,
     ScalarLiteral,
@@ -55,6 +57,12 @@ def transform_offset(offset: Dict[str, int]) -> gtir.CartesianOffset:
     return gtir.CartesianOffset(i=i, j=j, k=k)
 
 
+def transform_loc(loc: Optional[Location]) -> Optional[SourceLocation]:
+    if loc is None or loc.line < 1 or loc.column < 1:
+        return None
+    return SourceLocation(line=loc.line, column=loc.column, source=loc.scope)
+
+
 class DefIRToGTIR(IRNodeVisitor):
 
     GT4PY_ITERATIONORDER_TO_GTIR_LOOPORDER = {
@@ -178,7 +186,9 @@ class DefIRToGTIR(IRNodeVisitor):
     def visit_Assign(self, node: Assign) -> gtir.ParAssignStmt:
         assert isinstance(node.target, FieldRef) or isinstance(node.target, VarRef)
         left = self.visit(node.target)
-        return gtir.ParAssignStmt(left=left, right=self.visit(node.value))
+        return gtir.ParAssignStmt(
+            left=left, right=self.visit(node.value), loc=transform_loc(node.loc)
+        )
 
     def visit_ScalarLiteral(self, node: ScalarLiteral) -> gtir.Literal:
         return gtir.Literal(value=str(node.value), dtype=common.DataType(node.data_type.value))
@@ -229,6 +239,7 @@ class DefIRToGTIR(IRNodeVisitor):
                 false_branch=gtir.BlockStmt(body=self.visit(node.else_body))
                 if node.else_body
                 else None,
+                loc=transform_loc(node.loc),
             )
         else:
             return gtir.ScalarIfStmt(
@@ -237,6 +248,7 @@ class DefIRToGTIR(IRNodeVisitor):
                 false_branch=gtir.BlockStmt(body=self.visit(node.else_body))
                 if node.else_body
                 else None,
+                loc=transform_loc(node.loc),
             )
 
     def visit_VarRef(self, node: VarRef, **kwargs):
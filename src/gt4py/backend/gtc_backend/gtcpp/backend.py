@@ -20,19 +20,16 @@ from eve import codegen
 from eve.codegen import MakoTemplate as as_mako
 from gt4py import backend as gt_backend
 from gt4py import gt_src_manager
+from gt4py import utils as gt_utils
 from gt4py.backend import BaseGTBackend, CLIBackendMixin
 from gt4py.backend.gt_backends import (
     gtcpu_is_compatible_type,
     make_x86_layout_map,
     x86_is_compatible_layout,
 )
-from gt4py.backend.gtc_backend.defir_to_gtir import DefIRToGTIR
-from gtc import gtir_to_oir
+from gt4py.backend.gtc_backend.common import lower_to_oir
 from gtc.common import DataType
 from gtc.gtcpp import gtcpp, gtcpp_codegen, oir_to_gtcpp
-from gtc.passes.gtir_dtype_resolver import resolve_dtype
-from gtc.passes.gtir_prune_unused_parameters import prune_unused_parameters
-from gtc.passes.gtir_upcaster import upcast
 
 
 if TYPE_CHECKING:
@@ -50,14 +47,25 @@ class GTCGTExtGenerator:
         self.options = options
 
     def __call__(self, definition_ir) -> Dict[str, Dict[str, str]]:
-        gtir = DefIRToGTIR.apply(definition_ir)
-        gtir_without_unused_params = prune_unused_parameters(gtir)
-        dtype_deduced = resolve_dtype(gtir_without_unused_params)
-        upcasted = upcast(dtype_deduced)
-        oir = gtir_to_oir.GTIRToOIR().visit(upcasted)
-        gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
-        implementation = gtcpp_codegen.GTCppCodegen.apply(gtcpp)
-        bindings = GTCppBindingsCodegen.apply(gtcpp, module_name=self.module_name)
+        build_info = self.options.build_info
+        oir = lower_to_oir(definition_ir, build_info)
+        with gt_utils.timing.build_phase("lowering.oir_to_gtcpp", build_info):
+            gtcpp = oir_to_gtcpp.OIRToGTCpp().visit(oir)
+        time_stages = self.options.backend_opts.get("time_stages", False)
+        with gt_utils.timing.build_phase("codegen.computation", build_info) as record:
+            implementation = gtcpp_codegen.GTCppCodegen.apply(
+                gtcpp, format_source=False, time_stages=time_stages
+            )
+            record["size"] = len(implementation)
+        with gt_utils.timing.build_phase("codegen.bindings", build_info) as record:
+            bindings = GTCppBindingsCodegen.apply(
+                gtcpp, module_name=self.module_name, format_source=False, time_stages=time_stages
+            )
+            record["size"] = len(bindings)
+        if self.options.format_source:
+            with gt_utils.timing.build_phase("format_source", build_info):
+                implementation = codegen.format_source("cpp", implementation, style="LLVM")
+                bindings = codegen.format_source("cpp", bindings, style="LLVM")
         return {
             "computation": {"computation.hpp": implementation},
             "bindings": {"bindings.cpp": bindings},
@@ -107,10 +115,20 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
         assert "module_name" in kwargs
         entry_params = self.visit(node.parameters, external_arg=True)
         sid_params = self.visit(node.parameters, external_arg=False)
+        timed_groups = []
+        if kwargs.get("time_stages", False):
+            for group in gtcpp_codegen.timed_multi_stage_groups(node):
+                stages = {
+                    stage.functor: [stage.loc.line] if stage.loc else []
+                    for i in group
+                    for stage in node.gt_computation.multi_stages[i].stages
+                }
+                timed_groups.append({"multi_stages": group, "stages": stages})
         return self.generic_visit(
             node,
             entry_params=entry_params,
             sid_params=sid_params,
+            timed_groups=timed_groups,
             **kwargs,
         )
 
@@ -138,7 +156,12 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
                             std::chrono::high_resolution_clock::now().time_since_epoch()).count())/1e9;
                 }
 
+                %if time_stages:
+                std::vector<double> stage_times;
+                ${name}(domain, stage_times)(${','.join(sid_params)});
+                %else:
                 ${name}(domain)(${','.join(sid_params)});
+                %endif
 
                 if (!exec_info.is(py::none()))
                 {
@@ -146,6 +169,25 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
                     exec_info_dict["run_cpp_end_time"] = static_cast<double>(
                         std::chrono::duration_cast<std::chrono::nanoseconds>(
                             std::chrono::high_resolution_clock::now().time_since_epoch()).count()/1e9);
+                    %if time_stages:
+
+                    py::list stage_info;
+                    %for group in timed_groups:
+                    {
+                        py::dict group_info, stages;
+                        group_info["multi_stages"] = std::vector<int>{
+                            ${ ', '.join(str(i) for i in group['multi_stages']) }};
+                        %for stage_name, lines in group['stages'].items():
+                        stages["${ stage_name }"] = std::vector<int>{
+                            ${ ', '.join(str(line) for line in lines) }};
+                        %endfor
+                        group_info["stages"] = stages;
+                        group_info["time"] = stage_times[${ loop.index }];
+                        stage_info.append(group_info);
+                    }
+                    %endfor
+                    exec_info_dict["stage_times"] = stage_info;
+                    %endif
                 }
 
             }, "Runs the given computation");}
@@ -154,10 +196,15 @@ class GTCppBindingsCodegen(codegen.TemplatedGenerator):
     )
 
     @classmethod
-    def apply(cls, root, *, module_name="stencil", **kwargs) -> str:
-        generated_code = cls().visit(root, module_name=module_name, **kwargs)
-        formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
-        return formatted_code
+    def apply(
+        cls, root, *, module_name="stencil", format_source=True, time_stages=False, **kwargs
+    ) -> str:
+        generated_code = cls().visit(
+            root, module_name=module_name, time_stages=time_stages, **kwargs
+        )
+        if format_source:
+            generated_code = codegen.format_source("cpp", generated_code, style="LLVM")
+        return generated_code
 
 
 @gt_backend.register
@@ -167,7 +214,10 @@ class GTCGTBackend(BaseGTBackend, CLIBackendMixin):
     name = "gtc:gt:cpu_ifirst"
 
     GT_BACKEND_T = "x86"
-    options: ClassVar[Dict[str, Any]] = {}
+    options: ClassVar[Dict[str, Any]] = {
+        "time_stages": {"versioning": True, "type": bool},
+        **BaseGTBackend.NATIVE_BUILD_OPTS,
+    }
     storage_info = {
         "alignment": 1,
         "device": "cpu",
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import textwrap
+from typing import Any, ClassVar, Dict
+
+from cached_property import cached_property
+
+from gt4py import backend as gt_backend
+from gt4py.backend.gtc_backend.common import lower_to_oir
+from gt4py.backend.numpy_backend import (
+    numpy_is_compatible_layout,
+    numpy_is_compatible_type,
+    numpy_layout,
+)
+from gtc import oir
+from gtc.numpy import numpy_codegen
+
+
+class GTCNumpyModuleGenerator(gt_backend.BaseModuleGenerator):
+    @cached_property
+    def oir(self) -> oir.Stencil:
+        return lower_to_oir(self.builder.definition_ir, self.builder.options.build_info)
+
+    def generate_module_members(self) -> str:
+        oir = self.oir
+        with self.builder.build_phase("codegen.computation") as record:
+            source = numpy_codegen.NumpyCodegen.apply(oir, format_source=False)
+            record["size"] = len(source)
+        return source
+
+    def generate_implementation(self) -> str:
+        args = ", ".join(
+            [
+                self.DOMAIN_ARG_NAME,
+                self.ORIGIN_ARG_NAME,
+                *(f"{param.name}={param.name}" for param in self.oir.params),
+            ]
+        )
+        source = f"run_computation({args})\n"
+        if self.builder.options.backend_opts.get("ignore_np_errstate", True):
+            source = (
+                "with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):\n"
+                + textwrap.indent(source, " " * self.TEMPLATE_INDENT_SIZE)
+            )
+        return source
+
+
+@gt_backend.register
+class GTCNumpyBackend(gt_backend.BaseBackend, gt_backend.PurePythonBackendCLIMixin):
+    """NumPy backend using gtc.
+
+    The stencil is lowered to OIR and every horizontal execution is computed as a single
+    vectorized NumPy operation over the whole (horizontal and, if possible, vertical) domain.
+
+    Other Parameters
+    ----------------
+    Backend options include:
+    - ignore_np_errstate: `bool`
+        If False, does not ignore NumPy floating-point errors. (`True` by default.)
+    """
+
+    name = "gtc:numpy"
+    options: ClassVar[Dict[str, Any]] = {"ignore_np_errstate": {"versioning": True, "type": bool}}
+    storage_info = {
+        "alignment": 1,
+        "device": "cpu",
+        "layout_map": numpy_layout,
+        "is_compatible_layout": numpy_is_compatible_layout,
+        "is_compatible_type": numpy_is_compatible_type,
+    }
+
+    languages = {"computation": "python", "bindings": []}
+
+    MODULE_GENERATOR_CLASS = GTCNumpyModuleGenerator
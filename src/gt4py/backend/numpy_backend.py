@@ -15,7 +15,7 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 import textwrap
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Optional, Set, Tuple, Union
 
 import numpy as np
 
@@ -60,6 +60,7 @@ class NumPySourceGenerator(PythonSourceGenerator):
         self.interval_k_start_name = interval_k_start_name
         self.interval_k_end_name = interval_k_end_name
         self.conditions_depth = 0
+        self.profile_times_name = None
 
     def _make_field_origin(self, name: str, origin=None):
         if origin is None:
@@ -117,6 +118,18 @@ class NumPySourceGenerator(PythonSourceGenerator):
 
         return source_lines
 
+    def make_profiled_stmt_source(
+        self, stmt: gt_ir.Statement, stmt_sources: List[str]
+    ) -> List[str]:
+        line = stmt.loc.line if getattr(stmt, "loc", None) is not None else 0
+        return [
+            "_profile_start_ = _profile_timer_()",
+            *stmt_sources,
+            "{times}[{line}] += _profile_timer_() - _profile_start_".format(
+                times=self.profile_times_name, line=line
+            ),
+        ]
+
     def make_stage_source(self, iteration_order: gt_ir.IterationOrder, regions: list) -> List[str]:
         source_lines = []
 
@@ -204,6 +217,19 @@ class NumPySourceGenerator(PythonSourceGenerator):
 
         super().visit_StencilImplementation(node)
 
+    def visit_BlockStmt(self, node: gt_ir.BlockStmt) -> List[str]:
+        if self.profile_times_name is None:
+            return super().visit_BlockStmt(node)
+
+        body_sources = []
+        for stmt in node.stmts:
+            stmt_source = self.visit(stmt)
+            if not isinstance(stmt_source, list):
+                stmt_source = [stmt_source]
+            body_sources.extend(self.make_profiled_stmt_source(stmt, stmt_source))
+
+        return body_sources
+
     def visit_UnaryOpExpr(self, node: gt_ir.UnaryOpExpr) -> str:
 
         if node.op is gt_ir.UnaryOperator.NOT:
@@ -318,6 +344,27 @@ class NumPySourceGenerator(PythonSourceGenerator):
         return sources
 
 
+class _StmtLinesCollector(gt_ir.IRNodeVisitor):
+    """Collect the source lines of the statements timed in profiling mode."""
+
+    @classmethod
+    def apply(cls, root_node: gt_ir.Node) -> Set[int]:
+        collector = cls()
+        collector.visit(root_node)
+        return collector.lines
+
+    def __init__(self):
+        self.lines: Set[int] = set()
+
+    def visit_BlockStmt(self, node: gt_ir.BlockStmt) -> None:
+        # Nested blocks are timed as part of the enclosing statement
+        for stmt in node.stmts:
+            self.lines.add(stmt.loc.line if getattr(stmt, "loc", None) is not None else 0)
+
+
+_collect_stmt_lines = _StmtLinesCollector.apply
+
+
 class NumPyModuleGenerator(gt_backend.BaseModuleGenerator):
     def __init__(self):
         super().__init__()
@@ -332,11 +379,38 @@ class NumPyModuleGenerator(gt_backend.BaseModuleGenerator):
             interval_k_end_name="interval_k_end",
         )
 
+    @property
+    def profile(self) -> bool:
+        return self.builder.options.backend_opts.get("profile", False)
+
     def generate_module_members(self) -> str:
         return ""
 
+    def generate_class_members(self) -> str:
+        source = super().generate_class_members()
+        if self.profile:
+            lines = sorted(_collect_stmt_lines(self.builder.implementation_ir))
+            times = ", ".join(f"{line}: 0.0" for line in lines)
+            source += f"""
+
+_gt_profile_ = {{"ncalls": 0, "times": {{{times}}}}}
+"""
+        return source
+
     def generate_implementation(self) -> str:
         block = gt_text.TextBlock(indent_size=self.TEMPLATE_INDENT_SIZE)
+        if self.profile:
+            block.extend(
+                [
+                    "# Accumulated run time per source line of the definition",
+                    "_profile_times_ = self._gt_profile_['times']",
+                    "_profile_timer_ = time.perf_counter",
+                    "self._gt_profile_['ncalls'] += 1",
+                ]
+            )
+            self.source_generator.profile_times_name = "_profile_times_"
+        else:
+            self.source_generator.profile_times_name = None
         self.source_generator(self.builder.implementation_ir, block)
         if self.builder.options.backend_opts.get("ignore_np_errstate", True):
             source = "with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):\n"
@@ -369,10 +443,17 @@ class NumPyBackend(gt_backend.BaseBackend, gt_backend.PurePythonBackendCLIMixin)
     Backend options include:
     - ignore_np_errstate: `bool`
         If False, does not ignore NumPy floating-point errors. (`True` by default.)
+    - profile: `bool`
+        If True, accumulates the run time of every statement across calls, which can be
+        printed with :meth:`gt4py.stencil_object.StencilObject.profile_report`.
+        (`False` by default.)
     """
 
     name = "numpy"
-    options = {"ignore_np_errstate": {"versioning": True, "type": bool}}
+    options = {
+        "ignore_np_errstate": {"versioning": True, "type": bool},
+        "profile": {"versioning": True, "type": bool},
+    }
     storage_info = {
         "alignment": 1,
         "device": "cpu",
@@ -18,16 +18,22 @@ import contextlib
 import copy
 import distutils
 import distutils.sysconfig
-import io
+import functools
 import os
+import platform
+import shlex
 import shutil
-from typing import Any, Dict, List, Optional, Tuple, Type, Union, overload
+import subprocess
+import sys
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Type, Union, overload
 
 import pybind11
 import setuptools
 from setuptools.command.build_ext import build_ext
 
 from gt4py import config as gt_config
+from gt4py import utils as gt_utils
 
 
 def get_cuda_compute_capability():
@@ -39,6 +45,67 @@ def get_cuda_compute_capability():
         return None
 
 
+@functools.lru_cache(maxsize=None)
+def resolve_native_cpu(flag: str = "march") -> Optional[str]:
+    """Find the CPU selected by ``-march=native`` (or ``-mtune=native``) in the C++ compiler.
+
+    Returns `None` if the compiler cannot report it (e.g. compilers without ``--help=target``).
+    """
+    compiler = os.environ.get("CXX", None) or distutils.sysconfig.get_config_var("CXX") or "c++"
+    try:
+        output = subprocess.run(
+            [*shlex.split(compiler), f"-{flag}=native", "-Q", "--help=target"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    for line in output.splitlines():
+        items = line.split()
+        if len(items) == 2 and items[0] == f"-{flag}=":
+            return items[1]
+    return None
+
+
+def _host_cpu_model() -> str:
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+
+def native_cpu_id(flag: str = "march") -> str:
+    """Identify the CPU targeted by ``-march=native`` (or ``-mtune=native``) on this host.
+
+    Used to version stencils built for the native CPU, such that caches shared by different
+    hosts do not mix binaries built for different CPUs.
+    """
+    return resolve_native_cpu(flag) or f"native ({_host_cpu_model()})"
+
+
+def _get_native_opt_flags(
+    *, march: Optional[str], mtune: Optional[str], fast_math: bool, lto: bool
+) -> Tuple[List[str], List[str], List[str]]:
+    """Compute the host code optimization flags for the C++ compiler, nvcc and the linker."""
+    cpu_flags = [
+        f"-{flag}={value}" for flag, value in (("march", march), ("mtune", mtune)) if value
+    ]
+    if fast_math:
+        cpu_flags.append("-ffast-math")
+    nvcc_flags = ["--use_fast_math"] if fast_math else []
+    for cpu_flag in cpu_flags:
+        nvcc_flags.extend(["--compiler-options", cpu_flag])
+    if lto:
+        return [*cpu_flags, "-flto"], nvcc_flags, ["-flto", *cpu_flags]
+    return cpu_flags, nvcc_flags, []
+
+
 def get_gt_pyext_build_opts(
     *,
     debug_mode: bool = False,
@@ -46,6 +113,10 @@ def get_gt_pyext_build_opts(
     uses_openmp: bool = True,
     uses_cuda: bool = False,
     gt_version: int = 1,
+    march: Optional[str] = None,
+    mtune: Optional[str] = None,
+    fast_math: bool = False,
+    lto: bool = False,
 ) -> Dict[str, Union[str, List[str], Dict[str, Any]]]:
 
     include_dirs = [gt_config.build_settings["boost_include_path"]]
@@ -99,13 +170,20 @@ def get_gt_pyext_build_opts(
             *extra_compile_args_from_config["nvcc"],
         ],
     )
-    extra_link_args = gt_config.build_settings["extra_link_args"]
+    extra_link_args = list(gt_config.build_settings["extra_link_args"])
 
     mode_flags = ["-O0", "-ggdb"] if debug_mode else ["-O3", "-DNDEBUG"]
     extra_compile_args["cxx"].extend(mode_flags)
     extra_compile_args["nvcc"].extend(mode_flags)
     extra_link_args.extend(mode_flags)
 
+    cxx_flags, nvcc_flags, link_flags = _get_native_opt_flags(
+        march=march, mtune=mtune, fast_math=fast_math, lto=lto and not uses_cuda
+    )
+    extra_compile_args["cxx"].extend(cxx_flags)
+    extra_compile_args["nvcc"].extend(nvcc_flags)
+    extra_link_args.extend(link_flags)
+
     if add_profile_info:
         profile_flags = ["-pg"]
         extra_compile_args["cxx"].extend(profile_flags)
@@ -142,6 +220,66 @@ def get_gt_pyext_build_opts(
     return build_opts
 
 
+class _SilencedThreadsStream:
+    """Stream wrapper discarding the output written from silenced threads."""
+
+    def __init__(self, stream: Any, silenced_threads: Set[int]):
+        self.stream = stream
+        self.silenced_threads = silenced_threads
+
+    def write(self, text: str) -> int:
+        if threading.get_ident() in self.silenced_threads:
+            return len(text)
+        return self.stream.write(text)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.stream, name)
+
+
+class _BuildEnvironmentState:
+    lock = threading.Lock()
+    n_builds = 0
+    silenced_threads: Set[int] = set()
+    config_vars_backup: Dict[str, Any] = {}
+    streams_backup: Tuple[Any, Any] = (None, None)
+
+
+@contextlib.contextmanager
+def _build_environment(*, quiet: bool) -> Iterator[None]:
+    """
+    Clean the distutils build flags and silence the output of the building thread.
+
+    Both are process-wide settings, so they are applied by the first of several concurrent
+    builds (e.g. from background build threads) and restored when the last one finishes.
+    The output of other threads is not affected.
+    """
+    state = _BuildEnvironmentState
+    thread_id = threading.get_ident()
+    with state.lock:
+        if state.n_builds == 0:
+            # Hack to remove warning about "-Wstrict-prototypes" not having effect in C++
+            state.config_vars_backup = copy.deepcopy(distutils.sysconfig._config_vars)
+            _clean_build_flags(distutils.sysconfig._config_vars)
+            state.streams_backup = (sys.stdout, sys.stderr)
+            sys.stdout = _SilencedThreadsStream(sys.stdout, state.silenced_threads)
+            sys.stderr = _SilencedThreadsStream(sys.stderr, state.silenced_threads)
+        state.n_builds += 1
+        if quiet:
+            state.silenced_threads.add(thread_id)
+    try:
+        yield
+    finally:
+        with state.lock:
+            state.silenced_threads.discard(thread_id)
+            state.n_builds -= 1
+            if state.n_builds == 0:
+                sys.stdout, sys.stderr = state.streams_backup
+                # Restore original distutils flag config to not break functionality with
+                # "-Wstrict-prototypes"-hack for other tools using distutils.
+                for key, value in state.config_vars_backup.items():
+                    distutils.sysconfig._config_vars[key] = value
+
+
 # The following tells mypy to accept unpacking kwargs
 @overload
 def build_pybind_ext(
@@ -170,10 +308,6 @@ def build_pybind_ext(
     clean: bool = False,
 ) -> Tuple[str, str]:
 
-    # Hack to remove warning about "-Wstrict-prototypes" not having effect in C++
-    replaced_flags_backup = copy.deepcopy(distutils.sysconfig._config_vars)
-    _clean_build_flags(distutils.sysconfig._config_vars)
-
     include_dirs = include_dirs or []
     library_dirs = library_dirs or []
     libraries = libraries or []
@@ -206,14 +340,9 @@ def build_pybind_ext(
     if build_ext_class is not None:
         setuptools_args["cmdclass"] = {"build_ext": build_ext_class}
 
-    if verbose:
-        setuptools_args["script_args"].append("-v")
+    setuptools_args["script_args"].append("-v" if verbose else "-q")
+    with _build_environment(quiet=not verbose):
         setuptools.setup(**setuptools_args)
-    else:
-        setuptools_args["script_args"].append("-q")
-        io_out, io_err = io.StringIO(), io.StringIO()
-        with contextlib.redirect_stdout(io_out), contextlib.redirect_stderr(io_err):
-            setuptools.setup(**setuptools_args)
 
     # Copy extension in target path
     module_name = py_extension._full_name
@@ -221,17 +350,12 @@ def build_pybind_ext(
     src_path = os.path.join(build_path, file_path)
     dest_path = os.path.join(target_path, os.path.basename(file_path))
     os.makedirs(os.path.dirname(dest_path), exist_ok=True)
-    distutils.file_util.copy_file(src_path, dest_path, verbose=verbose)
+    gt_utils.filelock.copy_atomic(src_path, dest_path)
 
     # Final cleaning
     if clean:
         shutil.rmtree(build_path)
 
-    # Restore original distutils flag config to not break functionality with "-Wstrict-prototypes"-hack for other
-    # tools using distutils.
-    for key, value in replaced_flags_backup.items():
-        distutils.sysconfig._config_vars[key] = value
-
     return module_name, dest_path
 
 
@@ -16,12 +16,30 @@
 """Caching strategies for stencil generation."""
 
 import abc
+import contextlib
+import hashlib
 import inspect
+import os
 import pathlib
 import pickle
+import shutil
+import sqlite3
 import sys
+import time
 import types
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import gt4py
 from gt4py.definitions import StencilID
@@ -31,6 +49,10 @@ if TYPE_CHECKING:
     from gt4py.stencil_builder import StencilBuilder
 
 
+#: Minimum time (in seconds) between updates of the last access time of a cache entry
+ACCESS_TIME_RESOLUTION = 3600.0
+
+
 class CachingStrategy(abc.ABC):
     name: str
 
@@ -114,6 +136,57 @@ class CachingStrategy(abc.ABC):
         """
         pass
 
+    def build_lock(self) -> ContextManager:
+        """
+        Lock the generation and publication of the stencil against concurrent builds.
+
+        Only one process (or thread) at a time can hold the lock for the same stencil,
+        the others wait and can load the published stencil afterwards. Cache entries are only
+        removed while holding their lock. The default is a noop.
+        """
+        return contextlib.nullcontext()
+
+    def load_lock(self) -> ContextManager:
+        """
+        Lock the loading of the stencil against concurrent builds and removal from the cache.
+
+        Unlike :py:meth:`build_lock`, the lock is shared between processes loading the same
+        stencil. The default is a noop.
+        """
+        return contextlib.nullcontext()
+
+    @property
+    def clean_build_intermediates(self) -> bool:
+        """Remove build intermediates (e.g. object files) after a successful build."""
+        return False
+
+    def record_access(self) -> None:
+        """Record that the stencil was loaded from the cache, the default is a noop."""
+        pass
+
+    def evict_stale_versions(self) -> None:
+        """Remove outdated cache entries of the current stencil, the default is a noop."""
+        pass
+
+    def load_ir(self, kind: str) -> Optional[Any]:
+        """
+        Load a cached intermediate representation of the stencil.
+
+        Parameters
+        ----------
+        kind:
+            Either ``"definition_ir"`` or ``"implementation_ir"``
+
+        Returns
+        -------
+        The cached IR or ``None`` if not found. The default implementation never finds it.
+        """
+        return None
+
+    def store_ir(self, kind: str, ir: Any) -> None:
+        """Store an intermediate representation of the stencil, the default is a noop."""
+        pass
+
     @property
     def module_prefix(self) -> str:
         """
@@ -162,12 +235,13 @@ class JITCachingStrategy(CachingStrategy):
 
     Assign a fingerprint to the stencil being generated based on the definition function
     and some of the build options. During generation, store this fingerprint along with
-    other information in a cache info file.
+    other information (sizes, modification times and hashes of the generated files) in the
+    cache index of the backend.
 
-    In order to decide whether the stencil can be loaded from cache, check if a cache info file
-    exists in the location corresponding to the current stencil. If it exists, compare it to
-    the additional caching information for the current stencil. If the cache is consistent, a
-    rebuild can be avoided.
+    In order to decide whether the stencil can be loaded from cache, check if the cache index
+    contains an entry for the current stencil. If it exists, compare it to the fingerprint and
+    the metadata of the files of the current stencil. If the cache is consistent, a rebuild can
+    be avoided.
     """
 
     name = "jit"
@@ -183,67 +257,139 @@ class JITCachingStrategy(CachingStrategy):
         return cache_root
 
     @property
-    def backend_root_path(self) -> pathlib.Path:
+    def python_root_path(self) -> pathlib.Path:
+        """Cache path for the current Python version."""
         cpython_id = "py{version.major}{version.minor}_{api_version}".format(
             version=sys.version_info, api_version=sys.api_version
         )
-        backend_root = self.root_path / cpython_id / gt4py.utils.slugify(self.builder.backend.name)
+        return self.root_path / cpython_id
+
+    @property
+    def backend_root_path(self) -> pathlib.Path:
+        backend_root = self.python_root_path / gt4py.utils.slugify(self.builder.backend.name)
         if not backend_root.exists():
-            if not backend_root.parent.exists():
-                backend_root.parent.mkdir(parents=False)
-            backend_root.mkdir(parents=False)
+            # Concurrent processes might be creating the same directories
+            backend_root.parent.mkdir(parents=False, exist_ok=True)
+            backend_root.mkdir(parents=False, exist_ok=True)
         return backend_root
 
     @property
     def cache_info_path(self) -> Optional[pathlib.Path]:
-        """Get the cache info file path from the stencil module path."""
-        return self.builder.module_path.parent / f"{self.builder.module_path.stem}.cacheinfo"
+        """Get the path of the cache index of the backend, which stores the cache info."""
+        return self.backend_root_path / CacheIndex.FILE_NAME
+
+    @property
+    def cache_index(self) -> "CacheIndex":
+        return CacheIndex(self.backend_root_path)
+
+    @property
+    def cache_key(self) -> str:
+        """Key of the current stencil in the cache index (module path relative to the index)."""
+        return (
+            self.builder.module_path.relative_to(self.backend_root_path).with_suffix("").as_posix()
+        )
 
     def generate_cache_info(self) -> Dict[str, Any]:
-        return {
+        module_stat = self.builder.module_path.stat()
+        cache_info = {
             "backend": self.builder.backend.name,
             "stencil_name": self.builder.stencil_id.qualified_name,
             "stencil_version": self.builder.stencil_id.version,
             "module_shash": gt4py.utils.shash(self.builder.stencil_source),
+            "module_size": module_stat.st_size,
+            "module_mtime_ns": module_stat.st_mtime_ns,
+            "last_access": time.time(),
             **self.builder.backend.extra_cache_info,
         }
+        if cache_info.get("pyext_file_path", None):
+            pyext_stat = os.stat(cache_info["pyext_file_path"])
+            cache_info["pyext_size"] = pyext_stat.st_size
+            cache_info["pyext_mtime_ns"] = pyext_stat.st_mtime_ns
+        return cache_info
 
     def update_cache_info(self) -> None:
         if not self.cache_info_path:
             return
-        cache_info = self.generate_cache_info()
-        self.cache_info_path.parent.mkdir(parents=True, exist_ok=True)
-        with self.cache_info_path.open("wb") as cache_info_file:
-            pickle.dump(cache_info, cache_info_file)
+        self.cache_index.put(self.cache_key, self.generate_cache_info())
+
+    def build_lock(self) -> ContextManager:
+        return gt4py.utils.filelock.FileLock(
+            self.builder.module_path.with_suffix(".lock"),
+            timeout=gt4py.config.cache_settings["lock_timeout"],
+        )
+
+    def load_lock(self) -> ContextManager:
+        return gt4py.utils.filelock.FileLock(
+            self.builder.module_path.with_suffix(".lock"),
+            shared=True,
+            timeout=gt4py.config.cache_settings["lock_timeout"],
+        )
+
+    @property
+    def clean_build_intermediates(self) -> bool:
+        return not gt4py.config.cache_settings["keep_build_intermediates"]
+
+    def record_access(self) -> None:
+        """Update the last access time in the cache index (at most once per hour)."""
+        try:
+            self.cache_index.touch(self.cache_key, min_interval=ACCESS_TIME_RESOLUTION)
+        except Exception:
+            # Access times are only a hint for the cache garbage collection
+            pass
+
+    def evict_stale_versions(self) -> None:
+        """
+        Keep only the ``max_versions`` most recently used versions of the stencil.
+
+        Disabled by default, since versions built with different externals or backend options
+        are meant to be used side by side. Entries being loaded or built are never removed.
+        """
+        max_versions = gt4py.config.cache_settings["max_versions"]
+        if max_versions:
+            entries = [
+                entry
+                for entry in iter_cache_entries(self.backend_root_path, recursive=False)
+                if entry.stencil_name == self.builder.stencil_id.qualified_name
+                and entry.stem != self.builder.module_path.stem
+            ]
+            entries.sort(key=lambda entry: entry.last_access, reverse=True)
+            for entry in entries[max_versions - 1 :]:
+                remove_cache_entry(entry)
 
     def is_cache_info_available_and_consistent(
-        self, *, validate_hash: bool, catch_exceptions: bool = True
+        self,
+        *,
+        validate_hash: bool,
+        catch_exceptions: bool = True,
+        deep_validation: Optional[bool] = None,
     ) -> bool:
+        """
+        Check if the cache can be read and is consistent.
+
+        By default only the metadata recorded at build time (stencil id, sizes and modification
+        times of the generated files) is validated. The deep validation additionally rehashes the
+        stencil module and extension (default: ``deep_validation`` cache setting).
+        """
         result = True
         if not self.cache_info_path and catch_exceptions:
             return False
+        if deep_validation is None:
+            deep_validation = gt4py.config.cache_settings["deep_validation"]
         try:
-            cache_info = self.generate_cache_info()
+            cache_info = self.cache_info
             cache_info_ns = types.SimpleNamespace(**cache_info)
-            validate_extra = {
-                k: v
-                for k, v in self.builder.backend.extra_cache_info.items()
-                if k in self.builder.backend.extra_cache_validation_keys
-            }
-            source = self.builder.module_path.read_text()
-            module_shash = gt4py.utils.shash(source)
+            if not self.builder.module_path.is_file():
+                raise FileNotFoundError(f"Stencil module '{self.builder.module_path}' not found")
 
             if validate_hash:
                 result = (
                     cache_info_ns.backend == self.builder.backend.name
-                    and cache_info_ns.stencil_name == self.stencil_id.qualified_name
-                    and cache_info_ns.stencil_version == self.stencil_id.version
-                    and cache_info_ns.module_shash == module_shash
+                    and cache_info_ns.stencil_name == self.builder.stencil_id.qualified_name
+                    and cache_info_ns.stencil_version == self.builder.stencil_id.version
                 )
-                if validate_extra:
-                    result &= all(
-                        [cache_info[key] == validate_extra[key] for key in validate_extra]
-                    )
+                if result and (deep_validation or not self._are_files_unchanged(cache_info)):
+                    # Files might have been copied or touched: compare the contents
+                    result = self._are_hashes_equal(cache_info)
         except Exception as err:
             if not catch_exceptions:
                 raise err
@@ -255,14 +401,30 @@ class JITCachingStrategy(CachingStrategy):
     def cache_info(self) -> Dict[str, Any]:
         if not self.cache_info_path:
             return {}
-        if not self.cache_info_path.exists():
-            return {}
-        return self._unpickle_cache_info_file(self.cache_info_path)
-
-    @staticmethod
-    def _unpickle_cache_info_file(cache_info_path: pathlib.Path) -> Dict[str, Any]:
-        with cache_info_path.open("rb") as cache_info_file:
-            return pickle.load(cache_info_file)
+        return self.cache_index.get(self.cache_key) or {}
+
+    def _are_files_unchanged(self, cache_info: Dict[str, Any]) -> bool:
+        module_stat = self.builder.module_path.stat()
+        if (module_stat.st_size, module_stat.st_mtime_ns) != (
+            cache_info["module_size"],
+            cache_info["module_mtime_ns"],
+        ):
+            return False
+        if cache_info.get("pyext_file_path", None):
+            pyext_stat = os.stat(cache_info["pyext_file_path"])
+            return (pyext_stat.st_size, pyext_stat.st_mtime_ns) == (
+                cache_info["pyext_size"],
+                cache_info["pyext_mtime_ns"],
+            )
+        return True
+
+    def _are_hashes_equal(self, cache_info: Dict[str, Any]) -> bool:
+        if cache_info["module_shash"] != gt4py.utils.shash(self.builder.module_path.read_text()):
+            return False
+        if cache_info.get("pyext_md5", None):
+            pyext_source = pathlib.Path(cache_info["pyext_file_path"]).read_bytes()
+            return cache_info["pyext_md5"] == hashlib.md5(pyext_source).hexdigest()
+        return True
 
     @property
     def options_id(self) -> str:
@@ -282,19 +444,76 @@ class JITCachingStrategy(CachingStrategy):
         return [str(item) for item in self.builder.definition._gtscript_["api_annotations"]]
 
     @property
-    def stencil_id(self) -> StencilID:
+    def definition_fingerprint(self) -> str:
+        """Hash of the stencil definition, independent of the build options."""
         fingerprint = {
             "__main__": self.builder.definition._gtscript_["canonical_ast"],
             "docstring": inspect.getdoc(self.builder.definition),
             "api_annotations": f"[{', '.join(self._extract_api_annotations())}]",
             **self._extract_externals(),
         }
+        return gt4py.utils.shashed_id(fingerprint)
 
+    @property
+    def stencil_id(self) -> StencilID:
         # typeignore because attrclass StencilID has generated constructor
         return StencilID(  # type: ignore
             self.builder.options.qualified_name,
-            gt4py.utils.shashed_id(gt4py.utils.shashed_id(fingerprint), self.options_id),
+            gt4py.utils.shashed_id(self.definition_fingerprint, self.options_id),
+        )
+
+    @property
+    def ir_cache_path(self) -> pathlib.Path:
+        """Directory of the IR cache, shared by all backends."""
+        return self.python_root_path / "_ir"
+
+    def ir_key(self, kind: str) -> str:
+        """
+        Calculate the content-based key of a stencil IR.
+
+        The definition IR depends only on the definition and the stencil name, while the
+        implementation IR depends additionally on the implementation options.
+        """
+        key = gt4py.utils.shashed_id(
+            self.definition_fingerprint,
+            self.builder.options.qualified_name,
+            self.builder.frontend.name,
+            gt4py.__version__,
         )
+        if kind == "implementation_ir":
+            key = gt4py.utils.shashed_id(key, *sorted(self.builder.options._impl_opts.items()))
+        elif kind != "definition_ir":
+            raise ValueError(f"Invalid IR kind '{kind}'")
+        return key
+
+    def _ir_cache_file_path(self, kind: str) -> pathlib.Path:
+        return self.ir_cache_path / f"{kind}_{self.ir_key(kind)}.pickle"
+
+    def load_ir(self, kind: str) -> Optional[Any]:
+        ir_path = self._ir_cache_file_path(kind)
+        if not ir_path.exists():
+            return None
+        try:
+            with ir_path.open("rb") as ir_file:
+                return pickle.load(ir_file)
+        except Exception:
+            # Unreadable or outdated cache entry: rebuild it
+            return None
+
+    def store_ir(self, kind: str, ir: Any) -> None:
+        ir_path = self._ir_cache_file_path(kind)
+        try:
+            data = pickle.dumps(ir)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Not all IRs can be pickled (e.g. externals defined in local scopes)
+            return
+        try:
+            ir_path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic replacement, concurrent builds may store the same entry
+            gt4py.utils.filelock.write_atomic(ir_path, data)
+        except OSError:
+            # Read-only or full cache: the IR is only cached to speed up rebuilds
+            pass
 
     @property
     def module_prefix(self) -> str:
@@ -312,6 +531,106 @@ class JITCachingStrategy(CachingStrategy):
         return f"{name}__{self.module_postfix}"
 
 
+class LayeredCachingStrategy(JITCachingStrategy):
+    """
+    JIT caching strategy looking up stencils in read-only cache layers first.
+
+    The read-only layers are cache directories with the same layout as the JIT cache
+    (e.g. ``<GT_CACHE_ROOT>/<GT_CACHE_DIR_NAME>`` of a pre-build run), which are searched in order
+    for a stencil whose cache info is consistent. If none is found, the stencil is built in the
+    private writable cache as with the :class:`JITCachingStrategy`. Nothing is ever written into
+    the read-only layers, all new cache entries (including IRs) go to the writable cache.
+
+    Since extension modules are loaded from the path they were built at, read-only layers
+    must be accessible at the same location as during the pre-build.
+
+    Parameters
+    ----------
+    builder:
+        A stencil builder instance
+
+    read_only_roots:
+        Ordered list of read-only cache directories, defaults to the ``read_only_roots``
+        cache setting (``GT_CACHE_READ_ONLY_ROOTS`` environment variable).
+    """
+
+    name = "layered"
+
+    def __init__(
+        self,
+        builder: "StencilBuilder",
+        *,
+        read_only_roots: Optional[Sequence[Union[str, pathlib.Path]]] = None,
+    ):
+        super().__init__(builder)
+        if read_only_roots is None:
+            read_only_roots = gt4py.config.cache_settings["read_only_roots"]
+        self.read_only_roots = [pathlib.Path(root) for root in read_only_roots]
+        self._layer_roots: Dict[StencilID, pathlib.Path] = {}
+
+    @property
+    def writable_root_path(self) -> pathlib.Path:
+        """Root path of the private writable cache."""
+        return super().root_path
+
+    @property
+    def root_path(self) -> pathlib.Path:
+        """Root path of the layer providing the current stencil (selected on first access)."""
+        stencil_id = self.builder.stencil_id
+        if stencil_id not in self._layer_roots:
+            self._layer_roots[stencil_id] = self._select_layer_root(stencil_id)
+        return self._layer_roots[stencil_id]
+
+    @property
+    def is_read_only(self) -> bool:
+        """Check if the current stencil is provided by a read-only layer."""
+        return self.root_path in self.read_only_roots
+
+    @property
+    def backend_root_path(self) -> pathlib.Path:
+        if self.is_read_only:
+            return self.python_root_path / gt4py.utils.slugify(self.builder.backend.name)
+        return super().backend_root_path
+
+    @property
+    def ir_cache_path(self) -> pathlib.Path:
+        return self.writable_root_path / self.python_root_path.name / "_ir"
+
+    @property
+    def cache_index(self) -> "CacheIndex":
+        return CacheIndex(self.backend_root_path, read_only=self.is_read_only)
+
+    def update_cache_info(self) -> None:
+        assert not self.is_read_only, "Tried to write into a read-only cache layer"
+        super().update_cache_info()
+
+    def build_lock(self) -> ContextManager:
+        if self.is_read_only:
+            return contextlib.nullcontext()
+        return super().build_lock()
+
+    def load_lock(self) -> ContextManager:
+        if self.is_read_only:
+            return contextlib.nullcontext()
+        return super().load_lock()
+
+    def record_access(self) -> None:
+        if not self.is_read_only:
+            super().record_access()
+
+    def _select_layer_root(self, stencil_id: StencilID) -> pathlib.Path:
+        if not self.builder.options.rebuild:
+            validate_hash = not self.builder.options._impl_opts.get(
+                "disable-cache-validation", False
+            )
+            for root in self.read_only_roots:
+                # Tentatively select the layer to validate its cache entry
+                self._layer_roots[stencil_id] = root
+                if self.is_cache_info_available_and_consistent(validate_hash=validate_hash):
+                    return root
+        return self.writable_root_path
+
+
 class NoCachingStrategy(CachingStrategy):
     """
     Apply no caching, useful for CLI.
@@ -382,5 +701,256 @@ class NoCachingStrategy(CachingStrategy):
 def strategy_factory(
     name: str, builder: "StencilBuilder", *args: Any, **kwargs: Any
 ) -> CachingStrategy:
-    strategies = {"jit": JITCachingStrategy, "nocaching": NoCachingStrategy}
+    strategies = {
+        "jit": JITCachingStrategy,
+        "layered": LayeredCachingStrategy,
+        "nocaching": NoCachingStrategy,
+    }
     return strategies[name](builder, *args, **kwargs)
+
+
+class CacheIndex:
+    """
+    Cache info of all stencils cached for a backend, in a single SQLite database.
+
+    Entries are keyed by the path of the stencil module relative to the index directory
+    (without suffix). Every operation uses its own connection, which makes the index safe to
+    use from several threads and processes.
+
+    Parameters
+    ----------
+    path:
+        Directory of the index (the backend cache directory).
+
+    read_only:
+        Open the index in read-only mode, e.g. for read-only cache layers.
+    """
+
+    FILE_NAME = "index.sqlite"
+    TIMEOUT = 60.0
+
+    def __init__(self, path: pathlib.Path, *, read_only: bool = False):
+        self.path = path
+        self.file_path = path / self.FILE_NAME
+        self.read_only = read_only
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if self.read_only:
+            connection = sqlite3.connect(
+                f"{self.file_path.as_uri()}?mode=ro", uri=True, timeout=self.TIMEOUT
+            )
+        else:
+            connection = sqlite3.connect(str(self.file_path), timeout=self.TIMEOUT)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, last_access REAL, info BLOB)"
+            )
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.file_path.exists():
+            return None
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT last_access, info FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {**pickle.loads(row[1]), "last_access": row[0]}
+
+    def put(self, key: str, info: Dict[str, Any]) -> None:
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+                (key, info.get("last_access", time.time()), pickle.dumps(info)),
+            )
+
+    def remove(self, key: str) -> None:
+        with self._connect() as connection:
+            connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def touch(self, key: str, *, min_interval: float = 0.0) -> None:
+        """Update the last access time of an entry if older than `min_interval` seconds."""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ? AND last_access < ?",
+                (now, key, now - min_interval),
+            )
+
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        if not self.file_path.exists():
+            return
+        with self._connect() as connection:
+            rows = connection.execute("SELECT key, last_access, info FROM entries").fetchall()
+        for key, last_access, info in rows:
+            yield key, {**pickle.loads(info), "last_access": last_access}
+
+
+class CacheEntry(NamedTuple):
+    """Files of a cached stencil version (or cached IR) and their usage information."""
+
+    path: pathlib.Path
+    stem: str
+    backend: str
+    stencil_name: str
+    last_access: float
+    size: int
+    index_path: Optional[pathlib.Path] = None
+    index_key: Optional[str] = None
+
+    @property
+    def files(self) -> List[pathlib.Path]:
+        """Files and directories of the entry."""
+        if self.index_path is None:
+            return [self.path]
+        return sorted(
+            path
+            for path in self.path.parent.iterdir()
+            if (path.stem == self.stem or path.name.startswith(f"{self.stem}_pyext"))
+            and path.suffix != ".lock"
+        )
+
+
+def _disk_usage(path: pathlib.Path) -> int:
+    if path.is_dir():
+        return sum(item.stat().st_size for item in path.rglob("*") if item.is_file())
+    return path.stat().st_size
+
+
+def iter_cache_entries(path: pathlib.Path, *, recursive: bool = True) -> Iterator[CacheEntry]:
+    """
+    Find the stencil versions and IRs cached in a JIT cache directory.
+
+    Parameters
+    ----------
+    path:
+        Cache directory or any of its subdirectories containing cache indices.
+
+    recursive:
+        Search also in subdirectories.
+    """
+    if not path.exists():
+        return
+    index_paths = path.rglob(CacheIndex.FILE_NAME) if recursive else path.glob(CacheIndex.FILE_NAME)
+    for index_path in index_paths:
+        for key, cache_info in CacheIndex(index_path.parent).items():
+            module_path = index_path.parent / f"{key}.py"
+            entry = CacheEntry(
+                path=module_path,
+                stem=module_path.stem,
+                backend=cache_info.get("backend", ""),
+                stencil_name=cache_info.get("stencil_name", ""),
+                last_access=cache_info["last_access"],
+                size=0,
+                index_path=index_path.parent,
+                index_key=key,
+            )
+            try:
+                yield entry._replace(size=sum(_disk_usage(item) for item in entry.files))
+            except FileNotFoundError:
+                # Removed concurrently
+                yield entry
+    if recursive:
+        for ir_path in path.rglob("_ir/*.pickle"):
+            stat = ir_path.stat()
+            yield CacheEntry(
+                path=ir_path,
+                stem=ir_path.stem,
+                backend="",
+                stencil_name="",
+                last_access=stat.st_mtime,
+                size=stat.st_size,
+            )
+
+
+def remove_cache_entry(entry: CacheEntry) -> bool:
+    """
+    Remove all files of a cache entry, unless it is currently being built or loaded.
+
+    The index entry is removed first, which invalidates the entry for concurrent readers.
+    Lock files are kept since other processes might be waiting on them.
+
+    Returns
+    -------
+    ``True`` if the entry was removed.
+    """
+    if entry.index_path is None or entry.index_key is None:
+        entry.path.unlink(missing_ok=True)
+        return True
+    try:
+        with gt4py.utils.filelock.FileLock(entry.path.with_suffix(".lock"), timeout=0.0):
+            CacheIndex(entry.index_path).remove(entry.index_key)
+            for path in entry.files:
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+    except (TimeoutError, FileNotFoundError):
+        return False
+    return True
+
+
+def collect_garbage(
+    path: pathlib.Path,
+    *,
+    max_size: Optional[int] = None,
+    max_age: Optional[float] = None,
+    max_versions: Optional[int] = None,
+    dry_run: bool = False,
+) -> List[CacheEntry]:
+    """
+    Remove cache entries exceeding the budget of a JIT cache directory.
+
+    Parameters
+    ----------
+    path:
+        Cache directory.
+
+    max_size:
+        Maximum size in bytes, least recently used entries are removed first.
+
+    max_age:
+        Maximum time in seconds since the last access of an entry.
+
+    max_versions:
+        Maximum number of versions of the same stencil for the same backend.
+
+    dry_run:
+        Only report the entries which would be removed.
+
+    Returns
+    -------
+    The list of removed entries.
+    """
+    entries = sorted(iter_cache_entries(path), key=lambda entry: entry.last_access, reverse=True)
+    now = time.time()
+    evicted = []
+    kept = []
+    versions: Dict[pathlib.Path, int] = {}
+    for entry in entries:
+        is_stencil = entry.index_path is not None
+        if is_stencil:
+            versions[entry.path.parent] = versions.get(entry.path.parent, 0) + 1
+        if (max_age is not None and now - entry.last_access > max_age) or (
+            is_stencil and max_versions and versions[entry.path.parent] > max_versions
+        ):
+            evicted.append(entry)
+        else:
+            kept.append(entry)
+
+    if max_size is not None:
+        total_size = sum(entry.size for entry in kept)
+        while kept and total_size > max_size:
+            entry = kept.pop()
+            total_size -= entry.size
+            evicted.append(entry)
+
+    if dry_run:
+        return evicted
+    return [entry for entry in evicted if remove_cache_entry(entry)]
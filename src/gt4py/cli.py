@@ -5,7 +5,19 @@ import importlib
 import pathlib
 import sys
 from types import ModuleType
-from typing import Any, Callable, Dict, Generator, KeysView, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    KeysView,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 import click
 import tabulate
@@ -14,6 +26,7 @@ import gt4py
 from gt4py import gtscript_imports
 from gt4py.backend.base import CLIBackendMixin
 from gt4py.lazy_stencil import LazyStencil
+from gt4py.utils import perf as gt_perf
 
 
 class BackendChoice(click.Choice):
@@ -131,6 +144,29 @@ class BackendOption(click.ParamType):
         return (name, value)
 
 
+class DomainType(click.ParamType):
+    """
+    Compute domain for commandline usage.
+
+    Converts from ``"ni,nj,nk"`` strings to tuples of three positive integers.
+    """
+
+    name = "domain"
+
+    def convert(
+        self, value: Any, param: Optional[click.Parameter], ctx: Optional[click.Context]
+    ) -> Tuple[int, ...]:
+        if isinstance(value, tuple):
+            return value
+        try:
+            domain = tuple(int(item) for item in value.split(","))
+        except ValueError:
+            domain = ()
+        if len(domain) != 3 or any(length < 1 for length in domain):
+            self.fail(f'Invalid domain "{value}": must be "<ni>,<nj>,<nk>"', param, ctx)
+        return domain
+
+
 class Reporter:
     """Wrapper around click echo functions or noops depending on the `silent` constructor param."""
 
@@ -220,6 +256,8 @@ class GTScriptBuilder:
         for proto_stencil in self.iterate_stencils():
             self.reporter.echo(f"Building stencil {proto_stencil.builder.options.name}")
             builder = proto_stencil.builder.with_backend(self.backend_cls.name)
+            # generated sources are meant to be read, so they are always formatted
+            builder.with_changed_options(format_source=True)
             if build_options:
                 builder.with_changed_options(impl_opts=build_options)
             builder.with_caching("nocaching", output_path=self.output_path)
@@ -235,6 +273,103 @@ class GTScriptBuilder:
         self.reporter.echo(stencils_msg)
 
 
+class GTScriptBenchmark(GTScriptBuilder):
+    """
+    Time the stencils of a GTScript module with synthetic inputs.
+
+    Parameters
+    ----------
+    input_path :
+        path (string or Pathlike) to the GTScript module.
+
+    backends :
+        names of the backends to compare.
+
+    domain :
+        compute domain of the timed calls.
+
+    repeat :
+        number of timed calls of each stencil.
+
+    warmup :
+        number of untimed calls before the timed ones.
+
+    validate_args :
+        validate the arguments in the timed calls.
+
+    silent :
+        silence all reporting to stdout if True
+
+    """
+
+    def __init__(
+        self,
+        input_path: Union[str, pathlib.Path],
+        *,
+        backends: Sequence[str],
+        domain: Tuple[int, ...],
+        repeat: int = 10,
+        warmup: int = 2,
+        validate_args: bool = True,
+        silent: bool = False,
+    ):
+        self.reporter = Reporter(silent)
+        self.input_module = self.import_input_module(pathlib.Path(input_path))
+        self.backends = list(backends)
+        self.domain = domain
+        self.repeat = repeat
+        self.warmup = warmup
+        self.validate_args = validate_args
+
+    def time_stencils(self) -> List[Dict[str, Any]]:
+        """Build and time every stencil with every backend."""
+        results = []
+        for proto_stencil in self.iterate_stencils():
+            name = proto_stencil.builder.options.name
+            for backend_name in self.backends:
+                self.reporter.echo(f"Building stencil {name} with backend {backend_name}")
+                builder = proto_stencil.builder.with_backend(backend_name).with_caching("jit")
+                try:
+                    stencil = builder.build()()
+                except Exception as error:
+                    self.reporter.error(f"Building {name} with {backend_name} failed: {error}")
+                    continue
+                times = gt_perf.time_stencil(
+                    stencil,
+                    gt_perf.synthetic_arguments(stencil, self.domain),
+                    domain=self.domain,
+                    repeat=self.repeat,
+                    warmup=self.warmup,
+                    validate_args=self.validate_args,
+                )
+                results.append({"stencil": name, "backend": backend_name, **times})
+        return results
+
+    def report(self, results: List[Dict[str, Any]]) -> None:
+        headers = ["stencil", "backend", "median [ms]", "min [ms]", "overhead [ms]", "GB/s"]
+        reference_times: Dict[str, float] = {}
+        rows = []
+        for item in results:
+            reference_time = reference_times.setdefault(item["stencil"], item["median_time"])
+            row = [
+                item["stencil"],
+                item["backend"],
+                1e3 * item["median_time"],
+                1e3 * item["min_time"],
+                1e3 * item["overhead"],
+                item["bandwidth"] / 1e9,
+            ]
+            if len(self.backends) > 1:
+                row.append(reference_time / item["median_time"])
+            rows.append(row)
+        if len(self.backends) > 1:
+            headers.append(f"speedup vs {self.backends[0]}")
+        self.reporter.echo(
+            f"\nDomain: {self.domain}, {self.repeat} calls after {self.warmup} warmup calls\n"
+        )
+        self.reporter.echo(tabulate.tabulate(rows, headers=headers, floatfmt=".3f"))
+
+
 @click.group()
 def gtpyc() -> None:
     """
@@ -293,3 +428,165 @@ def gen(
         backend=backend,
         silent=silent,
     ).generate_stencils(build_options=dict(options))
+
+
+@gtpyc.command()
+@click.option(
+    "--backend",
+    "-b",
+    "backends",
+    type=click.Choice(BackendChoice.get_backend_names()),
+    multiple=True,
+    required=True,
+    help="Backend to time (multiple allowed, compared side by side)",
+)
+@click.option(
+    "--domain",
+    "-d",
+    default="64,64,64",
+    type=DomainType(),
+    help="Compute domain, format: -d ni,nj,nk",
+)
+@click.option("--repeat", "-r", default=10, type=click.IntRange(min=1), help="Timed calls.")
+@click.option("--warmup", "-w", default=2, type=click.IntRange(min=0), help="Untimed calls.")
+@click.option(
+    "--validate-args/--no-validate-args",
+    default=True,
+    help="Validate the arguments in the timed calls.",
+)
+@click.argument(
+    "input_path", required=True, type=click.Path(file_okay=True, dir_okay=True, exists=True)
+)
+def bench(
+    backends: Tuple[str, ...],
+    domain: Tuple[int, ...],
+    repeat: int,
+    warmup: int,
+    validate_args: bool,
+    input_path: str,
+) -> None:
+    """Time the stencils of gtscript modules with synthetic inputs."""
+    benchmark = GTScriptBenchmark(
+        input_path=input_path,
+        backends=backends,
+        domain=domain,
+        repeat=repeat,
+        warmup=warmup,
+        validate_args=validate_args,
+    )
+    benchmark.report(benchmark.time_stencils())
+
+
+def _default_cache_path() -> str:
+    settings = gt4py.config.cache_settings
+    return str(pathlib.Path(settings["root_path"]) / settings["dir_name"])
+
+
+def _format_size(size: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024 or unit == "GB":
+            break
+        size /= 1024
+    return f"{size:.1f} {unit}"
+
+
+def _parse_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+def _parse_duration(value: str) -> float:
+    units = {"S": 1, "M": 60, "H": 3600, "D": 86400}
+    value = value.strip().upper()
+    if value and value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+@gtpyc.group()
+def cache() -> None:
+    """Inspect and clean up the JIT stencil cache."""
+
+
+_cache_path_option = click.option(
+    "--path",
+    "-p",
+    "cache_path",
+    default=_default_cache_path,
+    type=click.Path(file_okay=False),
+    help="Cache directory (by default from GT_CACHE_ROOT and GT_CACHE_DIR_NAME).",
+)
+
+
+@cache.command()
+@_cache_path_option
+def stats(cache_path: str) -> None:
+    """Report the number and size of cached stencils per backend."""
+    reporter = Reporter(silent=False)
+    data: Dict[str, List[int]] = {}
+    for entry in gt4py.caching.iter_cache_entries(pathlib.Path(cache_path)):
+        item = data.setdefault(entry.backend or "(IR)", [0, 0])
+        item[0] += 1
+        item[1] += entry.size
+    rows = [[name, count, _format_size(size)] for name, (count, size) in sorted(data.items())]
+    rows.append(
+        [
+            "total",
+            sum(count for count, _ in data.values()),
+            _format_size(sum(size for _, size in data.values())),
+        ]
+    )
+    reporter.echo(f"Cache: {cache_path}\n")
+    reporter.echo(tabulate.tabulate(rows, headers=["backend", "entries", "size"]))
+
+
+@cache.command()
+@_cache_path_option
+@click.option(
+    "--max-size",
+    default=None,
+    type=str,
+    help="Size budget, e.g. 10G (default: GT_CACHE_MAX_SIZE).",
+)
+@click.option(
+    "--max-age",
+    default=None,
+    type=str,
+    help="Maximum time since the last use, in seconds or with a s/m/h/d suffix, e.g. 7d "
+    "(default: GT_CACHE_MAX_AGE, in seconds).",
+)
+@click.option(
+    "--max-versions",
+    default=None,
+    type=int,
+    help="Versions kept per stencil and backend (default: GT_CACHE_MAX_VERSIONS or unlimited).",
+)
+@click.option("--dry-run", "-n", is_flag=True, help="Only list the entries to be removed.")
+@click.option("--silent", "-s", is_flag=True, help="suppress console output")
+def gc(
+    cache_path: str,
+    max_size: Optional[str],
+    max_age: Optional[str],
+    max_versions: Optional[int],
+    dry_run: bool,
+    silent: bool,
+) -> None:
+    """Remove cache entries exceeding the cache budget, least recently used first."""
+    reporter = Reporter(silent)
+    settings = gt4py.config.cache_settings
+    evicted = gt4py.caching.collect_garbage(
+        pathlib.Path(cache_path),
+        max_size=_parse_size(max_size) if max_size is not None else settings["max_size"],
+        max_age=_parse_duration(max_age) if max_age is not None else settings["max_age"],
+        max_versions=max_versions if max_versions is not None else settings["max_versions"],
+        dry_run=dry_run,
+    )
+    for entry in evicted:
+        reporter.echo(f"{'Would remove' if dry_run else 'Removed'}: {entry.path}")
+    reporter.echo(
+        f"{len(evicted)} entries ({_format_size(sum(entry.size for entry in evicted))}) "
+        + ("would be removed." if dry_run else "removed.")
+    )
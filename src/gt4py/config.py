@@ -64,11 +64,27 @@ build_settings: Dict[str, Any] = {
     },
     "extra_link_args": [],
     "parallel_jobs": multiprocessing.cpu_count(),
+    "trace_file": os.environ.get("GT_TRACE_FILE", os.environ.get("GT_BUILD_TRACE_FILE", None)),
 }
 
 cache_settings: Dict[str, Any] = {
     "dir_name": os.environ.get("GT_CACHE_DIR_NAME", ".gt_cache"),
     "root_path": os.environ.get("GT_CACHE_ROOT", os.path.abspath(".")),
+    "lock_timeout": float(os.environ["GT_CACHE_LOCK_TIMEOUT"])
+    if "GT_CACHE_LOCK_TIMEOUT" in os.environ
+    else None,
+    "max_versions": int(os.environ["GT_CACHE_MAX_VERSIONS"])
+    if "GT_CACHE_MAX_VERSIONS" in os.environ
+    else None,
+    "max_size": int(os.environ["GT_CACHE_MAX_SIZE"]) if "GT_CACHE_MAX_SIZE" in os.environ else None,
+    "max_age": float(os.environ["GT_CACHE_MAX_AGE"]) if "GT_CACHE_MAX_AGE" in os.environ else None,
+    "keep_build_intermediates": os.environ.get("GT_CACHE_KEEP_BUILD_INTERMEDIATES", "0")
+    not in ("", "0", "false", "False"),
+    "deep_validation": os.environ.get("GT_CACHE_DEEP_VALIDATION", "0")
+    not in ("", "0", "false", "False"),
+    "read_only_roots": [
+        path for path in os.environ.get("GT_CACHE_READ_ONLY_ROOTS", "").split(os.pathsep) if path
+    ],
 }
 
 code_settings: Dict[str, Any] = {"root_package_name": "_GT_"}
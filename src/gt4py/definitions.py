@@ -656,7 +656,7 @@ class BuildOptions(AttributeClassLike):
 
     name = attribute(of=str)
     module = attribute(of=str)
-    format_source = attribute(of=bool, default=True)
+    format_source = attribute(of=bool, default=False)
     backend_opts = attribute(of=DictOf[str, Any], factory=dict)
     build_info = attribute(of=dict, optional=True)
     rebuild = attribute(of=bool, default=False)
@@ -21,8 +21,9 @@ import inspect
 import itertools
 import numbers
 import textwrap
+import threading
 import types
-from typing import List, Optional, Union
+from typing import ClassVar, Dict, List, Optional, Union
 
 import numpy as np
 
@@ -400,12 +401,27 @@ class CallInliner(ast.NodeTransformer):
     dealt with in the IRMaker.
     """
 
+    #: Process-wide cache of function ASTs with all their nested calls already inlined
+    _inlined_function_asts: ClassVar[Dict[str, ast.FunctionDef]] = {}
+
     @classmethod
     def apply(cls, func_node: ast.FunctionDef, context: dict):
         inliner = cls(context)
         inliner(func_node)
         return inliner.all_skip_names
 
+    @classmethod
+    def get_inlined_function_ast(cls, call_info: dict) -> ast.FunctionDef:
+        """Return the (shared) AST of a ``gtscript.function`` with all nested calls inlined."""
+        key = call_info.get("inlined_ast_key", None)
+        func_node = cls._inlined_function_asts.get(key, None) if key else None
+        if func_node is None:
+            func_node = copy.deepcopy(call_info["ast"])
+            cls.apply(func_node, call_info["local_context"])
+            if key:
+                func_node = cls._inlined_function_asts.setdefault(key, func_node)
+        return func_node
+
     def __init__(self, context: dict):
         self.context = context
         self.current_block = None
@@ -476,8 +492,7 @@ class CallInliner(ast.NodeTransformer):
 
         # Recursively inline any possible nested subroutine call
         call_info = self.context[call_name]._gtscript_
-        call_ast = copy.deepcopy(call_info["ast"])
-        CallInliner.apply(call_ast, call_info["local_context"])
+        call_ast = copy.deepcopy(CallInliner.get_inlined_function_ast(call_info))
 
         # Extract call arguments
         call_signature = call_info["api_signature"]
@@ -573,6 +588,11 @@ class CallInliner(ast.NodeTransformer):
                     )
                 )
 
+        # Attribute the inlined statements to the call site in the stencil definition
+        for stmt_node in ast.walk(call_ast):
+            if isinstance(stmt_node, ast.stmt):
+                ast.copy_location(stmt_node, node)
+
         # Add inlined statements to the current block and return name node with the result
         inlined_stmts.extend(call_ast.body)
         self.current_block.extend(inlined_stmts)
@@ -1094,6 +1114,7 @@ class IRMaker(ast.NodeVisitor):
                 condition=gt_ir.utils.make_expr(self.visit(node.test)),
                 main_body=gt_ir.BlockStmt(stmts=main_stmts),
                 else_body=gt_ir.BlockStmt(stmts=else_stmts) if else_stmts else None,
+                loc=gt_ir.Location.from_ast_node(node),
             )
         )
 
@@ -1177,8 +1198,9 @@ class IRMaker(ast.NodeVisitor):
             value = [gt_ir.utils.make_expr(item) for item in value]
 
         assert len(target) == len(value)
+        loc = gt_ir.Location.from_ast_node(node)
         for left, right in zip(target, value):
-            result.append(gt_ir.Assign(target=left, value=right))
+            result.append(gt_ir.Assign(target=left, value=right, loc=loc))
 
         return result
 
@@ -1286,6 +1308,9 @@ class GTScriptParser(ast.NodeVisitor):
         gtscript._AxisOffset,
     )
 
+    #: Process-wide cache of parsed and value-inlined ``gtscript.function`` ASTs
+    _prepared_function_asts: ClassVar[Dict[str, ast.FunctionDef]] = {}
+
     def __init__(self, definition, *, options, externals=None):
         assert isinstance(definition, types.FunctionType)
         self.definition = definition
@@ -1521,6 +1546,64 @@ class GTScriptParser(ast.NodeVisitor):
 
         return result
 
+    @staticmethod
+    def prepared_ast_key(func, local_context: dict) -> str:
+        """Key of a ``gtscript.function`` AST after inlining the values of its local context."""
+        context_fingerprint = {
+            name: value._gtscript_["canonical_ast"]
+            if hasattr(value, "_gtscript_")
+            else (type(value).__name__, value)
+            for name, value in local_context.items()
+        }
+        return gt_utils.shashed_id(
+            func._gtscript_["qualified_name"],
+            func._gtscript_["canonical_ast"],
+            func.__code__.co_lnotab,  # source locations are part of the AST
+            context_fingerprint,
+            length=None,
+        )
+
+    @classmethod
+    def prepare_function_ast(cls, func, local_context: dict) -> ast.FunctionDef:
+        """Parse a ``gtscript.function`` and inline the values of its local context.
+
+        Results are memoized in a process-wide cache, so the returned AST is shared
+        and must not be modified in place.
+        """
+        key = cls.prepared_ast_key(func, local_context)
+        func_node = cls._prepared_function_asts.get(key, None)
+        if func_node is None:
+            func_node = ast.parse(gt_meta.get_ast(func)).body[0]
+            ValueInliner.apply(func_node, context=local_context)
+            func_node = cls._prepared_function_asts.setdefault(key, func_node)
+        func._gtscript_["ast_key"] = key
+        return func_node
+
+    @staticmethod
+    def inlined_ast_key(func) -> Optional[str]:
+        """Key of a prepared ``gtscript.function`` AST after inlining all nested calls.
+
+        It depends on the prepared ASTs of all the functions reachable from its local context.
+        Returns ``None`` if any of them has not been prepared.
+        """
+        reachable_keys = set()
+        visited = set()
+        pending = [func]
+        while pending:
+            value = pending.pop()
+            if id(value) in visited:
+                continue
+            visited.add(id(value))
+            info = value._gtscript_
+            if "ast_key" not in info or "local_context" not in info:
+                return None
+            reachable_keys.add(info["ast_key"])
+            pending.extend(
+                item for item in info["local_context"].values() if hasattr(item, "_gtscript_")
+            )
+
+        return gt_utils.shashed_id(func._gtscript_["ast_key"], sorted(reachable_keys), length=None)
+
     def extract_arg_descriptors(self):
         api_signature = self.definition._gtscript_["api_signature"]
         api_annotations = self.definition._gtscript_["api_annotations"]
@@ -1610,19 +1693,21 @@ class GTScriptParser(ast.NodeVisitor):
         api_signature, fields_decls, parameter_decls = self.extract_arg_descriptors()
 
         # Inline constant values
-        for name, value in self.resolved_externals.items():
-            if hasattr(value, "_gtscript_"):
-                assert callable(value)
-                func_node = ast.parse(gt_meta.get_ast(value)).body[0]
-                local_context = self.resolve_external_symbols(
-                    value._gtscript_["nonlocals"],
-                    value._gtscript_["imported"],
-                    self.external_context,
-                    exhaustive=False,
-                )
-                ValueInliner.apply(func_node, context=local_context)
-                value._gtscript_["ast"] = func_node
-                value._gtscript_["local_context"] = local_context
+        functions = [
+            value for value in self.resolved_externals.values() if hasattr(value, "_gtscript_")
+        ]
+        for value in functions:
+            assert callable(value)
+            local_context = self.resolve_external_symbols(
+                value._gtscript_["nonlocals"],
+                value._gtscript_["imported"],
+                self.external_context,
+                exhaustive=False,
+            )
+            value._gtscript_["ast"] = self.prepare_function_ast(value, local_context)
+            value._gtscript_["local_context"] = local_context
+        for value in functions:
+            value._gtscript_["inlined_ast_key"] = self.inlined_ast_key(value)
 
         local_context = self.resolve_external_symbols(
             self.definition._gtscript_["nonlocals"],
@@ -1674,18 +1759,26 @@ class GTScriptParser(ast.NodeVisitor):
 class GTScriptFrontend(gt_frontend.Frontend):
     name = "gtscript"
 
+    #: Lock serializing the frontend in the whole process, since ``gtscript.function`` objects
+    #: shared between definitions are annotated in place with the state of the current build
+    _lock: ClassVar[threading.RLock] = threading.RLock()
+
     @classmethod
     def get_stencil_id(cls, qualified_name, definition, externals, options_id):
-        cls.prepare_stencil_definition(definition, externals or {})
-        fingerprint = {
-            "__main__": definition._gtscript_["canonical_ast"],
-            "docstring": inspect.getdoc(definition),
-            "api_annotations": f"[{', '.join(str(item) for item in definition._gtscript_['api_annotations'])}]",
-        }
-        for name, value in definition._gtscript_["externals"].items():
-            fingerprint[name] = (
-                value._gtscript_["canonical_ast"] if hasattr(value, "_gtscript_") else value
+        with cls._lock:
+            cls.prepare_stencil_definition(definition, externals or {})
+            api_annotations = ", ".join(
+                str(item) for item in definition._gtscript_["api_annotations"]
             )
+            fingerprint = {
+                "__main__": definition._gtscript_["canonical_ast"],
+                "docstring": inspect.getdoc(definition),
+                "api_annotations": f"[{api_annotations}]",
+            }
+            for name, value in definition._gtscript_["externals"].items():
+                fingerprint[name] = (
+                    value._gtscript_["canonical_ast"] if hasattr(value, "_gtscript_") else value
+                )
 
         definition_id = gt_utils.shashed_id(fingerprint)
         version = gt_utils.shashed_id(definition_id, options_id)
@@ -1695,16 +1788,18 @@ class GTScriptFrontend(gt_frontend.Frontend):
 
     @classmethod
     def prepare_stencil_definition(cls, definition, externals):
-        GTScriptParser.annotate_definition(definition)
-        resolved_externals = GTScriptParser.resolve_external_symbols(
-            definition._gtscript_["nonlocals"], definition._gtscript_["imported"], externals
-        )
-        definition._gtscript_["externals"] = resolved_externals
+        with cls._lock:
+            GTScriptParser.annotate_definition(definition)
+            resolved_externals = GTScriptParser.resolve_external_symbols(
+                definition._gtscript_["nonlocals"], definition._gtscript_["imported"], externals
+            )
+            definition._gtscript_["externals"] = resolved_externals
         return definition
 
     @classmethod
     def generate(cls, definition, externals, options):
-        if not hasattr(definition, "_gtscript_"):
-            cls.prepare_stencil_definition(definition, externals)
-        translator = GTScriptParser(definition, externals=externals, options=options)
-        return translator.run()
+        with cls._lock:
+            if not hasattr(definition, "_gtscript_"):
+                cls.prepare_stencil_definition(definition, externals)
+            translator = GTScriptParser(definition, externals=externals, options=options)
+            return translator.run()
@@ -122,7 +122,7 @@ def stencil(
     build_info=None,
     dtypes=None,
     externals=None,
-    format_source=True,
+    format_source=False,
     name=None,
     rebuild=False,
     **kwargs,
@@ -134,7 +134,9 @@ def stencil(
     Parameters
     ----------
         backend : `str`
-            Name of the implementation backend.
+            Name of the implementation backend, or ``"auto"`` to dispatch every call to
+            the fastest variant recorded by :func:`gt4py.autotune.autotune`
+            (see :class:`gt4py.autotune.AutoStencil`).
 
         definition : `None` when used as a decorator, otherwise a `function` or a `:class:`gt4py.StencilObject`
             Function object defining the stencil.
@@ -150,7 +152,9 @@ def stencil(
             Specify values for otherwise unbound symbols.
 
         format_source : `bool`, optional
-            Format generated sources when possible (`True` by default).
+            Format generated sources when possible (`False` by default).
+            Formatting is only useful for inspecting the generated code and
+            can take longer than the code generation itself.
 
         name : `str`, optional
             The fully qualified name of the generated :class:`StencilObject`.
@@ -182,6 +186,7 @@ def stencil(
 
     """
 
+    from gt4py import autotune as gt_autotune
     from gt4py import loader as gt_loader
 
     if build_info is not None and not isinstance(build_info, dict):
@@ -233,6 +238,19 @@ def stencil(
             elif callable(definition_func):  # General callable
                 definition_func = definition_func.__call__
 
+        if backend == gt_autotune.AUTO_BACKEND_NAME:
+            return gt_autotune.AutoStencil(
+                definition_func,
+                build_info=build_info,
+                dtypes=dtypes,
+                externals=externals,
+                format_source=format_source,
+                name=f"{module}.{name or definition_func.__name__}",
+                rebuild=rebuild,
+                **kwargs,
+                **_impl_opts,
+            )
+
         _, original_annotations = _set_arg_dtypes(definition_func, dtypes or {})
         out = gt_loader.gtscript_loader(
             definition_func,
@@ -260,6 +278,7 @@ def lazy_stencil(
     rebuild=False,
     eager=False,
     check_syntax=True,
+    background=False,
     **kwargs,
 ):
     """
@@ -298,6 +317,11 @@ def lazy_stencil(
         check_syntax: `bool`, default=True, optional
             If true, build and cache the IR build stage already, which checks stencil definition syntax.
 
+        background: `bool`, default=False, optional
+            If true, start building the stencil right away in a background thread. The first
+            call waits for the build to finish (see also :func:`gt4py.wait_all`). Syntax errors
+            are raised at that point instead of by the decorator.
+
         **kwargs: `dict`, optional
             Extra backend-specific options. Check the specific backend
             documentation for further information.
@@ -309,8 +333,12 @@ def lazy_stencil(
             Defers the generation step until the last moment and allows syntax checking independently.
             Also gives access to a more fine grained generate / build process.
     """
+    from gt4py import backend as gt_backend
     from gt4py import frontend
 
+    if isinstance(backend, str):
+        backend = gt_backend.from_name(backend)
+
     def _decorator(func):
         _set_arg_dtypes(func, dtypes or {})
         options = gt_definitions.BuildOptions(
@@ -327,6 +355,8 @@ def lazy_stencil(
         )
         if eager:
             stencil = stencil.implementation
+        elif background:
+            stencil.start_build()
         elif check_syntax:
             stencil.check_syntax()
         return stencil
@@ -173,7 +173,9 @@ Implementation IR
 import collections
 import copy
 import enum
+import inspect
 import operator
+import types
 from typing import List
 
 import numpy as np
@@ -867,20 +869,50 @@ def iter_attributes(node: Node):
             pass
 
 
-class IRNodeVisitor:
+class _DispatchCacheMixin:
+    """Cache the visitor function resolved for each node class (per visitor class).
+
+    Visitor methods are looked up along the node class ``__mro__`` only the first time
+    a node class is visited, so they should not be added to a visitor class after use.
+    """
+
+    _dispatch_cache_: dict = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._dispatch_cache_ = {}
+
+    @classmethod
+    def _get_visitor(cls, node_class: type):
+        try:
+            return cls._dispatch_cache_[node_class]
+        except KeyError:
+            pass
+
+        method_name = "generic_visit"
+        if issubclass(node_class, Node):
+            for base in node_class.__mro__:
+                if hasattr(cls, "visit_" + base.__name__):
+                    method_name = "visit_" + base.__name__
+                    break
+
+        visitor = inspect.getattr_static(cls, method_name)
+        if not isinstance(visitor, types.FunctionType):
+            # Static methods, class methods or other descriptors are resolved at call time
+            visitor = lambda self, *args, **kwargs: getattr(self, method_name)(  # noqa: E731
+                *args, **kwargs
+            )
+        cls._dispatch_cache_[node_class] = visitor
+
+        return visitor
+
+
+class IRNodeVisitor(_DispatchCacheMixin):
     def visit(self, node: Node, **kwargs):
         return self._visit(node, **kwargs)
 
     def _visit(self, node: Node, **kwargs):
-        visitor = self.generic_visit
-        if isinstance(node, Node):
-            for node_class in node.__class__.__mro__:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
-
-        return visitor(node, **kwargs)
+        return self._get_visitor(node.__class__)(self, node, **kwargs)
 
     def generic_visit(self, node: Node, **kwargs):
         items = []
@@ -899,20 +931,12 @@ class IRNodeVisitor:
             self._visit(value, **kwargs)
 
 
-class IRNodeInspector:
+class IRNodeInspector(_DispatchCacheMixin):
     def visit(self, node: Node):
         return self._visit((), None, node)
 
     def _visit(self, path: tuple, node_name: str, node):
-        visitor = self.generic_visit
-        if isinstance(node, Node):
-            for node_class in node.__class__.__mro__:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
-
-        return visitor(path, node_name, node)
+        return self._get_visitor(node.__class__)(self, path, node_name, node)
 
     def generic_visit(self, path: tuple, node_name: str, node: Node):
         items = []
@@ -931,21 +955,13 @@ class IRNodeInspector:
             self._visit((*path, node_name), key, value)
 
 
-class IRNodeMapper:
+class IRNodeMapper(_DispatchCacheMixin):
     def visit(self, node: Node):
         keep_node, new_node = self._visit((), None, node)
         return new_node if keep_node else None
 
     def _visit(self, path: tuple, node_name: str, node: Node):
-        visitor = self.generic_visit
-        if isinstance(node, Node):
-            for node_class in node.__class__.__mro__:
-                method_name = "visit_" + node_class.__name__
-                if hasattr(self, method_name):
-                    visitor = getattr(self, method_name)
-                    break
-
-        return visitor(path, node_name, node)
+        return self._get_visitor(node.__class__)(self, path, node_name, node)
 
     def generic_visit(self, path: tuple, node_name: str, node: Node):
         if isinstance(node, (str, bytes, bytearray)):
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 """Stencil Object that allows for deferred building."""
-from typing import TYPE_CHECKING, Any, Dict
+import asyncio
+import concurrent.futures
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
-from cached_property import cached_property
+from gt4py import config as gt_config
 
 
 if TYPE_CHECKING:
@@ -20,14 +23,22 @@ class LazyStencil:
     This is done by keeping a reference to a :py:class:`gt4py.stencil_builder.StencilBuilder`
     instance.
 
-    Compilation happens implicitly on first access to the `implementation` property.
-    Low-level build utilities are accessible through the public :code:`builder` attribute.
+    Compilation happens implicitly on first access to the `implementation` property, unless
+    it was started in the background before (see :py:meth:`start_build`), in which case the
+    first access waits for it to finish.
+    Low-level build utilities are accessible through the public :code:`builder` attribute,
+    they should not be used while a background build is running.
     """
 
-    def __init__(self, builder: "StencilBuilder"):
+    def __init__(self, builder: "StencilBuilder", *, background: bool = False):
         self.builder = builder
+        self._lock = threading.Lock()
+        self._implementation: Optional["StencilObject"] = None
+        self._future: Optional[concurrent.futures.Future] = None
+        if background:
+            self.start_build()
 
-    @cached_property
+    @property
     def implementation(self) -> "StencilObject":
         """
         Expose the compiled backend-specific python callable which executes the stencil.
@@ -35,8 +46,51 @@ class LazyStencil:
         Compilation happens at first access, the result is cached and should consecutively be
         accessible without overhead (not rigorously tested / benchmarked).
         """
-        impl = self.builder.build()()
-        return impl
+        if self._implementation is None:
+            future = self._future
+            if future is not None:
+                self._implementation = future.result()
+            else:
+                with self._lock:
+                    if self._implementation is None:
+                        self._implementation = self._build()
+        return self._implementation
+
+    @property
+    def is_built(self) -> bool:
+        """Check if the stencil has been built (without triggering or waiting for a build)."""
+        return self._implementation is not None or (
+            self._future is not None and self._future.done() and not self._future.exception()
+        )
+
+    def start_build(self) -> concurrent.futures.Future:
+        """
+        Start building the stencil in the background, if not already started.
+
+        Builds run in a thread pool shared by all lazy stencils, with up to
+        ``build_settings["parallel_jobs"]`` concurrent builds, although the frontend phase
+        (parsing and inlining) runs for one build at a time. Build errors are raised when
+        the stencil is used.
+
+        Returns
+        -------
+        A future resolving to the compiled stencil object.
+        """
+        with self._lock:
+            if self._future is None:
+                if self._implementation is not None:
+                    self._future = concurrent.futures.Future()
+                    self._future.set_result(self._implementation)
+                else:
+                    self._future = _submit_build(self._build)
+            return self._future
+
+    async def build_async(self) -> "StencilObject":
+        """Build the stencil in the background and wait for it without blocking the event loop."""
+        return await asyncio.wrap_future(self.start_build())
+
+    def _build(self) -> "StencilObject":
+        return self.builder.build()()
 
     @property
     def backend(self) -> "Backend":
@@ -64,3 +118,50 @@ class LazyStencil:
     def run(self, *args: Any, **kwargs: Any) -> None:
         """Pass through to the implementation.run."""
         self.implementation.run(*args, **kwargs)
+
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+# Insertion ordered, to report build errors in submission order
+_pending_builds: Dict[concurrent.futures.Future, None] = {}
+_executor_lock = threading.Lock()
+
+
+def _submit_build(build_func: Any) -> concurrent.futures.Future:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=gt_config.build_settings["parallel_jobs"],
+                thread_name_prefix="gt4py_build",
+            )
+        future = _executor.submit(build_func)
+        _pending_builds[future] = None
+    return future
+
+
+def wait_all(timeout: Optional[float] = None) -> None:
+    """
+    Wait for all background stencil builds started since the last call to finish.
+
+    Parameters
+    ----------
+    timeout:
+        Maximum waiting time in seconds (``None`` waits forever).
+
+    Raises
+    ------
+    :py:class:`TimeoutError`
+        If the builds did not finish within `timeout` seconds.
+
+    Any exception raised by a failed build (the first one submitted).
+    """
+    with _executor_lock:
+        futures = list(_pending_builds)
+    _, not_done = concurrent.futures.wait(futures, timeout=timeout)
+    if not_done:
+        raise TimeoutError(f"{len(not_done)} stencil builds did not finish in time")
+    with _executor_lock:
+        for future in futures:
+            _pending_builds.pop(future, None)
+    for future in futures:
+        future.result()
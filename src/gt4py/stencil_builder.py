@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
+import contextlib
 import pathlib
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, Optional, Type, Union
 
 import gt4py
+from gt4py import utils as gt_utils
 from gt4py.definitions import BuildOptions, StencilID
 from gt4py.type_hints import AnnotatedStencilFunc, StencilFunc
 
@@ -57,18 +61,49 @@ class StencilBuilder:
             backend(self) if backend else gt4py.backend.from_name("debug")(self)
         )
         self.frontend: "FrontendType" = frontend or gt4py.frontend.from_name("gtscript")
-        self.caching = gt4py.caching.strategy_factory("jit", self)
+        self.caching = gt4py.caching.strategy_factory(
+            "layered" if gt4py.config.cache_settings["read_only_roots"] else "jit", self
+        )
         self._build_data: Dict[str, Any] = {}
         self._externals: Dict[str, Any] = {}
 
+    #: Locks serializing builds of the same definition function, which is annotated in place
+    _definition_locks: "weakref.WeakKeyDictionary[Any, threading.RLock]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _definition_locks_lock = threading.Lock()
+
+    @property
+    def definition_lock(self) -> threading.RLock:
+        """Lock to be held while building (e.g. from background threads) from the definition."""
+        with self._definition_locks_lock:
+            return self._definition_locks.setdefault(self._definition, threading.RLock())
+
     def build(self) -> Type["StencilObject"]:
         """Generate, compile and/or load everything necessary to provide a usable stencil class."""
-        # load or generate
-        stencil_class = None if self.options.rebuild else self.backend.load()
-        if stencil_class is None:
-            stencil_class = self.backend.generate()
+        with self.definition_lock, self.build_phase("build"):
+            # load or generate
+            stencil_class = None
+            if not self.options.rebuild:
+                with self.build_phase("load"):
+                    stencil_class = self.backend.load()
+            if stencil_class is None:
+                with contextlib.ExitStack() as stack:
+                    with self.build_phase("lock_wait"):
+                        stack.enter_context(self.caching.build_lock())
+                    # Another process might have built the stencil while waiting for the lock
+                    if not self.options.rebuild:
+                        stencil_class = self.backend.load()
+                    if stencil_class is None:
+                        with self.build_phase("generate"):
+                            stencil_class = self.backend.generate()
+                        self.caching.evict_stale_versions()
         return stencil_class
 
+    def build_phase(self, name: str) -> ContextManager[Dict[str, Any]]:
+        """Time a build phase, recording it into the build info (if requested)."""
+        return gt_utils.timing.build_phase(name, self.options.build_info)
+
     def generate_computation(self) -> Dict[str, Union[str, Dict]]:
         """Generate the stencil source code, fail if backend does not support CLI."""
         return self.cli_backend.generate_computation()
@@ -125,7 +160,7 @@ class StencilBuilder:
         self.options = BuildOptions(name=name, module=module, **kwargs)  # type: ignore
         return self
 
-    def with_changed_options(self: "StencilBuilder", **kwargs: Dict[str, Any]) -> "StencilBuilder":
+    def with_changed_options(self: "StencilBuilder", **kwargs: Any) -> "StencilBuilder":
         old_options = self.options.as_dict()
         # BuildOptions constructor expects ``impl_opts`` keyword
         # but BuildOptions.as_dict outputs ``_impl_opts`` key
@@ -212,7 +247,10 @@ class StencilBuilder:
 
     @property
     def stencil_id(self) -> StencilID:
-        return self._build_data.setdefault("id", self.caching.stencil_id)
+        if "id" not in self._build_data:
+            with self.build_phase("fingerprint"):
+                self._build_data["id"] = self.caching.stencil_id
+        return self._build_data["id"]
 
     @property
     def root_pkg_name(self) -> str:
@@ -236,17 +274,48 @@ class StencilBuilder:
     def pkg_path(self) -> pathlib.Path:
         return self.caching.backend_root_path.joinpath(*self.options.qualified_name.split("."))
 
+    def _load_cached_ir(self, kind: str) -> Optional[Any]:
+        """Load the IR from the cache (unless rebuilding) and record hit or miss in build info."""
+        ir = None
+        if not self.options.rebuild:
+            with self.build_phase(f"ir_cache.{kind}"):
+                ir = self.caching.load_ir(kind)
+        if self.options.build_info is not None:
+            self.options.build_info.setdefault("ir_cache", {})[kind] = (
+                "miss" if ir is None else "hit"
+            )
+        return ir
+
     @property
     def definition_ir(self) -> "StencilDefinition":
-        return self._build_data.get("ir") or self._build_data.setdefault(
-            "ir", self.frontend.generate(self.definition, self.externals, self.options)
-        )
+        if "ir" not in self._build_data:
+            definition_ir = self._load_cached_ir("definition_ir")
+            if definition_ir is None:
+                with self.build_phase("frontend"):
+                    definition_ir = self.frontend.generate(
+                        self.definition, self.externals, self.options
+                    )
+                self.caching.store_ir("definition_ir", definition_ir)
+            self._build_data["ir"] = definition_ir
+        return self._build_data["ir"]
 
     @property
     def implementation_ir(self) -> "StencilImplementation":
-        return self._build_data.get("iir") or self._build_data.setdefault(
-            "iir", gt4py.analysis.transform(self.definition_ir, self.options)
-        )
+        if "iir" not in self._build_data:
+            cached = self._load_cached_ir("implementation_ir")
+            if cached is None:
+                transformer = gt4py.analysis.transformer.IRTransformer()
+                implementation_ir = transformer(self.definition_ir, self.options)
+                symbol_info = transformer.transform_data.symbols
+                self.caching.store_ir("implementation_ir", (implementation_ir, symbol_info))
+            else:
+                implementation_ir, symbol_info = cached
+                if self.options.build_info is not None:
+                    self.options.build_info["def_ir"] = self.definition_ir
+                    self.options.build_info["iir"] = implementation_ir
+                    self.options.build_info["symbol_info"] = symbol_info
+            self._build_data["iir"] = implementation_ir
+        return self._build_data["iir"]
 
     @property
     def module_name(self) -> str:
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 import abc
+import inspect
 import sys
 import time
 import warnings
+from typing import Any, Dict, List, Optional, Sequence, TextIO
 
 import numpy as np
 
 import gt4py.backend as gt_backend
 import gt4py.storage as gt_storage
+from gt4py.analysis import metrics as gt_metrics
 from gt4py.definitions import (
     AccessKind,
     Boundary,
@@ -19,6 +22,8 @@ from gt4py.definitions import (
     normalize_domain,
     normalize_origin_mapping,
 )
+from gt4py.utils import perf as gt_perf
+from gt4py.utils import timing as gt_timing
 
 
 class StencilObject(abc.ABC):
@@ -74,6 +79,12 @@ class StencilObject(abc.ABC):
     #   _gt_id_ (stencil_id.version)
     #   definition_func
 
+    #: Run time accumulated per source line of the definition (set by profiling backends)
+    _gt_profile_: Optional[Dict[str, Any]] = None
+
+    #: Memory traffic and FLOP cost expressions (see :mod:`gt4py.analysis.metrics`)
+    _gt_metrics_: Optional[Dict[str, List[gt_metrics.CostTerm]]] = None
+
     @property
     @abc.abstractmethod
     def backend(self) -> str:
@@ -117,6 +128,121 @@ class StencilObject(abc.ABC):
     def __call__(self, *args, **kwargs):
         pass
 
+    def clear_computation_cache(self) -> None:
+        """Release the resources (e.g. temporaries) kept by the backend between stencil calls."""
+        pass
+
+    def metrics(self, domain: Sequence[int]) -> Dict[str, int]:
+        """Return the minimum bytes read and written and the FLOP count of a call on `domain`.
+
+        See :mod:`gt4py.analysis.metrics` for the details of the model.
+        """
+        if self._gt_metrics_ is None:
+            raise RuntimeError(f"Stencil '{self.options['name']}' has no metrics information")
+        return gt_metrics.evaluate_metrics(self._gt_metrics_, domain)
+
+    def profile_report(self, max_lines: int = 10, *, file: Optional[TextIO] = None) -> None:
+        """Print the lines of the stencil definition with the largest accumulated run time.
+
+        Only available for stencils generated with the `profile` backend option.
+        Statements inlined from `gtscript.function` calls are attributed to the call site.
+        """
+        profile = type(self)._gt_profile_
+        if profile is None:
+            raise RuntimeError(
+                f"Stencil '{self.options['name']}' has not been generated with profiling "
+                f"enabled (backend '{self.backend}' with backend option 'profile=True')"
+            )
+
+        try:
+            source_lines, first_line = inspect.getsourcelines(self.definition_func)
+            file_name = inspect.getsourcefile(self.definition_func)
+        except (OSError, TypeError):
+            source_lines, first_line, file_name = [], 1, "<unknown>"
+        # Line numbers are relative to the 'def' statement (see gt_meta.split_def_decorators)
+        def_index = next(
+            (i for i, line in enumerate(source_lines) if line.lstrip().startswith("def ")), 0
+        )
+
+        times = profile["times"]
+        total_time = sum(times.values())
+        print(
+            f"Profile of '{self.options['module']}.{self.options['name']}' "
+            f"[backend=\"{self.backend}\"]: {profile['ncalls']} calls, {total_time:.6f} s",
+            file=file,
+        )
+        print(f"{'time [s]':>12} {'%':>6}  {'line':>6}  source", file=file)
+        for line, line_time in sorted(times.items(), key=lambda item: -item[1])[:max_lines]:
+            index = def_index + line - 1
+            if line > 0 and index < len(source_lines):
+                location = first_line + index
+                source = source_lines[index].strip()
+            else:
+                location, source = "?", "<unknown>"
+            percent = 100.0 * line_time / total_time if total_time > 0.0 else 0.0
+            print(f"{line_time:12.6f} {percent:6.2f}  {location:>6}  {source}", file=file)
+        print(f"(source: {file_name})", file=file)
+
+    def _record_exec_info(self, exec_info: Dict[str, Any]) -> None:
+        """Update the performance statistics after a call (called by subclasses).
+
+        Statistics are aggregated in `exec_info` if it contains the magic key
+        '__aggregate_data', and in the :mod:`gt4py.utils.perf` registry if it is enabled.
+        The call is also recorded as trace events if tracing is enabled
+        (see :mod:`gt4py.utils.timing`).
+        """
+        if exec_info.setdefault("__aggregate_data", False):
+            stencil_info = exec_info.setdefault(type(self).__name__, {})
+
+            stencil_info["call_start_time"] = exec_info["call_start_time"]
+            stencil_info["call_end_time"] = exec_info["call_end_time"]
+            stencil_info["call_time"] = exec_info["call_end_time"] - exec_info["call_start_time"]
+            stencil_info["total_call_time"] = (
+                stencil_info.get("total_call_time", 0.0) + stencil_info["call_time"]
+            )
+            stencil_info["ncalls"] = stencil_info.get("ncalls", 0) + 1
+            stencil_info["run_time"] = exec_info["run_end_time"] - exec_info["run_start_time"]
+            stencil_info["total_run_time"] = (
+                stencil_info.get("total_run_time", 0.0) + stencil_info["run_time"]
+            )
+            if "run_cpp_start_time" in exec_info:
+                stencil_info["run_cpp_time"] = (
+                    exec_info["run_cpp_end_time"] - exec_info["run_cpp_start_time"]
+                )
+                stencil_info["total_run_cpp_time"] = (
+                    stencil_info.get("total_run_cpp_time", 0.0) + stencil_info["run_cpp_time"]
+                )
+            if "computation_cache_hit" in exec_info:
+                stencil_info["computation_cache_hits"] = stencil_info.get(
+                    "computation_cache_hits", 0
+                ) + int(exec_info["computation_cache_hit"])
+
+        if gt_perf.is_enabled():
+            gt_perf.record(self, exec_info)
+        if gt_timing.is_trace_enabled():
+            self._trace_exec_info(exec_info)
+
+    def _trace_exec_info(self, exec_info: Dict[str, Any]) -> None:
+        name = f"{self.options['module']}.{self.options['name']}"
+        args = {"backend": self.backend, "domain": list(exec_info["domain"])}
+        gt_timing.add_trace_event(
+            name, "stencil", exec_info["call_start_time"], exec_info["call_end_time"], args
+        )
+        gt_timing.add_trace_event(
+            "validation", "stencil", exec_info["call_run_start_time"], exec_info["run_start_time"]
+        )
+        gt_timing.add_trace_event(
+            "run", "stencil", exec_info["run_start_time"], exec_info["run_end_time"]
+        )
+        if "run_cpp_start_time" in exec_info:
+            # C++ timestamps are taken from the system clock
+            gt_timing.add_trace_event(
+                "run_cpp",
+                "stencil",
+                gt_timing.from_wall_time(exec_info["run_cpp_start_time"]),
+                gt_timing.from_wall_time(exec_info["run_cpp_end_time"]),
+            )
+
     def _get_max_domain(self, field_args, origin):
         """Return the maximum domain size possible
 
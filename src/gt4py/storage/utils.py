@@ -14,8 +14,10 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import functools
 import math
 import numbers
+import time
 
 import numpy as np
 
@@ -108,6 +110,27 @@ def strides_from_padded_shape(padded_size, order_idx, itemsize):
     return list(strides)
 
 
+def _traced_allocation(allocate_func):
+    """Record the storage allocations made by `allocate_func` as trace events."""
+
+    @functools.wraps(allocate_func)
+    def _wrapper(default_origin, shape, layout_map, dtype, alignment_bytes):
+        if not gt_util.timing.is_trace_enabled():
+            return allocate_func(default_origin, shape, layout_map, dtype, alignment_bytes)
+        start = time.perf_counter()
+        result = allocate_func(default_origin, shape, layout_map, dtype, alignment_bytes)
+        gt_util.timing.add_trace_event(
+            allocate_func.__name__,
+            "storage",
+            start,
+            time.perf_counter(),
+            {"shape": list(shape), "dtype": str(np.dtype(dtype))},
+        )
+        return result
+
+    return _wrapper
+
+
 def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f):
     dtype = np.dtype(dtype)
     assert (
@@ -144,6 +167,7 @@ def allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate
     return raw_buffer, field
 
 
+@_traced_allocation
 def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_bytes):
     dtype = np.dtype(dtype)
     assert (
@@ -193,6 +217,7 @@ def allocate_gpu_unmanaged(default_origin, shape, layout_map, dtype, alignment_b
     return raw_buffer, field, device_raw_buffer, device_field
 
 
+@_traced_allocation
 def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     def allocate_f(size, dtype):
         raw_buffer = np.empty(size, dtype)
@@ -201,6 +226,7 @@ def allocate_cpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     return allocate(default_origin, shape, layout_map, dtype, alignment_bytes, allocate_f)
 
 
+@_traced_allocation
 def allocate_gpu(default_origin, shape, layout_map, dtype, alignment_bytes):
     def allocate_f(size, dtype):
         cp.cuda.set_allocator(cp.cuda.malloc_managed)
@@ -20,4 +20,4 @@ from .base import *
 
 # isort: on
 
-from . import attrib, meta, text
+from . import attrib, filelock, meta, perf, text, timing
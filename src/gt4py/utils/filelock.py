@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""File locks and atomic file publication for caches shared between processes."""
+
+import os
+import pathlib
+import shutil
+import threading
+import time
+from typing import Dict, Optional, Union
+
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None  # type: ignore
+
+
+class _LockState:
+    def __init__(self) -> None:
+        self.thread_lock = threading.RLock()
+        self.fd: Optional[int] = None
+        self.depth = 0
+        self.shared = False
+
+
+class FileLock:
+    """Exclusive or shared lock, between processes and threads, based on a lock file.
+
+    The lock is reentrant within a thread. Inter-process locking relies on POSIX advisory
+    record locks (:func:`fcntl.lockf`), which are released by the operating system if the
+    holding process dies and are supported by NFS. On platforms without :mod:`fcntl` only
+    threads of the same process are synchronized.
+
+    Shared locks of different processes do not exclude each other, only exclusive locks.
+    Within a process, threads are always serialized.
+
+    Parameters
+    ----------
+    path:
+        Path of the lock file, created if it does not exist. The file is never removed
+        since other processes might be waiting on it.
+
+    shared:
+        Take a shared (read) lock instead of an exclusive one. If the lock file can not be
+        created (e.g. on a read-only filesystem), only threads of the same process are
+        synchronized.
+
+    timeout:
+        Maximum waiting time in seconds (``None`` waits forever).
+
+    poll_interval:
+        Waiting time in seconds between attempts to acquire the lock.
+
+    Raises
+    ------
+    :py:class:`TimeoutError`
+        If the lock could not be acquired within `timeout` seconds.
+    """
+
+    _states: Dict[str, _LockState] = {}
+    _states_lock = threading.Lock()
+
+    def __init__(
+        self,
+        path: Union[str, pathlib.Path],
+        *,
+        shared: bool = False,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.05,
+    ):
+        self.path = os.path.abspath(path)
+        self.shared = shared
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+
+    @property
+    def _state(self) -> _LockState:
+        with self._states_lock:
+            return self._states.setdefault(self.path, _LockState())
+
+    @property
+    def is_locked(self) -> bool:
+        """Check if the lock is currently held by this process."""
+        return self._state.depth > 0
+
+    def acquire(self) -> None:
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        state = self._state
+        if not state.thread_lock.acquire(timeout=-1 if self.timeout is None else self.timeout):
+            raise TimeoutError(f"Timeout while waiting for lock file '{self.path}'")
+
+        if state.depth == 0:
+            try:
+                state.fd = self._lock_file(deadline)
+            except BaseException:
+                state.thread_lock.release()
+                raise
+            state.shared = self.shared
+        elif state.shared and not self.shared:
+            state.thread_lock.release()
+            raise RuntimeError(f"Cannot upgrade the shared lock '{self.path}' to exclusive")
+        state.depth += 1
+
+    def release(self) -> None:
+        state = self._state
+        assert state.depth > 0, "Releasing an unlocked file lock"
+        state.depth -= 1
+        if state.depth == 0:
+            if state.fd is not None:
+                if fcntl is not None:
+                    fcntl.lockf(state.fd, fcntl.LOCK_UN)
+                os.close(state.fd)
+                state.fd = None
+        state.thread_lock.release()
+
+    def _lock_file(self, deadline: Optional[float]) -> Optional[int]:
+        if fcntl is None:  # pragma: no cover
+            return None
+        if self.shared:
+            fd = self._open_shared()
+            if fd is None:
+                return None
+        else:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        operation = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+        while True:
+            try:
+                fcntl.lockf(fd, operation | fcntl.LOCK_NB)
+                return fd
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise TimeoutError(f"Timeout while waiting for lock file '{self.path}'")
+                time.sleep(self.poll_interval)
+
+    def _open_shared(self) -> Optional[int]:
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            return os.open(self.path, os.O_RDWR | os.O_CREAT, 0o666)
+        except OSError:
+            pass
+        # Read-only filesystem or directory: an existing lock file is enough for shared locks
+        try:
+            return os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return None
+
+    @classmethod
+    def _reset_after_fork(cls) -> None:
+        # Record locks are not inherited by child processes
+        cls._states = {}
+        cls._states_lock = threading.Lock()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=FileLock._reset_after_fork)
+
+
+def _tmp_path(file_path: pathlib.Path) -> pathlib.Path:
+    return file_path.with_name(f".{file_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def write_atomic(file_path: Union[str, pathlib.Path], data: Union[str, bytes]) -> None:
+    """Write a file such that readers only ever find either the old or the complete new content.
+
+    The data is written to a temporary file in the same directory, which is then renamed
+    to `file_path` (an atomic operation on POSIX filesystems).
+    """
+    file_path = pathlib.Path(file_path)
+    tmp_path = _tmp_path(file_path)
+    try:
+        if isinstance(data, bytes):
+            tmp_path.write_bytes(data)
+        else:
+            tmp_path.write_text(data)
+        os.replace(tmp_path, file_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def copy_atomic(src_path: Union[str, pathlib.Path], dest_path: Union[str, pathlib.Path]) -> None:
+    """Copy a file (and its permissions), publishing it atomically as in :func:`write_atomic`."""
+    dest_path = pathlib.Path(dest_path)
+    tmp_path = _tmp_path(dest_path)
+    try:
+        shutil.copy2(src_path, tmp_path)
+        os.replace(tmp_path, dest_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Process-wide registry of stencil performance counters.
+
+When the registry is enabled, every stencil call records its call, run and (for C++
+backends) C++ run times, the size of the compute domain, and the minimum memory traffic
+and floating point operations of the stencil (see :mod:`gt4py.analysis.metrics`) into
+counters kept per stencil class. Combined with the run time, these give the achieved
+bandwidth and FLOP rate of each stencil (e.g. for a roofline analysis). When the registry
+is disabled (the default), stencil calls only check :func:`is_enabled`.
+
+Example
+-------
+.. code-block: python
+
+    from gt4py.utils import perf
+
+    perf.enable()
+    ...  # call stencils
+    print(perf.summary())
+    perf.dump_json("perf.json")
+
+Stencils can also be timed in isolation with :func:`time_stencil`, using synthetic
+arguments allocated by :func:`synthetic_arguments`.
+"""
+
+import csv
+import json
+import statistics
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from gt4py.stencil_object import StencilObject
+
+
+class StencilCounters:
+    """Performance counters accumulated over all calls of a stencil."""
+
+    FIELDS = (
+        "name",
+        "backend",
+        "ncalls",
+        "total_call_time",
+        "min_call_time",
+        "max_call_time",
+        "total_run_time",
+        "total_run_cpp_time",
+        "total_points",
+        "total_bytes",
+        "total_flops",
+        "last_domain",
+        "computation_cache_hits",
+    )
+
+    __slots__ = FIELDS + ("_domain_bytes", "_domain_flops")
+
+    def __init__(self, name: str, backend: str):
+        self.name = name
+        self.backend = backend
+        self.ncalls = 0
+        self.total_call_time = 0.0
+        self.min_call_time = float("inf")
+        self.max_call_time = 0.0
+        self.total_run_time = 0.0
+        self.total_run_cpp_time = 0.0
+        self.total_points = 0
+        self.total_bytes = 0
+        self.total_flops = 0
+        self.last_domain: Optional[Tuple[int, ...]] = None
+        self.computation_cache_hits = 0
+        self._domain_bytes = 0
+        self._domain_flops = 0
+
+    @property
+    def bandwidth(self) -> float:
+        """Effective bandwidth (in bytes per second of run time)."""
+        return self.total_bytes / self.total_run_time if self.total_run_time > 0.0 else 0.0
+
+    @property
+    def flop_rate(self) -> float:
+        """Achieved floating point operations per second of run time."""
+        return self.total_flops / self.total_run_time if self.total_run_time > 0.0 else 0.0
+
+    @property
+    def arithmetic_intensity(self) -> float:
+        """Floating point operations per byte of memory traffic."""
+        return self.total_flops / self.total_bytes if self.total_bytes > 0 else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        result = {name: getattr(self, name) for name in self.FIELDS}
+        if not self.ncalls:
+            result["min_call_time"] = 0.0
+        result["bandwidth"] = self.bandwidth
+        result["flop_rate"] = self.flop_rate
+        result["arithmetic_intensity"] = self.arithmetic_intensity
+        return result
+
+
+_lock = threading.Lock()
+_enabled = False
+_counters: Dict[str, StencilCounters] = {}
+
+
+def enable() -> None:
+    """Start recording the performance counters of all stencil calls."""
+    global _enabled
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording performance counters (already recorded values are kept)."""
+    global _enabled
+    _enabled = False
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def reset() -> None:
+    """Discard all recorded performance counters."""
+    with _lock:
+        _counters.clear()
+
+
+def _domain_cost(stencil: "StencilObject", domain: Tuple[int, ...]) -> Tuple[int, int]:
+    if stencil._gt_metrics_ is not None:
+        metrics = stencil.metrics(domain)
+        return metrics["bytes_read"] + metrics["bytes_written"], metrics["flops"]
+
+    # Stencils generated without metrics: estimate from the accessed field regions
+    accessed_bytes = 0
+    for info in stencil.field_info.values():
+        if info is not None:
+            size = info.dtype.itemsize
+            for length, (lower, upper) in zip(domain, info.boundary):
+                size *= length + lower + upper
+            accessed_bytes += size
+    return accessed_bytes, 0
+
+
+def record(stencil: "StencilObject", exec_info: Mapping[str, Any]) -> None:
+    """Add the times of a stencil call stored in `exec_info` to the counters of `stencil`."""
+    key = type(stencil).__name__
+    call_time = exec_info["call_end_time"] - exec_info["call_start_time"]
+    run_time = exec_info["run_end_time"] - exec_info["run_start_time"]
+    run_cpp_time = (
+        exec_info["run_cpp_end_time"] - exec_info["run_cpp_start_time"]
+        if "run_cpp_start_time" in exec_info
+        else 0.0
+    )
+    domain = tuple(exec_info["domain"])
+
+    with _lock:
+        counters = _counters.get(key, None)
+        if counters is None:
+            counters = _counters[key] = StencilCounters(
+                f"{stencil.options['module']}.{stencil.options['name']}", stencil.backend
+            )
+        if domain != counters.last_domain:
+            counters.last_domain = domain
+            counters._domain_bytes, counters._domain_flops = _domain_cost(stencil, domain)
+        counters.ncalls += 1
+        counters.total_call_time += call_time
+        counters.min_call_time = min(counters.min_call_time, call_time)
+        counters.max_call_time = max(counters.max_call_time, call_time)
+        counters.total_run_time += run_time
+        counters.total_run_cpp_time += run_cpp_time
+        points = 1
+        for length in domain:
+            points *= length
+        counters.total_points += points
+        counters.total_bytes += counters._domain_bytes
+        counters.total_flops += counters._domain_flops
+        counters.computation_cache_hits += int(exec_info.get("computation_cache_hit", False))
+
+
+def get_counters() -> Dict[str, Dict[str, Any]]:
+    """Return a snapshot of the counters of all recorded stencils, by stencil class name."""
+    with _lock:
+        return {key: counters.as_dict() for key, counters in _counters.items()}
+
+
+def dump_json(file_path: str) -> None:
+    with open(file_path, "w") as f:
+        json.dump(get_counters(), f, indent=2)
+
+
+def dump_csv(file_path: str) -> None:
+    counters = get_counters()
+    with open(file_path, "w", newline="") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=[
+                "stencil",
+                *StencilCounters.FIELDS,
+                "bandwidth",
+                "flop_rate",
+                "arithmetic_intensity",
+            ],
+        )
+        writer.writeheader()
+        for key, values in counters.items():
+            writer.writerow({"stencil": key, **values})
+
+
+def summary() -> str:
+    """Format the recorded counters as a table sorted by total call time."""
+    counters = sorted(get_counters().values(), key=lambda item: -item["total_call_time"])
+    header = (
+        f"{'stencil':<40} {'backend':<18} {'calls':>8} {'call [s]':>12} {'mean [ms]':>10} "
+        f"{'run [s]':>12} {'run cpp [s]':>12} {'GB/s':>8} {'GFLOP/s':>8} {'FLOP/B':>7}"
+    )
+    lines: List[str] = [header, "-" * len(header)]
+    for item in counters:
+        mean_time = 1e3 * item["total_call_time"] / item["ncalls"] if item["ncalls"] else 0.0
+        lines.append(
+            f"{item['name']:<40} {item['backend']:<18} {item['ncalls']:>8} "
+            f"{item['total_call_time']:>12.6f} {mean_time:>10.3f} "
+            f"{item['total_run_time']:>12.6f} {item['total_run_cpp_time']:>12.6f} "
+            f"{item['bandwidth'] / 1e9:>8.3f} {item['flop_rate'] / 1e9:>8.3f} "
+            f"{item['arithmetic_intensity']:>7.3f}"
+        )
+    return "\n".join(lines)
+
+
+def synthetic_arguments(
+    stencil: "StencilObject", domain: Sequence[int], *, seed: int = 0
+) -> Dict[str, Any]:
+    """Create the arguments of a call of `stencil` on `domain`.
+
+    Fields are allocated as storages of the stencil backend, with the halos required by the
+    stencil, and filled with random values in ``[1, 2)``. Scalar parameters are set to one.
+    """
+    from gt4py import storage as gt_storage
+
+    rng = np.random.default_rng(seed)
+    args: Dict[str, Any] = {}
+    for name, info in stencil.field_info.items():
+        if info is not None:
+            shape = tuple(length + frame for length, frame in zip(domain, info.boundary.frame_size))
+            args[name] = gt_storage.from_array(
+                rng.uniform(1.0, 2.0, size=shape).astype(info.dtype),
+                backend=stencil.backend,
+                default_origin=info.boundary.lower_indices,
+                dtype=info.dtype,
+            )
+    for name, info in stencil.parameter_info.items():
+        if info is not None:
+            args[name] = info.dtype.type(1.0)
+    return args
+
+
+def time_stencil(
+    stencil: "StencilObject",
+    args: Mapping[str, Any],
+    *,
+    domain: Sequence[int],
+    repeat: int = 10,
+    warmup: int = 1,
+    validate_args: bool = True,
+) -> Dict[str, float]:
+    """Time `repeat` calls of `stencil` on `domain`, after `warmup` untimed calls.
+
+    Returns
+    -------
+    `dict`
+        ``median_time`` and ``min_time`` of the calls, the median ``overhead`` (part of the
+        call not spent in the computation itself, e.g. argument validation), all in seconds,
+        and the effective ``bandwidth`` (bytes per second of median computation time).
+    """
+    domain = tuple(domain)
+    for _ in range(warmup):
+        stencil(**args, domain=domain, validate_args=validate_args)
+
+    call_times: List[float] = []
+    compute_times: List[float] = []
+    for _ in range(repeat):
+        exec_info: Dict[str, Any] = {}
+        stencil(**args, domain=domain, validate_args=validate_args, exec_info=exec_info)
+        call_times.append(exec_info["call_end_time"] - exec_info["call_start_time"])
+        if "run_cpp_start_time" in exec_info:
+            compute_times.append(exec_info["run_cpp_end_time"] - exec_info["run_cpp_start_time"])
+        else:
+            compute_times.append(exec_info["run_end_time"] - exec_info["run_start_time"])
+
+    compute_time = statistics.median(compute_times)
+    accessed_bytes, _ = _domain_cost(stencil, domain)
+    return {
+        "median_time": statistics.median(call_times),
+        "min_time": min(call_times),
+        "overhead": statistics.median(
+            [call_time - compute_time for call_time, compute_time in zip(call_times, compute_times)]
+        ),
+        "bandwidth": accessed_bytes / compute_time if compute_time > 0.0 else 0.0,
+    }
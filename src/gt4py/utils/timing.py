@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""Timing and tracing of gt4py builds and stencil calls.
+
+Build phases are recorded in the ``build_info`` dictionary passed in the build options (if
+any) under the ``"phases"`` key. Since intermediate representations are generated lazily,
+phases can be nested (e.g. ``frontend`` may run inside ``codegen``) and their times
+should not be simply added up.
+
+Build phases, stencil calls (including the argument validation, the ``run`` method and
+the C++ section of compiled backends) and storage allocations can also be collected as
+Chrome trace events of every process and thread, viewable in ``chrome://tracing`` or
+https://ui.perfetto.dev. Tracing can be enabled with :func:`enable_trace`, or for the
+whole process by setting the ``GT_TRACE_FILE`` environment variable to the path of the
+output file (``{pid}`` in the path is replaced with the process id). When tracing is
+disabled, instrumented code only checks :func:`is_trace_enabled`.
+"""
+
+import atexit
+import contextlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from gt4py import config as gt_config
+
+
+_trace_lock = threading.Lock()
+_trace_events: Optional[List[Dict[str, Any]]] = None
+_thread_names: Dict[int, str] = {}
+
+#: Offset from ``time.time()`` (used for the C++ timestamps) to ``time.perf_counter()``
+_wall_time_offset = time.perf_counter() - time.time()
+
+
+def enable_trace(file_path: Optional[str] = None) -> None:
+    """Start collecting trace events.
+
+    If `file_path` is given, the collected trace is written there at interpreter exit.
+    """
+    global _trace_events
+    with _trace_lock:
+        if _trace_events is None:
+            _trace_events = []
+    if file_path:
+        atexit.register(_dump_trace_at_exit, file_path)
+
+
+def disable_trace() -> None:
+    """Stop collecting trace events and discard the collected ones."""
+    global _trace_events
+    with _trace_lock:
+        _trace_events = None
+
+
+def is_trace_enabled() -> bool:
+    return _trace_events is not None
+
+
+def _metadata_events() -> List[Dict[str, Any]]:
+    pid = os.getpid()
+    events = [{"name": "process_name", "ph": "M", "pid": pid, "args": {"name": f"gt4py ({pid})"}}]
+    for tid, name in _thread_names.items():
+        events.append(
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+        )
+    return events
+
+
+def dump_trace(file_path: str) -> None:
+    """Write the collected trace events to `file_path` in Chrome trace JSON format."""
+    with _trace_lock:
+        events = _metadata_events() + list(_trace_events or [])
+    with open(file_path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def _dump_trace_at_exit(file_path: str) -> None:
+    if _trace_events:
+        dump_trace(file_path.format(pid=os.getpid()))
+
+
+def add_trace_event(
+    name: str, category: str, start: float, end: float, args: Optional[Dict[str, Any]] = None
+) -> None:
+    """Record a complete event between two :func:`time.perf_counter` timestamps.
+
+    Nothing is recorded if tracing is disabled.
+    """
+    if _trace_events is None:
+        return
+    tid = threading.get_ident()
+    event = {
+        "name": name,
+        "cat": category,
+        "ph": "X",
+        "ts": start * 1e6,
+        "dur": (end - start) * 1e6,
+        "pid": os.getpid(),
+        "tid": tid,
+        "args": args or {},
+    }
+    with _trace_lock:
+        if _trace_events is not None:
+            _trace_events.append(event)
+            if tid not in _thread_names:
+                _thread_names[tid] = threading.current_thread().name
+
+
+def from_wall_time(timestamp: float) -> float:
+    """Convert a :func:`time.time` timestamp to the :func:`time.perf_counter` clock."""
+    return timestamp + _wall_time_offset
+
+
+def _reset_trace_after_fork() -> None:
+    # Child processes collect (and dump) only their own events
+    global _trace_lock
+    _trace_lock = threading.Lock()
+    _thread_names.clear()
+    if _trace_events is not None:
+        _trace_events.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_trace_after_fork)
+
+
+@contextlib.contextmanager
+def build_phase(name: str, build_info: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+    """Time a build phase.
+
+    Yields a dictionary where the phase can record additional information (e.g. sizes).
+    The wall time of the phase (in seconds) is accumulated in ``build_info["phases"][name]``
+    together with the number of calls and the recorded information.
+    """
+    record: Dict[str, Any] = {}
+    start = time.perf_counter()
+    try:
+        yield record
+    finally:
+        end = time.perf_counter()
+        if build_info is not None:
+            phase = build_info.setdefault("phases", {}).setdefault(name, {"time": 0.0, "calls": 0})
+            phase["time"] += end - start
+            phase["calls"] += 1
+            phase.update(record)
+        add_trace_event(name, "build", start, end, record)
+
+
+if gt_config.build_settings["trace_file"]:
+    enable_trace(gt_config.build_settings["trace_file"])
@@ -32,6 +32,7 @@ from eve import (
     SymbolTableTrait,
 )
 from eve import exceptions as eve_exceptions
+from eve import subtree_validator
 from eve.type_definitions import SymbolRef
 from eve.typingx import RootValidatorType, RootValidatorValuesType
 from gtc.utils import flatten_list
@@ -529,7 +530,7 @@ def validate_dtype_is_set() -> RootValidatorType:
             raise ValueError("Nodes without dtype detected {}".format(nodes_without_dtype))
         return values
 
-    return root_validator(allow_reuse=True, skip_on_failure=True)(_impl)
+    return root_validator(allow_reuse=True, skip_on_failure=True)(subtree_validator(_impl))
 
 
 def validate_symbol_refs() -> RootValidatorType:
@@ -560,16 +561,17 @@ def validate_symbol_refs() -> RootValidatorType:
                 instance.visit(node, symtable=symtable)
                 return instance.missing_symbols
 
+        symtable = SymbolTableTrait._collect_symbols(values)
         missing_symbols = []
         for v in values.values():
-            missing_symbols.extend(SymtableValidator.apply(v, symtable=values["symtable_"]))
+            missing_symbols.extend(SymtableValidator.apply(v, symtable=symtable))
 
         if len(missing_symbols) > 0:
             raise ValueError("Symbols {} not found.".format(missing_symbols))
 
         return values
 
-    return root_validator(allow_reuse=True, skip_on_failure=True)(_impl)
+    return root_validator(allow_reuse=True, skip_on_failure=True)(subtree_validator(_impl))
 
 
 class AxisBound(Node):
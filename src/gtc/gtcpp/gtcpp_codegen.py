@@ -14,7 +14,7 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
-from typing import Any, Collection, Union
+from typing import Any, Collection, Dict, List, Set, Union
 
 from eve import Node, codegen
 from eve.codegen import FormatTemplate as as_fmt
@@ -33,6 +33,61 @@ def _offset_limit(root: Node) -> int:
     )
 
 
+def timed_multi_stage_groups(program: gtcpp.Program) -> List[List[int]]:
+    """Group the multi-stages of the program into independently timed GridTools computations.
+
+    A multi-stage is kept in the computation of the previous ones if they share temporaries
+    or if it reads a field written before outside of the compute domain, i.e. with horizontal
+    offsets or in a stage whose outputs are read outside of the compute domain later on: in
+    both cases GridTools needs to see all the stages to allocate the temporaries and compute
+    the stage extents.
+    """
+    functors: Dict[str, gtcpp.GTFunctor] = {functor.name: functor for functor in program.functors}
+    temporaries = {tmp.name for tmp in program.gt_computation.temporaries}
+    multi_stages = program.gt_computation.multi_stages
+
+    # Conservatively over the whole program, a stage is extended if a later stage reads one
+    # of its outputs outside of the compute domain
+    halo_reads: List[Set[str]] = [set() for _ in multi_stages]
+    halo_fields: Set[str] = set()
+    for i in reversed(range(len(multi_stages))):
+        for stage in reversed(multi_stages[i].stages):
+            accessors = functors[stage.functor].param_list.accessors
+            is_extended = any(
+                accessor.intent == gtcpp.Intent.INOUT and accessor.name in halo_fields
+                for accessor in accessors
+            )
+            for accessor in accessors:
+                if is_extended or accessor.extent.i != (0, 0) or accessor.extent.j != (0, 0):
+                    halo_reads[i].add(accessor.name)
+            halo_fields |= halo_reads[i]
+
+    accesses = []
+    for multi_stage, multi_stage_halo_reads in zip(multi_stages, halo_reads):
+        written: Set[str] = set()
+        used_temporaries: Set[str] = set()
+        for stage in multi_stage.stages:
+            for accessor in functors[stage.functor].param_list.accessors:
+                if accessor.name in temporaries:
+                    used_temporaries.add(accessor.name)
+                if accessor.intent == gtcpp.Intent.INOUT:
+                    written.add(accessor.name)
+        accesses.append((written, multi_stage_halo_reads, used_temporaries))
+
+    groups: List[List[int]] = [[0]] if accesses else []
+    for i in range(1, len(accesses)):
+        written_before = set().union(*(item[0] for item in accesses[:i]))
+        halo_reads_after = set().union(*(item[1] for item in accesses[i:]))
+        temporaries_before = set().union(*(item[2] for item in accesses[:i]))
+        temporaries_after = set().union(*(item[2] for item in accesses[i:]))
+        if written_before & halo_reads_after or temporaries_before & temporaries_after:
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+
+    return groups
+
+
 class GTCppCodegen(codegen.TemplatedGenerator):
 
     GTExtent = as_fmt("extent<{i[0]},{i[1]},{j[0]},{j[1]},{k[0]},{k[1]}>")
@@ -156,7 +211,27 @@ class GTCppCodegen(codegen.TemplatedGenerator):
     def visit_GTComputationCall(
         self, node: gtcpp.GTComputationCall, **kwargs: Any
     ) -> Union[str, Collection[str]]:
-        return self.generic_visit(node, computation_name=node.id_, **kwargs)
+        timed_groups: List[Dict[str, Any]] = []
+        if kwargs["time_stages"]:
+            for group in kwargs["multi_stage_groups"]:
+                multi_stages = [node.multi_stages[i] for i in group]
+                names = {
+                    arg.name for ms in multi_stages for stage in ms.stages for arg in stage.args
+                }
+                timed_groups.append(
+                    {
+                        "arguments": self.visit(
+                            [arg for arg in node.arguments if arg.name in names], **kwargs
+                        ),
+                        "temporaries": self.visit(
+                            [tmp for tmp in node.temporaries if tmp.name in names], **kwargs
+                        ),
+                        "multi_stages": self.visit(multi_stages, **kwargs),
+                    }
+                )
+        return self.generic_visit(
+            node, computation_name=node.id_, timed_groups=timed_groups, **kwargs
+        )
 
     GTComputationCall = as_mako(
         """
@@ -165,6 +240,25 @@ class GTCppCodegen(codegen.TemplatedGenerator):
             auto grid = make_grid(domain[0], domain[1], axis<1,
                 axis_config::offset_limit<${offset_limit}>>{domain[2]});
 
+            %if time_stages:
+            stage_times.clear();
+            %for group in timed_groups:
+            {
+                auto ${ computation_name }_${ loop.index } = [](
+                        ${ ','.join('auto ' + a for a in group['arguments']) }) {
+
+                    ${ '\\n'.join(group['temporaries']) }
+                    return multi_pass(${ ','.join(group['multi_stages']) });
+                };
+
+                const auto start = std::chrono::steady_clock::now();
+                run(${computation_name}_${ loop.index }, cpu_ifirst<>{} /* TODO */, grid,
+                    ${','.join(group['arguments'])});
+                stage_times.push_back(
+                    std::chrono::duration<double>(std::chrono::steady_clock::now() - start).count());
+            }
+            %endfor
+            %else:
             auto ${ computation_name } = [](${ ','.join('auto ' + a for a in arguments) }) {
 
                 ${ '\\n'.join(temporaries) }
@@ -172,6 +266,7 @@ class GTCppCodegen(codegen.TemplatedGenerator):
             };
 
             run(${computation_name}, cpu_ifirst<>{} /* TODO */, grid, ${','.join(arguments)});
+            %endif
         }
         %endif
         """
@@ -180,6 +275,10 @@ class GTCppCodegen(codegen.TemplatedGenerator):
     Program = as_mako(
         """#include <gridtools/stencil/cpu_ifirst.hpp>
         #include <gridtools/stencil/cartesian.hpp>
+        %if time_stages:
+        #include <chrono>
+        #include <vector>
+        %endif
 
         namespace ${ name }_impl_{
             using Domain = std::array<gridtools::uint_t, 3>;
@@ -188,23 +287,48 @@ class GTCppCodegen(codegen.TemplatedGenerator):
 
             ${'\\n'.join(functors)}
 
+            %if time_stages:
+            auto ${name}(Domain domain, std::vector<double>& stage_times){
+                return [domain, &stage_times](${ ','.join( 'auto&& ' + p for p in parameters)}){
+            %else:
             auto ${name}(Domain domain){
                 return [domain](${ ','.join( 'auto&& ' + p for p in parameters)}){
+            %endif
                     ${gt_computation}
                 };
             }
         }
 
+        %if time_stages:
+        auto ${name}(${name}_impl_::Domain domain, std::vector<double>& stage_times){
+            return ${name}_impl_::${name}(domain, stage_times);
+        }
+        %else:
         auto ${name}(${name}_impl_::Domain domain){
             return ${name}_impl_::${name}(domain);
         }
+        %endif
         """
     )
 
     @classmethod
-    def apply(cls, root: LeafNode, **kwargs: Any) -> str:
+    def apply(
+        cls,
+        root: LeafNode,
+        *,
+        format_source: bool = True,
+        time_stages: bool = False,
+        **kwargs: Any,
+    ) -> str:
         if not isinstance(root, gtcpp.Program):
             raise ValueError("apply() requires gtcpp.Progam root node")
-        generated_code = super().apply(root, offset_limit=_offset_limit(root), **kwargs)
-        formatted_code = codegen.format_source("cpp", generated_code, style="LLVM")
-        return formatted_code
+        generated_code = super().apply(
+            root,
+            offset_limit=_offset_limit(root),
+            time_stages=time_stages,
+            multi_stage_groups=timed_multi_stage_groups(root) if time_stages else [],
+            **kwargs,
+        )
+        if format_source:
+            generated_code = codegen.format_source("cpp", generated_code, style="LLVM")
+        return generated_code
@@ -197,7 +197,7 @@ class OIRToGTCpp(eve.NodeTranslator):
             )
         ),
 
-        return gtcpp.GTStage(functor=node.id_, args=stage_args)
+        return gtcpp.GTStage(functor=node.id_, args=stage_args, loc=node.loc)
 
     def visit_VerticalLoop(
         self,
@@ -226,25 +226,27 @@ class OIRToGTCpp(eve.NodeTranslator):
         return gtcpp.GlobalParamDecl(name=node.name, dtype=node.dtype)
 
     def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> gtcpp.Program:
-        prog_ctx = self.ProgramContext()
-        comp_ctx = self.GTComputationContext()
-        multi_stages = self.visit(
-            node.vertical_loops,
-            stencil_symtable=node.symtable_,
-            prog_ctx=prog_ctx,
-            comp_ctx=comp_ctx,
-            **kwargs,
-        )
+        # The input is a valid OIR tree: skip the validation of the new nodes
+        with eve.trusted_construction():
+            prog_ctx = self.ProgramContext()
+            comp_ctx = self.GTComputationContext()
+            multi_stages = self.visit(
+                node.vertical_loops,
+                stencil_symtable=node.symtable_,
+                prog_ctx=prog_ctx,
+                comp_ctx=comp_ctx,
+                **kwargs,
+            )
 
-        gt_computation = gtcpp.GTComputationCall(
-            arguments=comp_ctx.arguments,
-            temporaries=comp_ctx.temporaries,
-            multi_stages=multi_stages,
-        )
-        parameters = self.visit(node.params)
-        return gtcpp.Program(
-            name=node.name,
-            parameters=parameters,
-            functors=prog_ctx.functors,
-            gt_computation=gt_computation,
-        )
+            gt_computation = gtcpp.GTComputationCall(
+                arguments=comp_ctx.arguments,
+                temporaries=comp_ctx.temporaries,
+                multi_stages=multi_stages,
+            )
+            parameters = self.visit(node.params)
+            return gtcpp.Program(
+                name=node.name,
+                parameters=parameters,
+                functors=prog_ctx.functors,
+                gt_computation=gt_computation,
+            )
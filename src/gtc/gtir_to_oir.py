@@ -15,14 +15,17 @@
 # SPDX-License-Identifier: GPL-3.0-or-later
 
 from dataclasses import dataclass, field
-from typing import Any, List
+from typing import Any, List, Optional
 
 from eve import NodeTranslator
+from eve.type_definitions import SourceLocation
 from gtc import gtir, oir
 from gtc.common import CartesianOffset, DataType, LogicalOperator, UnaryOperator
 
 
-def _create_mask(ctx: "GTIRToOIR.Context", name: str, cond: oir.Expr) -> oir.Temporary:
+def _create_mask(
+    ctx: "GTIRToOIR.Context", name: str, cond: oir.Expr, loc: Optional[SourceLocation] = None
+) -> oir.Temporary:
     mask_field_decl = oir.Temporary(name=name, dtype=DataType.BOOL)
     ctx.add_decl(mask_field_decl)
 
@@ -36,7 +39,8 @@ def _create_mask(ctx: "GTIRToOIR.Context", name: str, cond: oir.Expr) -> oir.Tem
                 ),
                 right=cond,
             )
-        ]
+        ],
+        loc=loc,
     )
     ctx.add_horizontal_execution(fill_mask_field)
     return mask_field_decl
@@ -84,6 +88,7 @@ class GTIRToOIR(NodeTranslator):
                     )
                 ],
                 mask=mask,
+                loc=node.loc,
             )
         )
         ctx.add_horizontal_execution(
@@ -97,6 +102,7 @@ class GTIRToOIR(NodeTranslator):
                     )
                 ],
                 mask=mask,
+                loc=node.loc,
             ),
         )
 
@@ -139,7 +145,7 @@ class GTIRToOIR(NodeTranslator):
     def visit_FieldIfStmt(
         self, node: gtir.FieldIfStmt, *, mask: oir.Expr = None, ctx: Context, **kwargs: Any
     ) -> None:
-        mask_field_decl = _create_mask(ctx, f"mask_{node.id_}", self.visit(node.cond))
+        mask_field_decl = _create_mask(ctx, f"mask_{node.id_}", self.visit(node.cond), node.loc)
         current_mask = oir.FieldAccess(
             name=mask_field_decl.name, offset=CartesianOffset.zero(), dtype=mask_field_decl.dtype
         )
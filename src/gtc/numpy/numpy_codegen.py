@@ -0,0 +1,395 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+"""
+Vectorized NumPy code generation from OIR.
+
+Every `HorizontalExecution` is lowered to array operations on slabs of the fields,
+covering the whole horizontal domain (plus the extent required by later reads) and,
+in parallel vertical loops, the whole vertical interval. Python loops are only
+generated for the vertical dimension of sequential vertical loops.
+"""
+
+import collections
+from typing import Any, Dict, List, Set, Tuple, cast
+
+from eve import codegen
+from eve.codegen import FormatTemplate as as_fmt
+from gtc import oir
+from gtc.common import (
+    AxisBound,
+    BuiltInLiteral,
+    CartesianOffset,
+    DataType,
+    LevelMarker,
+    LogicalOperator,
+    LoopOrder,
+    NativeFunction,
+    UnaryOperator,
+)
+
+
+HorizontalExtent = Tuple[Tuple[int, int], Tuple[int, int]]
+FieldExtent = Tuple[Tuple[int, int], Tuple[int, int], Tuple[int, int]]
+
+_ZERO_EXTENT: FieldExtent = ((0, 0), (0, 0), (0, 0))
+
+
+def _union(first: Tuple[Tuple[int, int], ...], second: Tuple[Tuple[int, int], ...]) -> Any:
+    return tuple(
+        (min(first_lo, second_lo), max(first_hi, second_hi))
+        for (first_lo, first_hi), (second_lo, second_hi) in zip(first, second)
+    )
+
+
+def compute_extents(
+    node: oir.Stencil,
+) -> Tuple[Dict[str, FieldExtent], List[List[HorizontalExtent]]]:
+    """
+    Compute the extents of all fields and the compute extent of each horizontal execution.
+
+    A horizontal execution is computed on the domain enlarged by the extent required by the
+    later reads of the fields it writes. Field extents are the union of all accesses, including
+    the vertical offsets, and are used to allocate temporaries.
+    """
+    field_extents: Dict[str, FieldExtent] = {}
+    horizontal_extents: List[List[HorizontalExtent]] = []
+    for vertical_loop in reversed(node.vertical_loops):
+        loop_extents: List[HorizontalExtent] = []
+        for horizontal_execution in reversed(vertical_loop.horizontal_executions):
+            extent: HorizontalExtent = ((0, 0), (0, 0))
+            for stmt in horizontal_execution.body:
+                if (
+                    isinstance(stmt, oir.AssignStmt)
+                    and isinstance(stmt.left, oir.FieldAccess)
+                    and stmt.left.name in field_extents
+                ):
+                    extent = _union(extent, field_extents[stmt.left.name][:2])
+            loop_extents.insert(0, extent)
+
+            (i_lo, i_hi), (j_lo, j_hi) = extent
+            for access in horizontal_execution.iter_tree().if_isinstance(oir.FieldAccess):
+                offset = access.offset
+                access_extent = (
+                    (i_lo + offset.i, i_hi + offset.i),
+                    (j_lo + offset.j, j_hi + offset.j),
+                    (offset.k, offset.k),
+                )
+                field_extents[access.name] = _union(
+                    field_extents.get(access.name, _ZERO_EXTENT), access_extent
+                )
+        horizontal_extents.insert(0, loop_extents)
+
+    return field_extents, horizontal_extents
+
+
+def _sum(terms: List[str], offset: int = 0) -> str:
+    terms = [term for term in terms if term]
+    if not terms:
+        return str(offset)
+    result = " + ".join(terms)
+    if offset > 0:
+        result += f" + {offset}"
+    elif offset < 0:
+        result += f" - {-offset}"
+    return result
+
+
+class NumpyCodegen(codegen.TemplatedGenerator):
+    """Generate a Python function computing an `oir.Stencil` with NumPy array operations."""
+
+    DOMAIN_SIZE_NAMES = ("_I_", "_J_", "_K_")
+    K_INDEX_NAME = "_k_"
+    K_START_NAME = "_k_start_"
+    K_END_NAME = "_k_end_"
+    MASK_NAME = "_mask_"
+    ORIGIN_MARKER = "__O"
+
+    NATIVE_FUNC_TO_NUMPY = {
+        NativeFunction.ABS: "np.abs",
+        NativeFunction.MIN: "np.minimum",
+        NativeFunction.MAX: "np.maximum",
+        NativeFunction.MOD: "np.mod",
+        NativeFunction.SIN: "np.sin",
+        NativeFunction.COS: "np.cos",
+        NativeFunction.TAN: "np.tan",
+        NativeFunction.ARCSIN: "np.arcsin",
+        NativeFunction.ARCCOS: "np.arccos",
+        NativeFunction.ARCTAN: "np.arctan",
+        NativeFunction.SQRT: "np.sqrt",
+        NativeFunction.EXP: "np.exp",
+        NativeFunction.LOG: "np.log",
+        NativeFunction.ISFINITE: "np.isfinite",
+        NativeFunction.ISINF: "np.isinf",
+        NativeFunction.ISNAN: "np.isnan",
+        NativeFunction.FLOOR: "np.floor",
+        NativeFunction.CEIL: "np.ceil",
+        NativeFunction.TRUNC: "np.trunc",
+    }
+
+    def visit_DataType(self, dtype: DataType, **kwargs: Any) -> str:
+        if dtype == DataType.BOOL:
+            return "np.bool_"
+        elif dtype in (
+            DataType.INT8,
+            DataType.INT16,
+            DataType.INT32,
+            DataType.INT64,
+            DataType.FLOAT32,
+            DataType.FLOAT64,
+        ):
+            return f"np.{dtype.name.lower()}"
+        raise NotImplementedError("Not implemented DataType encountered.")
+
+    def visit_BuiltInLiteral(self, builtin: BuiltInLiteral, **kwargs: Any) -> str:
+        if builtin == BuiltInLiteral.TRUE:
+            return "True"
+        elif builtin == BuiltInLiteral.FALSE:
+            return "False"
+        raise NotImplementedError("Not implemented BuiltInLiteral encountered.")
+
+    Literal = as_fmt("{dtype}({value})")
+
+    ScalarAccess = as_fmt("{name}")
+
+    def visit_FieldAccess(
+        self,
+        node: oir.FieldAccess,
+        *,
+        extent: HorizontalExtent,
+        sequential: bool,
+        **kwargs: Any,
+    ) -> str:
+        origin = f"{node.name}{self.ORIGIN_MARKER}"
+        size_i, size_j, _ = self.DOMAIN_SIZE_NAMES
+        (i_lo, i_hi), (j_lo, j_hi) = extent
+        offset = node.offset
+        indices = [
+            "{}:{}".format(
+                _sum([f"{origin}[0]"], i_lo + offset.i),
+                _sum([f"{origin}[0]", size_i], i_hi + offset.i),
+            ),
+            "{}:{}".format(
+                _sum([f"{origin}[1]"], j_lo + offset.j),
+                _sum([f"{origin}[1]", size_j], j_hi + offset.j),
+            ),
+        ]
+        if sequential:
+            indices.append(_sum([f"{origin}[2]", self.K_INDEX_NAME], offset.k))
+        else:
+            indices.append(
+                "{}:{}".format(
+                    _sum([f"{origin}[2]", self.K_START_NAME], offset.k),
+                    _sum([f"{origin}[2]", self.K_END_NAME], offset.k),
+                )
+            )
+
+        return "{name}[{indices}]".format(name=node.name, indices=", ".join(indices))
+
+    def visit_AxisBound(self, node: AxisBound, **kwargs: Any) -> str:
+        # levels outside of the domain are never computed
+        size_k = self.DOMAIN_SIZE_NAMES[2]
+        if node.level == LevelMarker.START:
+            return f"min({node.offset}, {size_k})" if node.offset > 0 else "0"
+        return f"max({_sum([size_k], node.offset)}, 0)" if node.offset < 0 else size_k
+
+    def visit_UnaryOp(self, node: oir.UnaryOp, **kwargs: Any) -> str:
+        expr = self.visit(node.expr, **kwargs)
+        if node.op == UnaryOperator.NOT:
+            return f"np.logical_not({expr})"
+        return f"({node.op}{expr})"
+
+    def visit_BinaryOp(self, node: oir.BinaryOp, **kwargs: Any) -> str:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        if node.op == LogicalOperator.AND:
+            return f"np.logical_and({left}, {right})"
+        elif node.op == LogicalOperator.OR:
+            return f"np.logical_or({left}, {right})"
+        return f"({left} {node.op} {right})"
+
+    TernaryOp = as_fmt("np.where({cond}, {true_expr}, {false_expr})")
+
+    Cast = as_fmt("{dtype}({expr})")
+
+    def visit_NativeFunction(self, func: NativeFunction, **kwargs: Any) -> str:
+        try:
+            return self.NATIVE_FUNC_TO_NUMPY[func]
+        except KeyError as error:
+            raise NotImplementedError("Not implemented NativeFunction encountered.") from error
+
+    def visit_NativeFuncCall(self, node: oir.NativeFuncCall, **kwargs: Any) -> str:
+        args = ", ".join(self.visit(arg, **kwargs) for arg in node.args)
+        return f"{self.visit(node.func)}({args})"
+
+    def visit_HorizontalExecution(self, node: oir.HorizontalExecution, **kwargs: Any) -> List[str]:
+        lines = []
+        if node.mask is not None:
+            lines.append(f"{self.MASK_NAME} = {self.visit(node.mask, **kwargs)}")
+        for stmt in node.body:
+            # assignments are the only statements in OIR
+            stmt = cast(oir.AssignStmt, stmt)
+            left = self.visit(stmt.left, **kwargs)
+            right = self.visit(stmt.right, **kwargs)
+            if node.mask is not None:
+                right = f"np.where({self.MASK_NAME}, {right}, {left})"
+            lines.append(f"{left} = {right}")
+        return lines
+
+    def _forwarded_temporaries(
+        self, node: oir.Stencil, horizontal_extents: List[List[HorizontalExtent]]
+    ) -> Set[str]:
+        """
+        Find temporaries which are only copied to another field by the next horizontal execution.
+
+        This is the pattern generated for parallel assignments: the right hand side is stored
+        in a temporary and then copied to the target. As NumPy evaluates the whole right hand
+        side before assigning the slab, the expression can be assigned to the target directly.
+        """
+        temporaries = {decl.name for loop in node.vertical_loops for decl in loop.declarations}
+        access_counts = collections.Counter(
+            node.iter_tree().if_isinstance(oir.FieldAccess).getattr("name")
+        )
+        forwarded: Set[str] = set()
+        for vertical_loop, extents in zip(node.vertical_loops, horizontal_extents):
+            pairs = zip(
+                vertical_loop.horizontal_executions, vertical_loop.horizontal_executions[1:]
+            )
+            fused_index = -1
+            for index, (first, second) in enumerate(pairs):
+                # the first execution might have been already fused with the previous one
+                if index == fused_index or len(first.body) != 1 or len(second.body) != 1:
+                    continue
+                write, copy = first.body[0], second.body[0]
+                if not isinstance(write, oir.AssignStmt) or not isinstance(copy, oir.AssignStmt):
+                    continue
+                name = write.left.name
+                read = copy.right
+                if (
+                    name not in temporaries
+                    or access_counts[name] != 2
+                    or not isinstance(read, oir.FieldAccess)
+                    or read.name != name
+                    or read.offset.to_dict() != CartesianOffset.zero().to_dict()
+                ):
+                    continue
+                masks = [
+                    self.visit(he.mask, extent=extents[index + 1], sequential=False)
+                    if he.mask is not None
+                    else None
+                    for he in (first, second)
+                ]
+                if masks[0] == masks[1]:
+                    forwarded.add(name)
+                    fused_index = index + 1
+        return forwarded
+
+    def visit_VerticalLoop(
+        self,
+        node: oir.VerticalLoop,
+        *,
+        extents: List[HorizontalExtent],
+        forwarded: Set[str],
+        block: codegen.TextBlock,
+        **kwargs: Any,
+    ) -> None:
+        sequential = node.loop_order != LoopOrder.PARALLEL
+        lines = []
+        index = 0
+        while index < len(node.horizontal_executions):
+            horizontal_execution = node.horizontal_executions[index]
+            first_stmt = horizontal_execution.body[0] if horizontal_execution.body else None
+            if isinstance(first_stmt, oir.AssignStmt) and first_stmt.left.name in forwarded:
+                target = node.horizontal_executions[index + 1]
+                copy = cast(oir.AssignStmt, target.body[0])
+                horizontal_execution = oir.HorizontalExecution(
+                    body=[oir.AssignStmt(left=copy.left, right=first_stmt.right)],
+                    mask=target.mask,
+                )
+                index += 1
+            lines.extend(
+                self.visit(horizontal_execution, extent=extents[index], sequential=sequential)
+            )
+            index += 1
+
+        start = self.visit(node.interval.start)
+        end = self.visit(node.interval.end)
+        if not sequential:
+            block.append(f"{self.K_START_NAME}, {self.K_END_NAME} = {start}, {end}")
+            block.extend(lines)
+            return
+
+        if node.loop_order == LoopOrder.FORWARD:
+            k_range = f"{start}, {end}"
+        else:
+            k_range = f"{end} - 1, {start} - 1, -1"
+        block.append(f"for {self.K_INDEX_NAME} in range({k_range}):")
+        with block.indented():
+            block.extend(lines)
+
+    def visit_Stencil(self, node: oir.Stencil, **kwargs: Any) -> str:
+        field_extents, horizontal_extents = compute_extents(node)
+        forwarded = self._forwarded_temporaries(node, horizontal_extents)
+        size_i, size_j, size_k = self.DOMAIN_SIZE_NAMES
+        params = [param.name for param in node.params]
+
+        block = codegen.TextBlock()
+        block.append("import numpy as np")
+        block.empty_line(2)
+        block.append(
+            "def run_computation({args}):".format(
+                args=", ".join(["_domain_", "_origin_", *(["*", *params] if params else [])])
+            )
+        )
+        with block.indented():
+            block.append(f"{size_i}, {size_j}, {size_k} = _domain_")
+            for param in node.params:
+                if isinstance(param, oir.FieldDecl):
+                    block.append(f"{param.name}{self.ORIGIN_MARKER} = _origin_['{param.name}']")
+                    block.append(f"{param.name} = {param.name}.view(np.ndarray)")
+
+            for vertical_loop in node.vertical_loops:
+                for decl in vertical_loop.declarations:
+                    if decl.name in forwarded:
+                        continue
+                    (i_lo, i_hi), (j_lo, j_hi), (k_lo, k_hi) = field_extents.get(
+                        decl.name, _ZERO_EXTENT
+                    )
+                    block.append(
+                        "{name} = np.empty(({i}, {j}, {k}), dtype={dtype})".format(
+                            name=decl.name,
+                            i=_sum([size_i], i_hi - i_lo),
+                            j=_sum([size_j], j_hi - j_lo),
+                            k=_sum([size_k], k_hi - k_lo),
+                            dtype=self.visit(decl.dtype),
+                        )
+                    )
+                    block.append(f"{decl.name}{self.ORIGIN_MARKER} = ({-i_lo}, {-j_lo}, {-k_lo})")
+
+            for vertical_loop, extents in zip(node.vertical_loops, horizontal_extents):
+                block.empty_line()
+                self.visit(vertical_loop, extents=extents, forwarded=forwarded, block=block)
+
+        return block.text + "\n"
+
+    @classmethod
+    def apply(cls, root: Any, *, format_source: bool = True, **kwargs: Any) -> str:
+        if not isinstance(root, oir.Stencil):
+            raise ValueError("apply() requires oir.Stencil root node")
+        generated_code = super().apply(root, **kwargs)
+        if format_source:
+            generated_code = codegen.format_source("python", generated_code)
+        return generated_code
@@ -54,7 +54,7 @@ class _GTIRResolveAuto(NodeTranslator):
     def visit_ParAssignStmt(self, node: gtir.ParAssignStmt, **kwargs: Any) -> gtir.ParAssignStmt:
         right = self.visit(node.right, **kwargs)
         left = self.visit(node.left, new_dtype=right.dtype, **kwargs)
-        return gtir.ParAssignStmt(left=left, right=right)
+        return gtir.ParAssignStmt(left=left, right=right, loc=node.loc)
 
     def visit_Stencil(self, node: gtir.Stencil, **kwargs: Any) -> gtir.Stencil:
         symtable = node.symtable_
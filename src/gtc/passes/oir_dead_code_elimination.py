@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from eve import NodeTranslator
+from gtc import oir
+from gtc.common import (
+    BuiltInLiteral,
+    CartesianOffset,
+    DataType,
+    LogicalOperator,
+    LoopOrder,
+    UnaryOperator,
+)
+
+
+def _accessed_names(node: Any) -> Set[str]:
+    return (
+        node.iter_tree().if_isinstance(oir.FieldAccess, oir.ScalarAccess).getattr("name").to_set()
+    )
+
+
+def _is_bool_literal(node: Any, value: BuiltInLiteral) -> bool:
+    return isinstance(node, oir.Literal) and node.dtype == DataType.BOOL and node.value == value
+
+
+def _bool_literal(value: BuiltInLiteral) -> oir.Literal:
+    return oir.Literal(value=value, dtype=DataType.BOOL)
+
+
+def _stmt_reads(stmt: oir.Stmt) -> Set[str]:
+    # statements other than assignments are conservatively assumed to read all their accesses
+    return _accessed_names(stmt.right if isinstance(stmt, oir.AssignStmt) else stmt)
+
+
+class _ConstantMaskFolding(NodeTranslator):
+    """
+    Replaces reads of constant boolean temporaries in masks by literals and simplifies the masks.
+
+    A temporary is considered constant if it is written exactly once, by an unmasked
+    assignment of a literal, and is only read at zero offset in masks of horizontal executions
+    following the write in the same vertical loop. This is the shape of the mask temporaries
+    created for `FieldIfStmt`s with a constant condition.
+    """
+
+    def visit_FieldAccess(
+        self, node: oir.FieldAccess, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> oir.Expr:
+        return constants.get(node.name, node)
+
+    def visit_UnaryOp(self, node: oir.UnaryOp, **kwargs: Any) -> oir.Expr:
+        expr = self.visit(node.expr, **kwargs)
+        if node.op == UnaryOperator.NOT:
+            if _is_bool_literal(expr, BuiltInLiteral.TRUE):
+                return _bool_literal(BuiltInLiteral.FALSE)
+            if _is_bool_literal(expr, BuiltInLiteral.FALSE):
+                return _bool_literal(BuiltInLiteral.TRUE)
+        return oir.UnaryOp(op=node.op, expr=expr)
+
+    def visit_BinaryOp(self, node: oir.BinaryOp, **kwargs: Any) -> oir.Expr:
+        left = self.visit(node.left, **kwargs)
+        right = self.visit(node.right, **kwargs)
+        if node.op in (LogicalOperator.AND, LogicalOperator.OR):
+            # the neutral element of the operator is dropped, the absorbing one is the result
+            neutral, absorbing = (
+                (BuiltInLiteral.TRUE, BuiltInLiteral.FALSE)
+                if node.op == LogicalOperator.AND
+                else (BuiltInLiteral.FALSE, BuiltInLiteral.TRUE)
+            )
+            for this, other in ((left, right), (right, left)):
+                if _is_bool_literal(this, neutral):
+                    return other
+                if _is_bool_literal(this, absorbing):
+                    return this
+        return oir.BinaryOp(op=node.op, left=left, right=right)
+
+    def visit_HorizontalExecution(
+        self, node: oir.HorizontalExecution, *, constants: Dict[str, oir.Literal], **kwargs: Any
+    ) -> Optional[oir.HorizontalExecution]:
+        if node.mask is None or not (_accessed_names(node.mask) & constants.keys()):
+            return node
+        mask = self.visit(node.mask, constants=constants, **kwargs)
+        if _is_bool_literal(mask, BuiltInLiteral.FALSE):
+            return None
+        if _is_bool_literal(mask, BuiltInLiteral.TRUE):
+            mask = None
+        return oir.HorizontalExecution(body=node.body, mask=mask, loc=node.loc)
+
+    @classmethod
+    def _find_constants(cls, node: oir.Stencil) -> Dict[str, oir.Literal]:
+        temporaries = {decl.name for loop in node.vertical_loops for decl in loop.declarations}
+        writes: Dict[str, List[Tuple[int, int, oir.AssignStmt, oir.HorizontalExecution]]] = {}
+        for i, loop in enumerate(node.vertical_loops):
+            for j, horizontal_execution in enumerate(loop.horizontal_executions):
+                for stmt in horizontal_execution.body:
+                    if isinstance(stmt, oir.AssignStmt) and stmt.left.name in temporaries:
+                        writes.setdefault(stmt.left.name, []).append(
+                            (i, j, stmt, horizontal_execution)
+                        )
+
+        body_reads = {
+            (i, j): set().union(*(_stmt_reads(stmt) for stmt in horizontal_execution.body))
+            for i, loop in enumerate(node.vertical_loops)
+            for j, horizontal_execution in enumerate(loop.horizontal_executions)
+        }
+        mask_accesses = {
+            (i, j): horizontal_execution.mask.iter_tree().if_isinstance(oir.FieldAccess).to_list()
+            for i, loop in enumerate(node.vertical_loops)
+            for j, horizontal_execution in enumerate(loop.horizontal_executions)
+            if horizontal_execution.mask is not None
+        }
+
+        constants: Dict[str, oir.Literal] = {}
+        for name, name_writes in writes.items():
+            if len(name_writes) != 1:
+                continue
+            loop_index, he_index, stmt, horizontal_execution = name_writes[0]
+            if not isinstance(stmt.right, oir.Literal) or horizontal_execution.mask is not None:
+                continue
+            if any(name in reads for reads in body_reads.values()):
+                continue
+
+            foldable = True
+            for (i, j), accesses in mask_accesses.items():
+                for access in accesses:
+                    if access.name == name and (
+                        i != loop_index
+                        or j <= he_index
+                        or access.offset.to_dict() != CartesianOffset.zero().to_dict()
+                    ):
+                        foldable = False
+            if foldable:
+                constants[name] = stmt.right
+
+        return constants
+
+    @classmethod
+    def apply(cls, node: oir.Stencil) -> oir.Stencil:
+        constants = cls._find_constants(node)
+        if not constants:
+            return node
+
+        instance = cls()
+        vertical_loops = []
+        for loop in node.vertical_loops:
+            horizontal_executions = [
+                result
+                for result in (
+                    instance.visit(horizontal_execution, constants=constants)
+                    for horizontal_execution in loop.horizontal_executions
+                )
+                if result is not None
+            ]
+            vertical_loops.append(
+                oir.VerticalLoop(
+                    interval=loop.interval,
+                    loop_order=loop.loop_order,
+                    declarations=loop.declarations,
+                    horizontal_executions=horizontal_executions,
+                    loc=loop.loc,
+                )
+            )
+        return oir.Stencil(
+            name=node.name, params=node.params, vertical_loops=vertical_loops, loc=node.loc
+        )
+
+
+def _prune_horizontal_execution(
+    node: oir.HorizontalExecution, live: Set[str]
+) -> Tuple[Optional[oir.HorizontalExecution], Set[str]]:
+    """Remove statements without effect on `live` symbols and return the symbols read by the rest."""
+    body: List[oir.Stmt] = []
+    reads: Set[str] = set()
+    # statements are executed in order for each grid point, so later writes
+    # within the same execution can make earlier ones live
+    local_live = set(live)
+    for stmt in reversed(node.body):
+        if not isinstance(stmt, oir.AssignStmt) or stmt.left.name in local_live:
+            body.insert(0, stmt)
+            stmt_reads = _stmt_reads(stmt)
+            reads |= stmt_reads
+            local_live |= stmt_reads
+
+    if not body:
+        return None, set()
+    if node.mask:
+        reads |= _accessed_names(node.mask)
+
+    if len(body) == len(node.body):
+        return node, reads
+    return oir.HorizontalExecution(body=body, mask=node.mask, loc=node.loc), reads
+
+
+def _prune_vertical_loop(
+    node: oir.VerticalLoop, live: Set[str]
+) -> Tuple[List[oir.HorizontalExecution], Set[str]]:
+    """Prune the horizontal executions of a vertical loop given the symbols live after it."""
+    live = set(live)
+    while True:
+        horizontal_executions: List[oir.HorizontalExecution] = []
+        live_before = set(live)
+        for horizontal_execution in reversed(node.horizontal_executions):
+            pruned, reads = _prune_horizontal_execution(horizontal_execution, live)
+            if pruned is not None:
+                horizontal_executions.insert(0, pruned)
+                live |= reads
+
+        # in sequential loops, values written in one iteration can be read by any
+        # horizontal execution of the following iterations: iterate to a fixed point
+        if node.loop_order == LoopOrder.PARALLEL or live == live_before:
+            return horizontal_executions, live
+
+
+def dead_code_elimination(node: oir.Stencil) -> oir.Stencil:
+    """
+    Remove computations which do not contribute to any API field.
+
+    Liveness of symbols is propagated backwards from the API fields through the
+    horizontal executions of all vertical loops. Statements writing only dead symbols,
+    horizontal executions without remaining statements, declarations of temporaries which
+    are no longer accessed, and empty vertical loops are removed. Masks derived from constant
+    conditions are folded before the analysis.
+
+    Writes are never considered to kill previous values, since masks and intervals
+    make it impossible to know statically if a write covers all points previously written.
+    """
+    assert isinstance(node, oir.Stencil)
+    node = _ConstantMaskFolding.apply(node)
+
+    live: Set[str] = {param.name for param in node.params if isinstance(param, oir.FieldDecl)}
+    pruned_loops: List[Tuple[oir.VerticalLoop, List[oir.HorizontalExecution]]] = []
+    for vertical_loop in reversed(node.vertical_loops):
+        horizontal_executions, live = _prune_vertical_loop(vertical_loop, live)
+        pruned_loops.insert(0, (vertical_loop, horizontal_executions))
+
+    used_names: Set[str] = set()
+    for _, horizontal_executions in pruned_loops:
+        for horizontal_execution in horizontal_executions:
+            used_names |= _accessed_names(horizontal_execution)
+
+    # temporaries are visible in the whole stencil: declarations of removed loops
+    # which are still accessed elsewhere are moved to the first remaining loop
+    orphan_declarations: List[oir.Temporary] = []
+    vertical_loops: List[oir.VerticalLoop] = []
+    for vertical_loop, horizontal_executions in pruned_loops:
+        declarations = [decl for decl in vertical_loop.declarations if decl.name in used_names]
+        if horizontal_executions:
+            vertical_loops.append(
+                oir.VerticalLoop(
+                    interval=vertical_loop.interval,
+                    loop_order=vertical_loop.loop_order,
+                    declarations=declarations,
+                    horizontal_executions=horizontal_executions,
+                    loc=vertical_loop.loc,
+                )
+            )
+        else:
+            orphan_declarations.extend(declarations)
+
+    if orphan_declarations:
+        first = vertical_loops[0]
+        vertical_loops[0] = oir.VerticalLoop(
+            interval=first.interval,
+            loop_order=first.loop_order,
+            declarations=[*orphan_declarations, *first.declarations],
+            horizontal_executions=first.horizontal_executions,
+            loc=first.loc,
+        )
+
+    return oir.Stencil(
+        name=node.name, params=node.params, vertical_loops=vertical_loops, loc=node.loc
+    )
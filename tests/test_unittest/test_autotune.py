@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+import gt4py
+from gt4py import autotune, gtscript
+from gt4py import storage as gt_storage
+from gt4py.gtscript import PARALLEL, Field, computation, interval
+
+
+def average_stencil(in_field: Field[float], out_field: Field[float], *, weight: float):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        out_field = weight * (in_field[1, 0, 0] + in_field[-1, 0, 0])  # type: ignore  # noqa
+
+
+@pytest.fixture
+def cache_root(monkeypatch, tmp_path):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    yield tmp_path
+
+
+def test_domain_class():
+    assert autotune.domain_class((1, 2, 3)) == (0, 1, 2)
+    assert autotune.domain_class((128, 129, 80)) == (7, 8, 7)
+
+
+def test_auto_backend(cache_root):
+    stencil = gtscript.stencil(backend="auto", definition=average_stencil)
+    assert isinstance(stencil, autotune.AutoStencil)
+    in_field = gt_storage.ones("numpy", default_origin=(1, 0, 0), shape=(10, 8, 4), dtype=float)
+    out_field = gt_storage.zeros("numpy", default_origin=(1, 0, 0), shape=(10, 8, 4), dtype=float)
+    arguments = {"in_field": in_field, "out_field": out_field, "weight": 0.5}
+
+    # Nothing recorded: the backend of the storages is used
+    variant, domain = stencil.select(arguments)
+    assert variant.backend == "numpy"
+    assert domain == (8, 8, 4)
+
+    ranking = stencil.autotune(
+        in_field, out_field, weight=0.5, candidates=["debug", ("numpy", {})], repeat=2, warmup=1
+    )
+    assert sorted(item["backend"] for item in ranking) == ["debug", "numpy"]
+    assert ranking[0]["time"] <= ranking[1]["time"]
+    assert (cache_root / gt4py.config.cache_settings["dir_name"] / "autotune.json").exists()
+
+    # The ranking is shared by stencils with the same definition, for domains of the same class
+    other_stencil = gtscript.stencil(backend="auto", definition=average_stencil)
+    assert autotune.lookup(other_stencil.key, (7, 6, 3)) == ranking
+    assert autotune.lookup(other_stencil.key, (64, 64, 64)) is None
+    variant, _ = other_stencil.select(arguments)
+    assert variant.backend == ranking[0]["backend"]
+
+    other_stencil(in_field, out_field, weight=2.0)
+    np.testing.assert_allclose(np.asarray(out_field)[1:-1], 4.0)
+
+
+def test_auto_backend_builds_only_selected_variant(cache_root):
+    stencil = gtscript.stencil(backend="auto", definition=average_stencil)
+    in_field = gt_storage.ones("numpy", default_origin=(1, 0, 0), shape=(10, 8, 4), dtype=float)
+    out_field = gt_storage.zeros("numpy", default_origin=(1, 0, 0), shape=(10, 8, 4), dtype=float)
+    arguments = {"in_field": in_field, "out_field": out_field, "weight": 0.5}
+    autotune.record(stencil.key, (8, 8, 4), [{"backend": "debug", "options": {}, "time": 0.0}])
+
+    variant, _ = stencil.select(arguments, domain=(8, 8, 4))
+    assert variant.backend == "debug"
+    assert [variant.backend for variant in stencil._variants.values()] == ["debug"]
@@ -14,11 +14,17 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import numpy as np
 import pytest
 
 import gt4py
-from gt4py.gtscript import PARALLEL, Field, computation, interval
+from gt4py import gtscript
+from gt4py import storage as gt_storage
+from gt4py.backend.gt_backends import _make_timed_stage_groups
+from gt4py.backend.gtc_backend.common import lower_to_oir
+from gt4py.gtscript import FORWARD, PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
+from gtc.gtcpp import gtcpp_codegen, oir_to_gtcpp
 
 
 @pytest.fixture(params=[name for name in gt4py.backend.REGISTRY.keys()])
@@ -41,7 +47,7 @@ def test_generate_computation(backend, tmp_path):
     builder = StencilBuilder(init_1, backend=backend).with_caching(
         "nocaching", output_path=tmp_path / __name__ / "generate_computation"
     )
-    if backend.name.startswith("gtc:"):
+    if backend.name.startswith("gtc:gt"):
         result = builder.backend.generate_computation(ir=builder.definition_ir)
     else:
         result = builder.backend.generate_computation()
@@ -77,9 +83,143 @@ def test_generate_bindings(backend, tmp_path):
             result = builder.backend.generate_bindings("python")
     else:
         # assumption: only gt backends support python bindings
-        if backend.name.startswith("gtc:"):
+        if backend.name.startswith("gtc:gt"):
             result = builder.backend.generate_bindings("python", ir=builder.definition_ir)
         else:
             result = builder.backend.generate_bindings("python")
         assert "init_1_src" in result
         assert "bindings.cpp" in result["init_1_src"]
+
+
+@pytest.mark.parametrize("max_cached_computations", [None, 0])
+def test_gt_computation_cache(max_cached_computations, tmp_path):
+    """Test that legacy gt backends reuse computation objects unless disabled."""
+    backend_opts = {}
+    if max_cached_computations is not None:
+        backend_opts["max_cached_computations"] = max_cached_computations
+    builder = (
+        StencilBuilder(init_1, backend=gt4py.backend.from_name("gtx86"))
+        .with_options(name="init_1", module=__name__, backend_opts=backend_opts)
+        .with_caching("nocaching", output_path=tmp_path / __name__ / "computation_cache")
+    )
+    computation = builder.backend.generate_computation()["init_1_src"]["computation.cpp"]
+    bindings = builder.backend.generate_bindings("python")["init_1_src"]["bindings.cpp"]
+
+    is_cached = max_cached_computations != 0
+    assert ("computation_cache.find(domain)" in computation) == is_cached
+    assert ("void clear_computation_cache()" in computation) == is_cached
+    assert ('exec_info_dict["computation_cache_hit"]' in bindings) == is_cached
+    assert ('m.def("clear_computation_cache"' in bindings) == is_cached
+
+
+@pytest.mark.parametrize("backend_name", ["gtx86", "gtc:gt:cpu_ifirst"])
+@pytest.mark.parametrize("time_stages", [False, True])
+def test_gt_time_stages(backend_name, time_stages, tmp_path):
+    """Test that C++ backends only report stage timings if requested."""
+    builder = (
+        StencilBuilder(init_1, backend=gt4py.backend.from_name(backend_name))
+        .with_options(name="init_1", module=__name__, backend_opts={"time_stages": time_stages})
+        .with_caching("nocaching", output_path=tmp_path / __name__ / "time_stages")
+    )
+    kwargs = {"ir": builder.definition_ir} if backend_name.startswith("gtc:gt") else {}
+    computation = "".join(builder.backend.generate_computation(**kwargs)["init_1_src"].values())
+    bindings = builder.backend.generate_bindings("python", **kwargs)["init_1_src"]["bindings.cpp"]
+
+    assert ("stage_times.push_back(" in computation) == time_stages
+    assert ('exec_info_dict["stage_times"]' in bindings) == time_stages
+    if time_stages:
+        # source line of the assignment relative to the stencil definition
+        assert "std::vector<int>{4}" in "".join(bindings.split())
+
+
+def independent_multi_stages(in_f: Field[float], mid_f: Field[float], out_f: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        mid_f = 2.0 * in_f  # type: ignore  # noqa: F841
+    with computation(FORWARD), interval(...):  # type: ignore
+        out_f = mid_f + 1.0  # type: ignore  # noqa: F841
+
+
+def extended_multi_stages(in_f: Field[float], mid_f: Field[float], out_f: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        mid_f = 2.0 * in_f  # type: ignore  # noqa: F841
+    with computation(FORWARD), interval(...):  # type: ignore
+        # no offset, but in a stage computed on an extended domain
+        tmp_f = mid_f  # type: ignore
+        out_f = tmp_f[1, 0, 0] + tmp_f[-1, 0, 0]  # type: ignore  # noqa: F841
+
+
+@pytest.mark.parametrize("backend_name", ["gtx86", "gtc:gt:cpu_ifirst"])
+@pytest.mark.parametrize(
+    ["definition", "expected_groups"],
+    [(independent_multi_stages, [[0], [1]]), (extended_multi_stages, [[0, 1]])],
+)
+def test_gt_time_stages_groups(backend_name, definition, expected_groups):
+    """Test that multi-stages are only timed separately if GridTools computes them identically."""
+    builder = StencilBuilder(definition, backend=gt4py.backend.from_name(backend_name))
+    if backend_name.startswith("gtc:gt"):
+        program = oir_to_gtcpp.OIRToGTCpp().visit(lower_to_oir(builder.definition_ir, None))
+        groups = gtcpp_codegen.timed_multi_stage_groups(program)
+    else:
+        groups = [
+            group["multi_stages"] for group in _make_timed_stage_groups(builder.implementation_ir)
+        ]
+    assert groups == expected_groups
+
+
+@pytest.mark.parametrize("backend_name", ["gtx86", "gtc:gt:cpu_ifirst"])
+def test_gt_time_stages_results(backend_name):
+    """Test that timing the stages does not change the results."""
+    shape = (6, 5, 3)
+    in_f = gt_storage.from_array(
+        np.random.randn(*shape), backend=backend_name, default_origin=(1, 0, 0)
+    )
+    results = []
+    for time_stages in [False, True]:
+        stencil = gtscript.stencil(
+            backend=backend_name,
+            definition=extended_multi_stages,
+            name=f"extended_multi_stages_{time_stages}",
+            time_stages=time_stages,
+        )
+        mid_f = gt_storage.zeros(backend_name, default_origin=(1, 0, 0), shape=shape, dtype=float)
+        out_f = gt_storage.zeros(backend_name, default_origin=(1, 0, 0), shape=shape, dtype=float)
+        stencil(in_f, mid_f, out_f)
+        results.append(np.asarray(out_f).copy())
+
+    np.testing.assert_array_equal(results[0], results[1])
+    np.testing.assert_allclose(
+        results[0][1:-1], 2.0 * (np.asarray(in_f)[2:] + np.asarray(in_f)[:-2])
+    )
+
+
+@pytest.mark.parametrize("backend_name", ["gtx86", "gtmc", "gtc:gt:cpu_ifirst"])
+def test_native_build_options(backend_name, monkeypatch):
+    """Native build options are part of the stencil ID, with "native" CPUs resolved."""
+    monkeypatch.setattr(
+        gt4py.backend.pyext_builder, "resolve_native_cpu", lambda flag="march": "skylake"
+    )
+    builder = StencilBuilder(init_1).with_backend(backend_name)
+    ids = set()
+    for backend_opts in [{}, {"march": "native"}, {"march": "skylake"}, {"fast_math": True}]:
+        builder.with_options(name="init_1", module="", backend_opts=backend_opts)
+        ids.add(builder.stencil_id.version)
+        filtered_options = builder.backend.filter_options_for_id(builder.options)
+        if "march" in backend_opts:
+            assert filtered_options.backend_opts["march"] == "skylake"
+    # -march=native on a skylake host builds the same binary as -march=skylake
+    assert len(ids) == 3
+
+
+def test_native_build_flags():
+    extra_link_args = list(gt4py.config.build_settings["extra_link_args"])
+    build_opts = gt4py.backend.pyext_builder.get_gt_pyext_build_opts(
+        march="native", mtune="generic", fast_math=True, lto=True
+    )
+    for flag in ["-march=native", "-mtune=generic", "-ffast-math", "-flto"]:
+        assert flag in build_opts["extra_compile_args"]
+    assert "-flto" in build_opts["extra_link_args"]
+    assert (
+        "-ffast-math"
+        not in gt4py.backend.pyext_builder.get_gt_pyext_build_opts()["extra_compile_args"]
+    )
+    assert gt4py.config.build_settings["extra_link_args"] == extra_link_args
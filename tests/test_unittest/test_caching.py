@@ -14,9 +14,16 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import concurrent.futures
+import errno
+import multiprocessing
+import os
+import pathlib
+
 import pytest
 
 import gt4py
+from gt4py import gtscript
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 
@@ -60,7 +67,7 @@ def test_jit_properties(builder):
     builder = builder(simple_stencil).with_caching("jit")
     jit_caching = builder.caching
 
-    # check state of properties directly after init, cache_info file has not been written
+    # check state of properties directly after init, cache_info has not been written
     assert not jit_caching.cache_info
     assert jit_caching.options_id
 
@@ -68,7 +75,7 @@ def test_jit_properties(builder):
     stencil_id = jit_caching.stencil_id
     assert stencil_id.qualified_name == f"{__name__}.foo"
     assert stencil_id.version
-    assert jit_caching.cache_info_path.parent == builder.module_path.parent
+    assert jit_caching.cache_info_path.parent == jit_caching.backend_root_path
     assert stencil_id.version in jit_caching.module_postfix
     assert stencil_id.version in jit_caching.class_name
 
@@ -97,7 +104,7 @@ def test_jit_version(builder):
     assert not stencil_fingerprints_are_equal(original, withdoc)
 
     original.backend.generate()
-    # cache_info file was written and can now be read
+    # cache_info was written and can now be read
     assert original.caching.cache_info
     assert could_load_stencil_from_cache(original)
     assert could_load_stencil_from_cache(duplicate)
@@ -111,7 +118,7 @@ def test_jit_version(builder):
     original.definition.__doc__ = "Added docstring." ""
     assert not could_load_stencil_from_cache(original, catch_exceptions=True)
     assert not could_load_stencil_from_cache(duplicate, catch_exceptions=True)
-    # fingerprint has changed and with it the file paths, new cache_info file does not exist.
+    # fingerprint has changed and with it the file paths, new cache_info does not exist.
     assert not original.caching.cache_info
     assert not duplicate.caching.cache_info
 
@@ -124,6 +131,80 @@ def test_jit_extrainfo(builder):
     assert "pyext_md5" in builder.caching.cache_info
 
 
+def test_jit_cache_index(builder):
+    builder = builder(simple_stencil, "numpy").with_caching("jit")
+    builder.backend.generate()
+    module_path = builder.module_path
+    cache_info = builder.caching.cache_info
+    assert builder.caching.cache_info_path.exists()
+    assert cache_info["module_size"] == module_path.stat().st_size
+    assert cache_info["module_mtime_ns"] == module_path.stat().st_mtime_ns
+    assert could_load_stencil_from_cache(builder)
+
+    # metadata changed but not the contents: validated by rehashing
+    os.utime(module_path, ns=(0, 0))
+    assert could_load_stencil_from_cache(builder)
+
+    # contents changed
+    source = module_path.read_text()
+    module_path.write_text(source.replace("field", "FIELD"))
+    assert not could_load_stencil_from_cache(builder)
+
+    # with matching metadata only the deep validation detects the change
+    os.utime(module_path, ns=(0, cache_info["module_mtime_ns"]))
+    assert could_load_stencil_from_cache(builder)
+    assert not builder.caching.is_cache_info_available_and_consistent(
+        validate_hash=True, deep_validation=True
+    )
+
+
+def test_jit_ir_cache(builder):
+    build_info = {}
+    original = (
+        builder(simple_stencil)
+        .with_caching("jit")
+        .with_changed_options(rebuild=True, build_info=build_info)
+    )
+    original.implementation_ir
+    assert build_info["ir_cache"] == {"definition_ir": "miss", "implementation_ir": "miss"}
+
+    # another backend reuses the cached IRs of the same definition
+    build_info = {}
+    other_backend = (
+        builder(simple_stencil, "numpy")
+        .with_caching("jit")
+        .with_changed_options(build_info=build_info)
+    )
+    assert other_backend.implementation_ir.name == original.implementation_ir.name
+    assert build_info["ir_cache"] == {"definition_ir": "hit", "implementation_ir": "hit"}
+    assert build_info["iir"] is other_backend.implementation_ir
+
+    # the no caching strategy does not cache IRs
+    build_info = {}
+    nocaching = (
+        builder(simple_stencil)
+        .with_caching("nocaching")
+        .with_changed_options(build_info=build_info)
+    )
+    nocaching.implementation_ir
+    assert build_info["ir_cache"] == {"definition_ir": "miss", "implementation_ir": "miss"}
+
+
+def test_jit_ir_cache_write_error(builder, monkeypatch):
+    def write_atomic(*args, **kwargs):
+        raise OSError("Read-only file system")
+
+    monkeypatch.setattr(gt4py.utils.filelock, "write_atomic", write_atomic)
+    build_info = {}
+    stencil = (
+        builder(simple_stencil)
+        .with_caching("jit")
+        .with_changed_options(rebuild=True, build_info=build_info)
+    )
+    assert stencil.implementation_ir
+    assert build_info["ir_cache"] == {"definition_ir": "miss", "implementation_ir": "miss"}
+
+
 def test_nocaching_paths(builder, tmp_path):
     builder = builder(simple_stencil).with_caching("nocaching", output_path=tmp_path)
     no_caching = builder.caching
@@ -164,3 +245,204 @@ def test_nocaching_generate(builder, tmp_path):
     builder_g.backend.generate()
 
     assert_nocaching_gtcpp_source_file_tree_conforms_to_expectations(tmp_path / "foo_g", "foo")
+
+
+def test_layered_caching(builder, monkeypatch, tmp_path):
+    read_only_root = tmp_path / "shared" / ".gt_cache"
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path / "shared"))
+    builder(simple_stencil, "numpy").with_caching("jit").build()
+    read_only_files = {path: path.stat().st_mtime_ns for path in read_only_root.rglob("*")}
+
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path / "private"))
+
+    # found in the read-only layer
+    build_info = {}
+    prebuilt = (
+        builder(simple_stencil, "numpy")
+        .with_caching("layered", read_only_roots=[tmp_path / "missing", read_only_root])
+        .with_changed_options(build_info=build_info)
+    )
+    stencil_class = prebuilt.build()
+    assert prebuilt.caching.is_read_only
+    assert "generate" not in build_info["phases"]
+    assert read_only_root in pathlib.Path(stencil_class._file_name).parents
+
+    # not found in the read-only layer: built in the writable cache
+    build_info = {}
+    new = (
+        builder(simple_stencil_with_doc, "numpy")
+        .with_caching("layered", read_only_roots=[read_only_root])
+        .with_changed_options(build_info=build_info)
+    )
+    stencil_class = new.build()
+    assert not new.caching.is_read_only
+    assert "generate" in build_info["phases"]
+    assert new.caching.writable_root_path in pathlib.Path(stencil_class._file_name).parents
+
+    assert read_only_files == {path: path.stat().st_mtime_ns for path in read_only_root.rglob("*")}
+
+
+def stencil_with_external(field: Field[float]):  # type: ignore
+    from __externals__ import INCREMENT
+
+    with computation(PARALLEL), interval(...):  # type: ignore
+        field += INCREMENT  # type: ignore
+
+
+def test_cache_garbage_collection(monkeypatch, tmp_path):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    cache_path = tmp_path / ".gt_cache"
+
+    def build(increment):
+        return (
+            StencilBuilder(stencil_with_external, backend=gt4py.backend.from_name("numpy"))
+            .with_externals({"INCREMENT": increment})
+            .build()
+        )
+
+    def cached_versions():
+        return {
+            entry.stem.rsplit("_", 1)[-1]
+            for entry in gt4py.caching.iter_cache_entries(cache_path)
+            if entry.stencil_name
+        }
+
+    # versions are kept side by side by default
+    versions = [build(increment)._gt_id_ for increment in [1.0, 2.0, 3.0]]
+    assert cached_versions() == set(versions)
+
+    # building a new version evicts the least recently used ones, if requested
+    monkeypatch.setitem(gt4py.config.cache_settings, "max_versions", 2)
+    versions.append(build(4.0)._gt_id_)
+    assert cached_versions() == set(versions[2:])
+    entries = [
+        entry for entry in gt4py.caching.iter_cache_entries(cache_path) if entry.stencil_name
+    ]
+    assert all(entry.size > 0 and entry.last_access > 0 for entry in entries)
+
+    stencil_class = build(4.0)
+    assert pathlib.Path(stencil_class._file_name).exists()
+
+    # size and age budgets
+    assert not gt4py.caching.collect_garbage(cache_path, max_age=3600.0)
+    evicted = gt4py.caching.collect_garbage(cache_path, max_size=0, dry_run=True)
+    assert len(evicted) == len(list(gt4py.caching.iter_cache_entries(cache_path)))
+    gt4py.caching.collect_garbage(cache_path, max_size=0)
+    assert not list(gt4py.caching.iter_cache_entries(cache_path))
+    assert not pathlib.Path(stencil_class._file_name).exists()
+
+
+def test_cache_entry_not_removed_while_loading(monkeypatch, tmp_path):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    cache_path = tmp_path / ".gt_cache"
+    StencilBuilder(simple_stencil, backend=gt4py.backend.from_name("numpy")).build()
+
+    builder = StencilBuilder(simple_stencil, backend=gt4py.backend.from_name("numpy"))
+    load = builder.backend._load
+    removed = []
+
+    def load_and_remove():
+        entries = [
+            entry for entry in gt4py.caching.iter_cache_entries(cache_path) if entry.stencil_name
+        ]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            removed.extend(executor.map(gt4py.caching.remove_cache_entry, entries))
+        return load()
+
+    monkeypatch.setattr(builder.backend, "_load", load_and_remove)
+    stencil_class = builder.build()
+    assert removed == [False]
+    assert pathlib.Path(stencil_class._file_name).exists()
+
+
+def _build_simple_stencil(_):
+    build_info = {}
+    stencil = gtscript.stencil(
+        backend="numpy", definition=simple_stencil, name="concurrent", build_info=build_info
+    )
+    return "generate" in build_info["phases"], stencil._gt_id_
+
+
+def test_jit_concurrent_builds(monkeypatch, tmp_path):
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    try:
+        context = multiprocessing.get_context("fork")
+    except ValueError:
+        pytest.skip("Requires the 'fork' start method")
+
+    n_processes = 8
+    with context.Pool(n_processes) as pool:
+        results = pool.map(_build_simple_stencil, range(4 * n_processes), chunksize=1)
+
+    # exactly one process generated the stencil, all others loaded the same version
+    assert sum(generated for generated, _ in results) == 1
+    assert len({version for _, version in results}) == 1
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_file_lock_timeout(tmp_path):
+    lock_path = tmp_path / "test.lock"
+    with gt4py.utils.filelock.FileLock(lock_path) as lock:
+        assert lock.is_locked
+        # reentrant in the same thread
+        with gt4py.utils.filelock.FileLock(lock_path, timeout=0.1):
+            pass
+        assert lock.is_locked
+
+        other_process = multiprocessing.get_context("fork").Process(
+            target=gt4py.utils.filelock.FileLock(lock_path, timeout=0.1).acquire
+        )
+        other_process.start()
+        other_process.join()
+        assert other_process.exitcode != 0
+
+    assert not lock.is_locked
+
+
+def test_file_lock_shared(tmp_path):
+    lock_path = tmp_path / "test.lock"
+    context = multiprocessing.get_context("fork")
+
+    def run_in_other_process(lock):
+        other_process = context.Process(target=lock.acquire)
+        other_process.start()
+        other_process.join()
+        return other_process.exitcode == 0
+
+    with gt4py.utils.filelock.FileLock(lock_path, shared=True) as lock:
+        assert lock.is_locked
+        # other processes can take shared locks, but not exclusive ones
+        assert run_in_other_process(gt4py.utils.filelock.FileLock(lock_path, shared=True))
+        assert not run_in_other_process(gt4py.utils.filelock.FileLock(lock_path, timeout=0.1))
+        with pytest.raises(RuntimeError, match="upgrade"):
+            gt4py.utils.filelock.FileLock(lock_path).acquire()
+
+    with gt4py.utils.filelock.FileLock(lock_path):
+        # shared locks are reentrant within exclusive ones
+        with gt4py.utils.filelock.FileLock(lock_path, shared=True, timeout=0.1):
+            pass
+        assert not run_in_other_process(
+            gt4py.utils.filelock.FileLock(lock_path, shared=True, timeout=0.1)
+        )
+
+
+def test_file_lock_shared_read_only(monkeypatch, tmp_path):
+    existing_lock_path = tmp_path / "existing.lock"
+    existing_lock_path.touch()
+    missing_lock_path = tmp_path / "missing.lock"
+    open_file = os.open
+
+    def read_only_open(path, flags, *args):
+        if flags & (os.O_CREAT | os.O_RDWR | os.O_WRONLY):
+            raise OSError(errno.EROFS, "Read-only file system", path)
+        return open_file(path, flags, *args)
+
+    monkeypatch.setattr(gt4py.utils.filelock.os, "open", read_only_open)
+    with gt4py.utils.filelock.FileLock(missing_lock_path, shared=True) as lock:
+        assert lock.is_locked
+    assert not missing_lock_path.exists()
+
+    with gt4py.utils.filelock.FileLock(existing_lock_path, shared=True) as lock:
+        assert lock.is_locked
+    with pytest.raises(OSError):
+        gt4py.utils.filelock.FileLock(existing_lock_path).acquire()
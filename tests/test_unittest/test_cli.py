@@ -18,12 +18,15 @@
 
 import re
 import sys
+import time
 
 import pytest
 from click.testing import CliRunner
 
-from gt4py import backend, cli
+import gt4py
+from gt4py import backend, cli, gtscript
 from gt4py.backend.base import CLIBackendMixin
+from gt4py.gtscript import PARALLEL, Field, computation, interval
 
 
 @pytest.fixture
@@ -102,6 +105,7 @@ BACKEND_ROW_PATTERN_BY_NAME = {
     "gtmc": r"^\s*gtmc\s*c\+\+\s*python\s*Yes",
     "gtcuda": r"^\s*gtcuda\s*cuda\s*python\s*Yes",
     "gtc:gt:cpu_ifirst": r"^\s*gtc:gt:cpu_ifirst\s*c\+\+\s*python\s*Yes",
+    "gtc:numpy": r"^\s*gtc:numpy\s*python\s*Yes",
     "dawn:gtx86": r"^\s*dawn:gtx86\s*c\+\+\s*python\s*No",
     "dawn:gtmc": r"^\s*dawn:gtmc\s*c\+\+\s*python\s*No",
     "dawn:gtcuda": r"^\s*dawn:gtcuda\s*cuda\s*python\s*No",
@@ -274,3 +278,75 @@ def test_write_computation_src(tmp_path, simple_stencil):
     assert src.exists() and src.is_dir()
     assert header.exists() and header.read_text() == test_src[toplevel]["include"]["header.hpp"]
     assert main.exists() and main.read_text() == test_src[toplevel]["src"]["main.cpp"]
+
+
+def copy_stencil(input_field: Field[float], output_field: Field[float]):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        output_field = input_field  # type: ignore  # noqa: F841
+
+
+def test_cache_stats_and_gc(clirunner, monkeypatch, tmp_path):
+    """Test the cache stats and gc subcommands of gtpyc."""
+    monkeypatch.setitem(gt4py.config.cache_settings, "root_path", str(tmp_path))
+    gtscript.stencil(backend="numpy", definition=copy_stencil)
+    cache_path = str(tmp_path / ".gt_cache")
+
+    result = clirunner.invoke(cli.gtpyc, ["cache", "stats"], catch_exceptions=False)
+    assert result.exit_code == 0
+    assert re.findall(r"^\s*numpy\s*1\s", result.output, re.MULTILINE), print(result.output)
+
+    result = clirunner.invoke(
+        cli.gtpyc, ["cache", "gc", "--max-size=0", "--dry-run"], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert "would be removed" in result.output
+    assert len(list(gt4py.caching.iter_cache_entries(tmp_path))) > 0
+
+    # Maximum ages are in seconds unless a unit is given, entries were last used 2 hours ago
+    now = time.time()
+    with monkeypatch.context() as patch:
+        patch.setattr(gt4py.caching.time, "time", lambda: now + 7200)
+        for max_age, is_evicted in [("3600", True), ("60m", True), ("1h", True), ("1d", False)]:
+            result = clirunner.invoke(
+                cli.gtpyc,
+                ["cache", "gc", f"--max-age={max_age}", "--dry-run"],
+                catch_exceptions=False,
+            )
+            assert result.exit_code == 0
+            assert ("0 entries" not in result.output) == is_evicted, print(result.output)
+
+    result = clirunner.invoke(
+        cli.gtpyc, ["cache", "gc", f"--path={cache_path}", "--max-size=0"], catch_exceptions=False
+    )
+    assert result.exit_code == 0
+    assert not list(gt4py.caching.iter_cache_entries(tmp_path))
+
+
+def test_bench(clirunner, simple_stencil):
+    """Time the stencils of a module with two backends."""
+    result = clirunner.invoke(
+        cli.gtpyc,
+        [
+            "bench",
+            "--backend=debug",
+            "--backend=numpy",
+            "--domain=4,3,2",
+            "--repeat=2",
+            "--warmup=1",
+            str(simple_stencil),
+        ],
+        catch_exceptions=False,
+    )
+    assert result.exit_code == 0
+    assert "Domain: (4, 3, 2), 2 calls after 1 warmup calls" in result.output
+    assert re.findall(r"^\s*init_1\s+debug\s+[0-9.]+", result.output, re.MULTILINE)
+    assert re.findall(r"^\s*init_1\s+numpy\s+[0-9.]+", result.output, re.MULTILINE)
+    assert "speedup vs debug" in result.output
+
+
+def test_bench_invalid_domain(clirunner, simple_stencil):
+    result = clirunner.invoke(
+        cli.gtpyc, ["bench", "--backend=numpy", "--domain=4,3", str(simple_stencil)]
+    )
+    assert result.exit_code == 2
+    assert "Invalid domain" in result.output
@@ -14,6 +14,9 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import csv
+import io
+import json
 from typing import Any, Dict
 
 import numpy as np
@@ -25,6 +28,7 @@ from hypothesis.extra.numpy import arrays as st_arrays
 from gt4py import backend as gt_backend
 from gt4py import gtscript
 from gt4py import storage as gt_storage
+from gt4py.utils import perf, timing
 
 from ..definitions import CPU_BACKENDS
 
@@ -280,5 +284,115 @@ class TestExecInfo:
         )
 
 
+def test_numpy_profile():
+    def stencil_def(
+        in_field: gtscript.Field[float], out_field: gtscript.Field[float]  # type: ignore  # noqa
+    ):
+        with computation(PARALLEL), interval(...):  # type: ignore  # noqa
+            tmp = in_field[1, 0, 0] + in_field[-1, 0, 0]  # type: ignore
+            out_field = 0.5 * tmp  # noqa
+
+    stencil = gtscript.stencil(backend="numpy", definition=stencil_def, profile=True)
+    in_field = gt_storage.ones("numpy", default_origin=(1, 0, 0), shape=(5, 3, 2), dtype=float)
+    out_field = gt_storage.zeros("numpy", default_origin=(1, 0, 0), shape=(5, 3, 2), dtype=float)
+    for _ in range(2):
+        stencil(in_field, out_field, origin=(1, 0, 0), domain=(3, 3, 2))
+
+    profile = type(stencil)._gt_profile_
+    assert profile["ncalls"] == 2
+    # line numbers are relative to the 'def' statement
+    assert set(profile["times"].keys()) == {5, 6}
+    assert all(time > 0.0 for time in profile["times"].values())
+
+    report = io.StringIO()
+    stencil.profile_report(file=report)
+    assert "tmp = in_field[1, 0, 0] + in_field[-1, 0, 0]" in report.getvalue()
+    assert "out_field = 0.5 * tmp" in report.getvalue()
+
+    unprofiled = gtscript.stencil(backend="numpy", definition=stencil_def)
+    with pytest.raises(RuntimeError, match="profiling"):
+        unprofiled.profile_report()
+
+
+def test_perf_registry(tmp_path):
+    def stencil_def(
+        in_field: gtscript.Field[float], out_field: gtscript.Field[float]  # type: ignore  # noqa
+    ):
+        with computation(PARALLEL), interval(...):  # type: ignore  # noqa
+            out_field = in_field[1, 0, 0]  # noqa
+
+    stencil = gtscript.stencil(backend="numpy", definition=stencil_def)
+    in_field = gt_storage.ones("numpy", default_origin=(0, 0, 0), shape=(5, 3, 2), dtype=float)
+    out_field = gt_storage.zeros("numpy", default_origin=(0, 0, 0), shape=(5, 3, 2), dtype=float)
+    key = type(stencil).__name__
+
+    perf.reset()
+    stencil(in_field, out_field, domain=(4, 3, 2))
+    assert key not in perf.get_counters()
+
+    perf.enable()
+    try:
+        for _ in range(3):
+            stencil(in_field, out_field, domain=(4, 3, 2))
+    finally:
+        perf.disable()
+    stencil(in_field, out_field, domain=(4, 3, 2))
+
+    counters = perf.get_counters()[key]
+    assert counters["ncalls"] == 3
+    assert counters["backend"] == "numpy"
+    assert counters["last_domain"] == (4, 3, 2)
+    assert counters["total_points"] == 3 * 4 * 3 * 2
+    # in_field is read with an offset of 1 in I
+    assert counters["total_bytes"] == 3 * (5 * 3 * 2 + 4 * 3 * 2) * 8
+    assert 0.0 < counters["total_run_time"] <= counters["total_call_time"]
+    assert counters["min_call_time"] <= counters["max_call_time"]
+
+    perf.dump_json(str(tmp_path / "perf.json"))
+    with open(tmp_path / "perf.json") as f:
+        assert json.load(f)[key]["ncalls"] == 3
+    perf.dump_csv(str(tmp_path / "perf.csv"))
+    with open(tmp_path / "perf.csv") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["stencil"] for row in rows] == [key]
+    assert counters["name"] in perf.summary()
+
+    perf.reset()
+    assert perf.get_counters() == {}
+
+
+def test_trace(tmp_path):
+    def stencil_def(
+        in_field: gtscript.Field[float], out_field: gtscript.Field[float]  # type: ignore  # noqa
+    ):
+        with computation(PARALLEL), interval(...):  # type: ignore  # noqa
+            out_field = in_field[1, 0, 0]  # noqa
+
+    stencil = gtscript.stencil(backend="numpy", definition=stencil_def)
+    name = f"{stencil.options['module']}.{stencil.options['name']}"
+
+    timing.enable_trace()
+    try:
+        in_field = gt_storage.ones("numpy", default_origin=(0, 0, 0), shape=(5, 3, 2), dtype=float)
+        out_field = gt_storage.zeros(
+            "numpy", default_origin=(0, 0, 0), shape=(5, 3, 2), dtype=float
+        )
+        stencil(in_field, out_field, domain=(4, 3, 2))
+        timing.dump_trace(str(tmp_path / "trace.json"))
+    finally:
+        timing.disable_trace()
+    stencil(in_field, out_field, domain=(4, 3, 2))
+
+    with open(tmp_path / "trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    complete_events = {event["name"]: event for event in events if event["ph"] == "X"}
+    assert {"allocate_cpu", name, "validation", "run"} <= set(complete_events.keys())
+    assert complete_events["allocate_cpu"]["args"]["shape"] == [5, 3, 2]
+    assert complete_events[name]["args"]["domain"] == [4, 3, 2]
+    call, run = complete_events[name], complete_events["run"]
+    assert call["ts"] <= run["ts"] and run["ts"] + run["dur"] <= call["ts"] + call["dur"]
+    assert any(event["ph"] == "M" and event["name"] == "thread_name" for event in events)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
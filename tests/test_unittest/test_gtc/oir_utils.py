@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from typing import List, Optional
+
+from gtc.common import AxisBound, CartesianOffset, DataType, LoopOrder
+from gtc.oir import (
+    AssignStmt,
+    Decl,
+    Expr,
+    FieldAccess,
+    FieldDecl,
+    HorizontalExecution,
+    Interval,
+    Stencil,
+    Stmt,
+    Temporary,
+    VerticalLoop,
+)
+
+
+class FieldAccessBuilder:
+    def __init__(self, name) -> None:
+        self._name = name
+        self._offset = CartesianOffset.zero()
+        self._dtype = DataType.FLOAT32
+
+    def offset(self, offset: CartesianOffset) -> "FieldAccessBuilder":
+        self._offset = offset
+        return self
+
+    def dtype(self, dtype: DataType) -> "FieldAccessBuilder":
+        self._dtype = dtype
+        return self
+
+    def build(self) -> FieldAccess:
+        return FieldAccess(name=self._name, offset=self._offset, dtype=self._dtype)
+
+
+class AssignStmtBuilder:
+    def __init__(self, left_name=None, right_name=None) -> None:
+        self._left = FieldAccessBuilder(left_name).build() if left_name else None
+        self._right = FieldAccessBuilder(right_name).build() if right_name else None
+
+    def left(self, left: FieldAccess) -> "AssignStmtBuilder":
+        self._left = left
+        return self
+
+    def right(self, right: Expr) -> "AssignStmtBuilder":
+        self._right = right
+        return self
+
+    def build(self) -> AssignStmt:
+        return AssignStmt(left=self._left, right=self._right)
+
+
+class HorizontalExecutionBuilder:
+    def __init__(self) -> None:
+        self._body: List[Stmt] = []
+        self._mask: Optional[Expr] = None
+
+    def add_stmt(self, stmt: Stmt) -> "HorizontalExecutionBuilder":
+        self._body.append(stmt)
+        return self
+
+    def mask(self, mask: Expr) -> "HorizontalExecutionBuilder":
+        self._mask = mask
+        return self
+
+    def build(self) -> HorizontalExecution:
+        return HorizontalExecution(body=self._body, mask=self._mask)
+
+
+class VerticalLoopBuilder:
+    def __init__(self) -> None:
+        self._interval = Interval(start=AxisBound.start(), end=AxisBound.end())
+        self._loop_order = LoopOrder.PARALLEL
+        self._declarations: List[Temporary] = []
+        self._horizontal_executions: List[HorizontalExecution] = []
+
+    def loop_order(self, loop_order: LoopOrder) -> "VerticalLoopBuilder":
+        self._loop_order = loop_order
+        return self
+
+    def add_declaration(
+        self, name: str, dtype: DataType = DataType.FLOAT32
+    ) -> "VerticalLoopBuilder":
+        self._declarations.append(Temporary(name=name, dtype=dtype))
+        return self
+
+    def add_horizontal_execution(
+        self, horizontal_execution: HorizontalExecution
+    ) -> "VerticalLoopBuilder":
+        self._horizontal_executions.append(horizontal_execution)
+        return self
+
+    def build(self) -> VerticalLoop:
+        return VerticalLoop(
+            interval=self._interval,
+            loop_order=self._loop_order,
+            declarations=self._declarations,
+            horizontal_executions=self._horizontal_executions,
+        )
+
+
+class StencilBuilder:
+    def __init__(self, name="foo") -> None:
+        self._name = name
+        self._params: List[Decl] = []
+        self._vertical_loops: List[VerticalLoop] = []
+
+    def add_param(self, param: Decl) -> "StencilBuilder":
+        self._params.append(param)
+        return self
+
+    def add_field_param(self, name: str, dtype: DataType = DataType.FLOAT32) -> "StencilBuilder":
+        return self.add_param(FieldDecl(name=name, dtype=dtype))
+
+    def add_vertical_loop(self, vertical_loop: VerticalLoop) -> "StencilBuilder":
+        self._vertical_loops.append(vertical_loop)
+        return self
+
+    def build(self) -> Stencil:
+        return Stencil(
+            name=self._name,
+            params=self._params,
+            vertical_loops=self._vertical_loops,
+        )
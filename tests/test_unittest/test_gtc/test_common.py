@@ -327,6 +327,39 @@ def test_symbolref_validation_for_valid_tree():
     )
 
 
+def test_trusted_construction_propagates_dtype():
+    with eve.trusted_construction():
+        node = BinaryOp(
+            op=ComparisonOperator.LT,
+            left=DummyExpr(dtype=FLOAT_TYPE),
+            right=DummyExpr(dtype=FLOAT_TYPE),
+        )
+    assert node.dtype == DataType.BOOL
+    assert node.kind == ExprKind.FIELD
+
+
+def test_trusted_construction_skips_subtree_validation():
+    with eve.trusted_construction():
+        SymbolTableRootNode(nodes=[SymbolRefChildNode(name="foo")])
+
+        with eve.full_validation(), pytest.raises(ValidationError, match=r"Symbols.*not found"):
+            SymbolTableRootNode(nodes=[SymbolRefChildNode(name="foo")])
+
+
+def test_lazy_symbol_table():
+    inner = AnotherSymbolTable(nodes=[SymbolChildNode(name="inner_scope")])
+    root = SymbolTableRootNode(nodes=[SymbolChildNode(name="foo"), inner])
+    assert set(root.symtable_.keys()) == {"foo"}
+    assert set(inner.symtable_.keys()) == {"inner_scope"}
+
+    root.nodes = [SymbolChildNode(name="bar")]
+    assert set(root.symtable_.keys()) == {"bar"}
+
+    updated = root.copy(update={"nodes": [SymbolChildNode(name="baz")]})
+    assert set(updated.symtable_.keys()) == {"baz"}
+    assert set(root.symtable_.keys()) == {"bar"}
+
+
 # For pydantic, nodes are the same (convertible to each other) if all fields are same.
 # For checking, we need to make the Expr categories clearly different.
 # This behavior will most likely change in Eve in the future
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import numpy as np
+import pytest
+
+from gtc import oir
+from gtc.common import ArithmeticOperator, CartesianOffset, ComparisonOperator, DataType, LoopOrder
+from gtc.numpy.numpy_codegen import NumpyCodegen, compute_extents
+
+from .oir_utils import (
+    AssignStmtBuilder,
+    FieldAccessBuilder,
+    HorizontalExecutionBuilder,
+    StencilBuilder,
+    VerticalLoopBuilder,
+)
+
+
+def _run(stencil: oir.Stencil, domain, origin, **fields):
+    namespace = {}
+    exec(NumpyCodegen.apply(stencil), namespace)
+    namespace["run_computation"](domain, {name: origin for name in fields}, **fields)
+
+
+def _shifted(name: str, i: int = 0, j: int = 0, k: int = 0) -> oir.FieldAccess:
+    return FieldAccessBuilder(name).offset(CartesianOffset(i=i, j=j, k=k)).build()
+
+
+def _smoothing_stencil() -> oir.Stencil:
+    return (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(
+                    AssignStmtBuilder()
+                    .left(FieldAccessBuilder("tmp").build())
+                    .right(_shifted("in_field", i=1))
+                    .build()
+                )
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(
+                    AssignStmtBuilder()
+                    .left(FieldAccessBuilder("out_field").build())
+                    .right(
+                        oir.BinaryOp(
+                            op=ArithmeticOperator.ADD,
+                            left=_shifted("tmp", i=-1),
+                            right=_shifted("tmp", j=1),
+                        )
+                    )
+                    .build()
+                )
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+
+
+def test_extents():
+    field_extents, horizontal_extents = compute_extents(_smoothing_stencil())
+
+    assert horizontal_extents == [[((-1, 0), (0, 1)), ((0, 0), (0, 0))]]
+    assert field_extents["tmp"] == ((-1, 0), (0, 1), (0, 0))
+    assert field_extents["in_field"] == ((0, 1), (0, 1), (0, 0))
+    assert field_extents["out_field"] == ((0, 0), (0, 0), (0, 0))
+
+
+def test_parallel_horizontal_offsets():
+    in_field = np.random.rand(7, 7, 4).astype(np.float32)
+    out_field = np.zeros_like(in_field)
+
+    _run(_smoothing_stencil(), (5, 5, 4), (1, 1, 0), in_field=in_field, out_field=out_field)
+
+    expected = in_field[1:6, 1:6, :] + in_field[2:7, 2:7, :]
+    np.testing.assert_allclose(out_field[1:6, 1:6, :], expected)
+
+
+@pytest.mark.parametrize("loop_order", [LoopOrder.FORWARD, LoopOrder.BACKWARD])
+def test_sequential_vertical_loop(loop_order):
+    k_offset = -1 if loop_order == LoopOrder.FORWARD else 1
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .loop_order(loop_order)
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(
+                    AssignStmtBuilder()
+                    .left(FieldAccessBuilder("out_field").build())
+                    .right(
+                        oir.BinaryOp(
+                            op=ArithmeticOperator.ADD,
+                            left=_shifted("out_field", k=k_offset),
+                            right=FieldAccessBuilder("in_field").build(),
+                        )
+                    )
+                    .build()
+                )
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+    in_field = np.ones((3, 3, 6), dtype=np.float32)
+    out_field = np.zeros_like(in_field)
+
+    _run(testee, (3, 3, 4), (0, 0, 1), in_field=in_field, out_field=out_field)
+
+    expected = np.arange(1, 5, dtype=np.float32)
+    if loop_order == LoopOrder.BACKWARD:
+        expected = expected[::-1]
+    np.testing.assert_allclose(out_field[:, :, 1:5], np.broadcast_to(expected, (3, 3, 4)))
+
+
+def test_masked_horizontal_execution():
+    mask_access = FieldAccessBuilder("mask").dtype(DataType.BOOL).build()
+    zero = oir.Literal(value="0.0", dtype=DataType.FLOAT32)
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("mask", DataType.BOOL)
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(
+                    AssignStmtBuilder()
+                    .left(mask_access)
+                    .right(
+                        oir.BinaryOp(
+                            op=ComparisonOperator.GT,
+                            left=FieldAccessBuilder("in_field").build(),
+                            right=zero,
+                        )
+                    )
+                    .build()
+                )
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "in_field").build())
+                .mask(mask_access)
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+    in_field = np.random.randn(4, 4, 3).astype(np.float32)
+    out_field = np.zeros_like(in_field)
+
+    _run(testee, (4, 4, 3), (0, 0, 0), in_field=in_field, out_field=out_field)
+
+    np.testing.assert_allclose(out_field, np.where(in_field > 0.0, in_field, 0.0))
+
+
+def test_chained_forwarded_temporaries():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp1")
+            .add_declaration("tmp2")
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("tmp1", "in_field").build())
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("tmp2", "tmp1").build())
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "tmp2").build())
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+    in_field = np.random.rand(3, 3, 3).astype(np.float32)
+    out_field = np.zeros_like(in_field)
+
+    _run(testee, (3, 3, 3), (0, 0, 0), in_field=in_field, out_field=out_field)
+
+    np.testing.assert_allclose(out_field, in_field)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+# GTC Toolchain - GT4Py Project - GridTools Framework
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part of the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+from gtc import oir
+from gtc.common import (
+    BuiltInLiteral,
+    CartesianOffset,
+    DataType,
+    LogicalOperator,
+    LoopOrder,
+    UnaryOperator,
+)
+from gtc.passes.oir_dead_code_elimination import dead_code_elimination
+
+from .oir_utils import (
+    AssignStmtBuilder,
+    FieldAccessBuilder,
+    HorizontalExecutionBuilder,
+    StencilBuilder,
+    VerticalLoopBuilder,
+)
+
+
+def _assign(left: str, right: str) -> oir.HorizontalExecution:
+    return HorizontalExecutionBuilder().add_stmt(AssignStmtBuilder(left, right).build()).build()
+
+
+def _written_names(stencil: oir.Stencil):
+    return [
+        [stmt.left.name for he in loop.horizontal_executions for stmt in he.body]
+        for loop in stencil.vertical_loops
+    ]
+
+
+def test_live_temporary_is_kept():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .add_horizontal_execution(_assign("out_field", "tmp"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["tmp", "out_field"]]
+    assert [decl.name for decl in result.vertical_loops[0].declarations] == ["tmp"]
+
+
+def test_dead_temporary_is_removed():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_declaration("dead")
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .add_horizontal_execution(_assign("dead", "tmp"))
+            .add_horizontal_execution(_assign("out_field", "in_field"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["out_field"]]
+    assert result.vertical_loops[0].declarations == []
+
+
+def test_dead_statement_in_live_horizontal_execution_is_removed():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("dead")
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("dead", "in_field").build())
+                .add_stmt(AssignStmtBuilder("out_field", "in_field").build())
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["out_field"]]
+
+
+def test_write_after_last_read_is_removed():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .add_horizontal_execution(_assign("out_field", "tmp"))
+            .add_horizontal_execution(_assign("tmp", "out_field"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["tmp", "out_field"]]
+
+
+def test_sequential_loop_carried_dependency_is_kept():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .loop_order(LoopOrder.FORWARD)
+            .add_declaration("tmp")
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(
+                    AssignStmtBuilder()
+                    .left(FieldAccessBuilder("out_field").build())
+                    .right(
+                        FieldAccessBuilder("tmp").offset(CartesianOffset(i=0, j=0, k=-1)).build()
+                    )
+                    .build()
+                )
+                .build()
+            )
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["out_field", "tmp"]]
+
+
+def test_empty_vertical_loop_is_removed_and_declarations_are_kept():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_declaration("dead")
+            .add_horizontal_execution(_assign("dead", "in_field"))
+            .build()
+        )
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .add_horizontal_execution(_assign("out_field", "tmp"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert len(result.vertical_loops) == 1
+    assert _written_names(result) == [["tmp", "out_field"]]
+    assert [decl.name for decl in result.vertical_loops[0].declarations] == ["tmp"]
+
+
+def test_constant_mask_is_folded():
+    true_mask = oir.Literal(value=BuiltInLiteral.TRUE, dtype=DataType.BOOL)
+    mask_access = FieldAccessBuilder("mask").dtype(DataType.BOOL).build()
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("mask", DataType.BOOL)
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder().left(mask_access).right(true_mask).build())
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "in_field").build())
+                .mask(mask_access)
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "out_field").build())
+                .mask(oir.UnaryOp(op=UnaryOperator.NOT, expr=mask_access))
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["out_field"]]
+    assert result.vertical_loops[0].horizontal_executions[0].mask is None
+    assert result.vertical_loops[0].declarations == []
+
+
+def test_constant_mask_in_logical_operators_is_folded():
+    false_mask = oir.Literal(value=BuiltInLiteral.FALSE, dtype=DataType.BOOL)
+    mask_access = FieldAccessBuilder("mask").dtype(DataType.BOOL).build()
+    cond_access = FieldAccessBuilder("cond").dtype(DataType.BOOL).build()
+    testee = (
+        StencilBuilder()
+        .add_field_param("cond", DataType.BOOL)
+        .add_field_param("in_field")
+        .add_field_param("out_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("mask", DataType.BOOL)
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder().left(mask_access).right(false_mask).build())
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "in_field").build())
+                .mask(oir.BinaryOp(op=LogicalOperator.OR, left=mask_access, right=cond_access))
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "out_field").build())
+                .mask(
+                    oir.BinaryOp(
+                        op=LogicalOperator.OR,
+                        left=oir.UnaryOp(op=UnaryOperator.NOT, expr=mask_access),
+                        right=cond_access,
+                    )
+                )
+                .build()
+            )
+            .add_horizontal_execution(
+                HorizontalExecutionBuilder()
+                .add_stmt(AssignStmtBuilder("out_field", "in_field").build())
+                .mask(oir.BinaryOp(op=LogicalOperator.AND, left=mask_access, right=cond_access))
+                .build()
+            )
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert _written_names(result) == [["out_field", "out_field"]]
+    assert result.vertical_loops[0].horizontal_executions[0].mask == cond_access
+    assert result.vertical_loops[0].horizontal_executions[1].mask is None
+    assert result.vertical_loops[0].declarations == []
+
+
+def test_all_dead_removes_all_loops():
+    testee = (
+        StencilBuilder()
+        .add_field_param("in_field")
+        .add_vertical_loop(
+            VerticalLoopBuilder()
+            .add_declaration("tmp")
+            .add_horizontal_execution(_assign("tmp", "in_field"))
+            .build()
+        )
+        .build()
+    )
+
+    result = dead_code_elimination(testee)
+
+    assert result.vertical_loops == []
@@ -553,6 +553,45 @@ class TestExternalsWithSubroutines:
             )
 
 
+class TestFunctionASTCache:
+    def test_shared_function(self, id_version):
+        @gtscript.function
+        def _scale(phi):
+            from __externals__ import SCALE
+
+            return SCALE * phi
+
+        @gtscript.function
+        def _scaled_sum(a, b):
+            return _scale(a) + _scale(b)
+
+        def definition_func(in_a: gtscript.Field[np.float64], out_a: gtscript.Field[np.float64]):
+            with computation(PARALLEL), interval(...):
+                out_a = _scaled_sum(in_a, in_a[1, 0, 0])  # noqa: F841
+
+        module = f"TestFunctionASTCache_test_shared_function_{id_version}"
+        _, first_ir = compile_definition(definition_func, "first", module, externals={"SCALE": 2.0})
+        first_ast = _scale._gtscript_["ast"]
+        first_inlined_ast = gt_frontend.CallInliner.get_inlined_function_ast(_scaled_sum._gtscript_)
+
+        # same function and same values: prepared ASTs are reused
+        compile_definition(definition_func, "second", module, externals={"SCALE": 2.0})
+        assert _scale._gtscript_["ast"] is first_ast
+        assert (
+            gt_frontend.CallInliner.get_inlined_function_ast(_scaled_sum._gtscript_)
+            is first_inlined_ast
+        )
+
+        # different external values: functions are prepared again
+        _, third_ir = compile_definition(definition_func, "third", module, externals={"SCALE": 3.0})
+        assert _scale._gtscript_["ast"] is not first_ast
+        assert (
+            gt_frontend.CallInliner.get_inlined_function_ast(_scaled_sum._gtscript_)
+            is not first_inlined_ast
+        )
+        assert first_ir.computations != third_ir.computations
+
+
 class TestFunctionReturn:
     def test_no_return(self, id_version):
         @gtscript.function
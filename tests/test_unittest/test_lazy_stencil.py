@@ -16,6 +16,8 @@
 
 """Test the backend-agnostic build system."""
 
+import sys
+
 import pytest
 
 import gt4py
@@ -113,3 +115,124 @@ def test_lazy_call(frontend, backend):
     )
     lazy_s(b, a)
     assert b[0, 0, 0] == 1.0
+
+
+def test_background_build():
+    """Test that background builds are started by the decorator and awaited on first call."""
+    import numpy
+
+    stencils = [
+        gt4py.gtscript.lazy_stencil(
+            backend="numpy",
+            definition=copy_stencil_definition,
+            name=f"copy_{i}",
+            background=True,
+        )
+        for i in range(3)
+    ]
+    gt4py.wait_all()
+    assert all(stencil.is_built for stencil in stencils)
+
+    a = gt4py.storage.from_array(numpy.array([[[1.0]]]), default_origin=(0, 0, 0), backend="numpy")
+    b = gt4py.storage.from_array(numpy.array([[[0.0]]]), default_origin=(0, 0, 0), backend="numpy")
+    stencils[0](b, a)
+    assert b[0, 0, 0] == 1.0
+
+
+@gt4py.gtscript.function
+def scale_function(field):
+    from __externals__ import SCALE
+
+    return field * SCALE
+
+
+def make_scale_stencil_definition():
+    def scale_stencil_definition(out_f: Field[float], in_f: Field[float]):  # type: ignore
+        with computation(PARALLEL), interval(...):  # type: ignore
+            out_f = scale_function(in_f)  # noqa: F841
+
+    return scale_stencil_definition
+
+
+def test_background_build_shared_function(monkeypatch):
+    """Test concurrent builds of definitions sharing a function with different externals."""
+    import numpy
+
+    monkeypatch.setitem(gt4py.config.build_settings, "parallel_jobs", 8)
+    monkeypatch.setattr(gt4py.lazy_stencil, "_executor", None)
+
+    # Switch threads very often to expose races between the builds
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        stencils = [
+            gt4py.gtscript.lazy_stencil(
+                backend="numpy",
+                definition=make_scale_stencil_definition(),
+                name=f"scale_{i}",
+                externals={"SCALE": float(i)},
+                rebuild=True,
+                check_syntax=False,
+                background=True,
+            )
+            for i in range(16)
+        ]
+        gt4py.wait_all()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    a = gt4py.storage.from_array(numpy.array([[[1.0]]]), default_origin=(0, 0, 0), backend="numpy")
+    b = gt4py.storage.from_array(numpy.array([[[0.0]]]), default_origin=(0, 0, 0), backend="numpy")
+    for i, stencil in enumerate(stencils):
+        stencil(b, a)
+        assert b[0, 0, 0] == float(i)
+
+
+def test_build_async():
+    """Test awaiting a stencil build."""
+    import asyncio
+
+    lazy_s = LazyStencil(
+        StencilBuilder(copy_stencil_definition, backend=gt4py.backend.from_name("numpy"))
+    )
+    assert not lazy_s.is_built
+
+    async def build():
+        return await lazy_s.build_async()
+
+    assert asyncio.run(build()) is lazy_s.implementation
+    assert lazy_s.is_built
+
+
+def test_background_build_error():
+    """Test that errors of background builds are raised when waiting and when calling."""
+    lazy_s = gt4py.gtscript.lazy_stencil(
+        backend="numpy", definition=wrong_syntax_stencil_definition, background=True
+    )
+    with pytest.raises(GTScriptDefinitionError):
+        gt4py.wait_all()
+    assert not lazy_s.is_built
+    with pytest.raises(GTScriptDefinitionError):
+        lazy_s.implementation
+
+
+def test_background_build_error_order(monkeypatch):
+    """Test that waiting raises the error of the first submitted build, not the first to fail."""
+    import threading
+
+    monkeypatch.setitem(gt4py.config.build_settings, "parallel_jobs", 2)
+    monkeypatch.setattr(gt4py.lazy_stencil, "_executor", None)
+    second_failed = threading.Event()
+
+    def first_build():
+        second_failed.wait(timeout=10)
+        raise ValueError("first")
+
+    def second_build():
+        second_failed.set()
+        raise KeyError("second")
+
+    gt4py.lazy_stencil._submit_build(first_build)
+    gt4py.lazy_stencil._submit_build(second_build)
+    with pytest.raises(ValueError, match="first"):
+        gt4py.wait_all()
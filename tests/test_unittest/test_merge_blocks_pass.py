@@ -14,6 +14,8 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import math
+import time
 from collections import namedtuple
 from typing import List, Tuple
 
@@ -26,6 +28,12 @@ from gt4py.analysis import (
     StatementInfo,
     TransformData,
 )
+from gt4py.analysis.passes import (
+    ComputeExtentsPass,
+    InitInfoPass,
+    MergeBlocksPass,
+    NormalizeBlocksPass,
+)
 from gt4py.ir.nodes import Axis, Domain, IterationOrder
 
 from ..analysis_setup import AnalysisPass
@@ -430,3 +438,129 @@ def test_split_preordered(merge_blocks_pass: AnalysisPass, ijk_domain: Domain) -
     # second multi stage contain]s statement 2
     assert statement_pos[2].multi_stage == 1
     assert statement_pos[2].statements == 0
+
+
+def _make_synthetic_definition(n_statements: int, domain: Domain) -> TDefinition:
+    """
+    Chain `n_statements` assignments over computation blocks of 10 statements.
+
+    Horizontal and vertical offsets, writes to an API field and reads of it after writes
+    are interleaved at different periods to produce stages and multi-stages of varied sizes.
+    """
+    orders = [IterationOrder.PARALLEL, IterationOrder.FORWARD, IterationOrder.BACKWARD]
+    blocks = []
+    source = "in"
+    for start in range(0, n_statements, 10):
+        order = orders[(start // 10) % len(orders)]
+        statements = []
+        for i in range(start, min(n_statements, start + 10)):
+            offset = (0, 0, 0)
+            if i % 7 == 3:
+                offset = (1, 0, 0)
+            elif i % 11 == 5:
+                offset = (0, -1, 0)
+            elif i % 13 == 6 and order != IterationOrder.PARALLEL:
+                offset = (0, 0, -1)
+            target = "inout" if i % 17 == 16 else f"tmp_{i}"
+            statements.append(TAssign(target, source, offset))
+            source = "inout" if i % 19 == 9 else target
+        blocks.append(TComputationBlock(order=order).add_statements(*statements))
+    blocks.append(
+        TComputationBlock(order=IterationOrder.PARALLEL).add_statements(
+            TAssign("out", source, (0, 0, 0))
+        )
+    )
+    return TDefinition(
+        name=f"synthetic_{n_statements}", domain=domain, fields=["out", "in", "inout"]
+    ).add_blocks(*blocks)
+
+
+def test_merge_synthetic_stencil(merge_blocks_pass: AnalysisPass, ijk_domain: Domain) -> None:
+    """Merged blocks and field extents of a larger stencil, as computed before optimizing the pass."""
+    transform_data = merge_blocks_pass(_make_synthetic_definition(40, ijk_domain).build_transform())
+    blocks = [
+        (
+            block.iteration_order,
+            [
+                (sorted(ij_block.outputs), tuple(ij_block.compute_extent))
+                for ij_block in block.ij_blocks
+            ],
+        )
+        for block in transform_data.blocks
+    ]
+    PARALLEL, FORWARD, BACKWARD = (
+        IterationOrder.PARALLEL,
+        IterationOrder.FORWARD,
+        IterationOrder.BACKWARD,
+    )
+    zero, i_1, i_2 = (0, 0), (0, 1), (0, 2)
+    j_1, j_2 = (-1, 0), (-2, 0)
+    assert blocks == [
+        (
+            PARALLEL,
+            [
+                ([f"tmp_{i}" for i in range(0, 3)], (i_1, j_1, zero)),
+                ([f"tmp_{i}" for i in range(3, 5)], (zero, j_1, zero)),
+                ([f"tmp_{i}" for i in range(5, 10)], (zero, zero, zero)),
+            ],
+        ),
+        (FORWARD, [([f"tmp_{i}" for i in range(10, 16)], (i_2, j_2, zero))]),
+        (
+            FORWARD,
+            [
+                (["inout"], (i_2, j_1, zero)),
+                (["tmp_17", "tmp_18"], (i_1, j_1, zero)),
+                (["tmp_19"], (i_1, j_1, zero)),
+            ],
+        ),
+        (
+            BACKWARD,
+            [
+                ([f"tmp_{i}" for i in range(20, 24)], (i_1, j_1, zero)),
+                ([f"tmp_{i}" for i in range(24, 27)], (zero, j_1, zero)),
+                (["tmp_27", "tmp_28"], (zero, zero, zero)),
+                (["tmp_29"], (i_2, zero, zero)),
+            ],
+        ),
+        (
+            PARALLEL,
+            [
+                (["tmp_30"], (i_2, zero, zero)),
+                (
+                    ["inout", "tmp_31", "tmp_32", "tmp_34", "tmp_35", "tmp_36", "tmp_37"],
+                    (i_1, zero, zero),
+                ),
+                (["out", "tmp_38", "tmp_39"], (zero, zero, zero)),
+            ],
+        ),
+    ]
+
+    fields_extents = transform_data.implementation_ir.fields_extents
+    assert tuple(fields_extents["in"]) == (i_1, j_1, zero)
+    assert tuple(fields_extents["inout"]) == ((0, 3), j_2, zero)
+    assert tuple(fields_extents["out"]) == (zero, zero, zero)
+    # temporaries are only accessed within the compute extent of the stage writing them
+    for _, stages in blocks:
+        for outputs, compute_extent in stages:
+            for name in outputs:
+                if name.startswith("tmp_"):
+                    assert tuple(fields_extents[name]) == compute_extent
+
+
+def test_merge_blocks_scaling(ijk_domain: Domain) -> None:
+    """Coarse check that extent computation and block merging scale about linearly in size."""
+
+    def analysis_time(n_statements: int) -> float:
+        best = math.inf
+        for _ in range(3):
+            transform_data = _make_synthetic_definition(n_statements, ijk_domain).build_transform()
+            InitInfoPass.apply(transform_data)
+            NormalizeBlocksPass.apply(transform_data)
+            start = time.perf_counter()
+            ComputeExtentsPass.apply(transform_data)
+            MergeBlocksPass.apply(transform_data)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    # 8 times more statements: 8x for a linear, 64x for a quadratic cost
+    assert analysis_time(1600) < 24 * analysis_time(200)
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+#
+# GT4Py - GridTools4Py - GridTools for Python
+#
+# Copyright (c) 2014-2021, ETH Zurich
+# All rights reserved.
+#
+# This file is part the GT4Py project and the GridTools framework.
+# GT4Py is free software: you can redistribute it and/or modify it under
+# the terms of the GNU General Public License as published by the
+# Free Software Foundation, either version 3 of the License, or any later
+# version. See the LICENSE.txt file at the top-level directory of this
+# distribution for a copy of the license or check <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+
+import pytest
+
+import gt4py
+from gt4py import gtscript
+from gt4py.analysis.metrics import compute_metrics, evaluate_cost, evaluate_metrics
+from gt4py.gtscript import FORWARD, PARALLEL, Field, computation, interval
+from gt4py.stencil_builder import StencilBuilder
+
+
+# mypy gets confused by gtscript
+def stencil_def(a: Field[float], b: Field[float], c: Field[float], *, w: float):  # type: ignore
+    with computation(PARALLEL), interval(...):  # type: ignore
+        tmp = (a[1, 0, 0] + a[-1, 0, 0]) * w  # type: ignore
+        if tmp > 0.0:
+            b = tmp[-1, 0, 0] - 1.0  # noqa - unused var is in/out field
+        else:
+            b = -tmp  # noqa - unused var is in/out field
+    with computation(FORWARD), interval(1, None):  # type: ignore
+        c = c[0, 0, -1] + sqrt(b)  # type: ignore  # noqa
+
+
+def test_evaluate_cost():
+    terms = [(2, 1, 0, 1, -1), (3, -5, 0, 0, 1)]
+    assert evaluate_cost(terms, (4, 5, 6)) == 2 * 5 * 5 * 5
+    assert evaluate_cost([], (4, 5, 6)) == 0
+
+
+def test_compute_metrics():
+    builder = StencilBuilder(stencil_def, backend=gt4py.backend.from_name("numpy"))
+    metrics = compute_metrics(builder.implementation_ir)
+
+    # 'a' is read in the extended compute domain of 'tmp'; 'b' and 'c' in the domain
+    assert metrics["bytes_read"] == [(16, 0, 0, 1, 0), (8, 3, 0, 1, 0)]
+    assert metrics["bytes_written"] == [(16, 0, 0, 1, 0)]
+    # 'tmp': 2 ops in the extended domain, 'b': 1 op (either branch), 'c': 2 ops in nk - 1
+    assert metrics["flops"] == [(2, 0, 0, 1, -1), (1, 0, 0, 1, 0), (2, 1, 0, 1, 0)]
+
+    assert evaluate_metrics(metrics, (6, 6, 10)) == {
+        "bytes_read": 8 * (2 * 6 * 6 * 10 + 9 * 6 * 10),
+        "bytes_written": 8 * 2 * 6 * 6 * 10,
+        "flops": 2 * 6 * 6 * 9 + 6 * 6 * 10 + 2 * 7 * 6 * 10,
+    }
+
+
+@pytest.mark.parametrize("backend", ["debug", "numpy", "gtc:numpy"])
+def test_stencil_metrics(backend):
+    stencil = gtscript.stencil(backend=backend, definition=stencil_def)
+    builder = StencilBuilder(stencil_def, backend=gt4py.backend.from_name("numpy"))
+    expected = evaluate_metrics(compute_metrics(builder.implementation_ir), (3, 4, 5))
+
+    assert stencil.metrics((3, 4, 5)) == expected
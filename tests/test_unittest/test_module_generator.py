@@ -16,6 +16,8 @@
 
 import pytest
 
+from eve import codegen
+from gt4py import utils as gt_utils
 from gt4py.backend.base import BaseModuleGenerator
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
@@ -59,3 +61,40 @@ def test_initialized_builder(sample_builder, sample_args_data):
 
     source = generator(args_data=sample_args_data)
     assert source
+
+
+def test_format_source_option(sample_args_data):
+    build_info = {}
+    builder = StencilBuilder(sample_stencil).with_changed_options(build_info=build_info)
+
+    # formatting is disabled by default
+    source = SampleModuleGenerator(builder)(args_data=sample_args_data)
+    compile(source, "<generated>", "exec")
+    assert "format_source" not in build_info.get("phases", {})
+
+    builder.with_changed_options(format_source=True, build_info=build_info)
+    formatted_source = SampleModuleGenerator(builder)(args_data=sample_args_data)
+    assert formatted_source == gt_utils.text.format_source(
+        formatted_source, line_length=SampleModuleGenerator.SOURCE_LINE_LENGTH
+    )
+    assert build_info["phases"]["format_source"]["calls"] == 1
+
+
+def test_format_source_cache(monkeypatch):
+    formatted = []
+    python_formatter = codegen.SOURCE_FORMATTERS["python"]
+
+    def counting_formatter(source, **kwargs):
+        formatted.append(source)
+        return python_formatter(source, **kwargs)
+
+    monkeypatch.setitem(codegen.SOURCE_FORMATTERS, "python", counting_formatter)
+    source = f"value  =  {id(formatted)}\n"
+
+    assert gt_utils.text.format_source(source, line_length=100) == f"value = {id(formatted)}\n"
+    assert gt_utils.text.format_source(source, line_length=100) == f"value = {id(formatted)}\n"
+    assert len(formatted) == 1
+
+    # different formatter options are cached separately
+    gt_utils.text.format_source(source, line_length=80)
+    assert len(formatted) == 2
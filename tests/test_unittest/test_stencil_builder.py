@@ -14,8 +14,11 @@
 #
 # SPDX-License-Identifier: GPL-3.0-or-later
 
+import json
+
 import numpy
 
+from gt4py import utils as gt_utils
 from gt4py.gtscript import PARALLEL, Field, computation, interval
 from gt4py.stencil_builder import StencilBuilder
 from gt4py.stencil_object import StencilObject
@@ -124,3 +127,42 @@ def test_regression_run_analysis_twice(tmp_path):
     ir = builder.implementation_ir
     # this raises an error if the analysis pipeline is reevaluated:
     assert ir is builder.implementation_ir
+
+
+def test_build_phases(tmp_path):
+    build_info = {}
+    builder = (
+        StencilBuilder(simple_stencil)
+        .with_backend("gtc:numpy")
+        .with_externals({"a": 1.0})
+        .with_caching("nocaching", output_path=tmp_path)
+        .with_options(name="simple_stencil", module="", rebuild=True, build_info=build_info)
+    )
+
+    gt_utils.timing.enable_trace()
+    try:
+        builder.build()
+        trace_path = tmp_path / "trace.json"
+        gt_utils.timing.dump_trace(str(trace_path))
+    finally:
+        gt_utils.timing.disable_trace()
+
+    phases = build_info["phases"]
+    for name in [
+        "build",
+        "frontend",
+        "lowering.defir_to_gtir",
+        "lowering.gtir_to_oir",
+        "codegen",
+        "codegen.computation",
+        "module_load",
+    ]:
+        assert phases[name]["time"] >= 0.0
+        assert phases[name]["calls"] >= 1
+    assert phases["codegen"]["size"] > phases["codegen.computation"]["size"] > 0
+    assert phases["build"]["time"] >= phases["frontend"]["time"]
+
+    trace = json.loads(trace_path.read_text())
+    event_names = {event["name"] for event in trace["traceEvents"]}
+    assert set(phases.keys()) <= event_names
+    assert all(event["ph"] in ("X", "M") for event in trace["traceEvents"])